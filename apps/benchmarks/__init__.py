@@ -0,0 +1,5 @@
+# X-Seti - October16 2026 - IMG Factory 1.5 - Benchmarks Package Init
+# this belongs in apps/benchmarks/__init__.py - version 1
+"""
+Benchmarks package - Synthetic IMG archives and timings for the core archive paths
+"""
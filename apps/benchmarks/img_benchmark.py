@@ -0,0 +1,416 @@
+#this belongs in benchmarks/img_benchmark.py - Version: 5
+# X-Seti - October16 2026 - IMG Factory 1.5 - IMG Core Benchmark
+
+"""
+IMG Core Benchmark - Times the IMGFile archive paths on synthetic archives.
+Stages: open, open_indexed, parse_entries (_parse_all_entries), populate_table, extract_all,
+add_many, remove, rebuild_safe and rebuild_fast, on VER1 and VER2 archives of
+1k/10k/100k entries. Each stage that changes the archive works on a fresh copy.
+Results are written as JSON; --compare checks them against an earlier run.
+
+Run: python launch_img_benchmark.py --sizes 1000,10000 --output results.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import argparse
+import platform
+import statistics
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable
+
+from apps.benchmarks.synthetic_archives import create_synthetic_archive
+from apps.methods.library_output import library_output
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    HAS_QT = True
+except ImportError:
+    HAS_QT = False
+
+##Methods list -
+# build_parser
+# compare_results
+# main
+# run_benchmarks
+# stage_add_many
+# stage_extract_all
+# stage_open
+# stage_open_indexed
+# stage_parse_entries
+# stage_populate_table
+# stage_rebuild_fast
+# stage_rebuild_safe
+# stage_remove
+# _archive_copy
+# _fragmented_copy
+# _open_archive
+# _quiet
+# _time_stage
+
+RESULTS_FORMAT = 1
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_VERSIONS = ("VER1", "VER2")
+CHANGE_FRACTION = 0.10   # Share of entries added / removed by the mutating stages
+
+_verbose = False
+
+
+def _quiet(): #vers 2
+    """Hide library [DEBUG] prints unless --verbose (printing would dominate the timings)"""
+    return library_output(_verbose)
+
+
+def _archive_copy(path: str, folder: str) -> str: #vers 1
+    """Fresh copy of an archive (and its .dir) for a stage that modifies it"""
+    target = os.path.join(folder, "work_" + os.path.basename(path))
+    shutil.copyfile(path, target)
+    dir_path = path[:-4] + '.dir'
+    if os.path.exists(dir_path):
+        shutil.copyfile(dir_path, target[:-4] + '.dir')
+    return target
+
+
+def _open_archive(path: str): #vers 1
+    """Open an archive for stage setup (not timed)"""
+    from apps.methods.img_core_classes import IMGFile
+    img_file = IMGFile(path)
+    with _quiet():
+        if not img_file.open():
+            raise RuntimeError(f"could not open {path}")
+    return img_file
+
+
+def stage_open(path: str, workdir: str) -> Callable[[], Any]: #vers 2
+    """Open: version detection, directory read, entry objects, type/RW parsing"""
+    from apps.methods.img_core_classes import IMGFile
+
+    def run():
+        img_file = IMGFile(path)
+        img_file.use_index_cache = False
+        if not img_file.open():
+            raise RuntimeError(f"could not open {path}")
+        img_file.close()
+    return run
+
+
+def stage_open_indexed(path: str, workdir: str) -> Callable[[], Any]: #vers 1
+    """Reopen of an unchanged archive - types and RW versions from the .imgidx sidecar"""
+    from apps.methods.img_core_classes import IMGFile
+    _open_archive(path).close()   # writes the index
+
+    def run():
+        img_file = IMGFile(path)
+        if not img_file.open() or not img_file.index_loaded:
+            raise RuntimeError(f"could not open {path} from its index")
+        img_file.close()
+    return run
+
+
+def stage_parse_entries(path: str, workdir: str) -> Callable[[], Any]: #vers 1
+    """_parse_all_entries on an open archive with detection state reset"""
+    img_file = _open_archive(path)
+
+    def run():
+        for entry in img_file.entries:
+            entry._version_detected = False
+        img_file._parse_all_entries()
+    return run
+
+
+def stage_populate_table(path: str, workdir: str) -> Optional[Callable[[], Any]]: #vers 2
+    """Fill and paint an (offscreen) main entries table - skipped without PyQt6"""
+    if not HAS_QT:
+        return None
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication.instance() or QApplication([])
+    from apps.methods.populate_img_table import populate_img_table
+    from apps.gui.img_entry_table import IMGEntryTableView
+    img_file = _open_archive(path)
+    table = IMGEntryTableView()
+    table.resize(1024, 768)
+    table.show()
+
+    def run():
+        table.setRowCount(0)
+        if not populate_img_table(table, img_file):
+            raise RuntimeError("table population failed")
+        app.processEvents()
+    return run
+
+
+def stage_extract_all(path: str, workdir: str) -> Callable[[], Any]: #vers 1
+    """Every entry written out as a file, read in offset order through one read session"""
+    img_file = _open_archive(path)
+    output = os.path.join(workdir, "extract")
+
+    def run():
+        shutil.rmtree(output, ignore_errors=True)
+        os.makedirs(output)
+        with img_file:
+            for entry in sorted(img_file.entries, key=lambda e: e.offset):
+                view = img_file.read_entry_view(entry)
+                try:
+                    with open(os.path.join(output, entry.name), 'wb') as f:
+                        f.write(view)
+                finally:
+                    view.release()
+    return run
+
+
+def stage_add_many(path: str, workdir: str) -> Callable[[], Any]: #vers 1
+    """Add CHANGE_FRACTION new entries (auto_save off) and save once"""
+    from apps.benchmarks.synthetic_archives import plan_entries
+    copy = _archive_copy(path, workdir)
+    img_file = _open_archive(copy)
+    count = max(1, int(len(img_file.entries) * CHANGE_FRACTION))
+    new_entries = [(f"new{i:07d}.{name[-3:]}", header.ljust(size, b'\x00'))
+                   for i, (name, size, header) in enumerate(plan_entries(count, seed=2))]
+
+    def run():
+        for name, data in new_entries:
+            if not img_file.add_entry(name, data, auto_save=False):
+                raise RuntimeError(f"add_entry failed for {name}")
+        if not img_file.save_img_file():
+            raise RuntimeError("save failed")
+    return run
+
+
+def stage_remove(path: str, workdir: str) -> Callable[[], Any]: #vers 2
+    """Remove CHANGE_FRACTION of the entries (spread over the archive) and save"""
+    copy = _archive_copy(path, workdir)
+    img_file = _open_archive(copy)
+    step = max(1, int(1 / CHANGE_FRACTION))
+    names = [entry.name for entry in img_file.entries[::step]]
+
+    def run():
+        img_file.remove_entries(names)
+        if not img_file.save_img_file():
+            raise RuntimeError("save failed")
+    return run
+
+
+def _fragmented_copy(path: str, workdir: str): #vers 2
+    """Copy with CHANGE_FRACTION of the entries removed and saved - holes to rebuild away"""
+    copy = _archive_copy(path, workdir)
+    img_file = _open_archive(copy)
+    step = max(1, int(1 / CHANGE_FRACTION))
+    with _quiet():
+        img_file.remove_entries([entry.name for entry in img_file.entries[::step]])
+        img_file.save_img_file()
+    return img_file
+
+
+def stage_rebuild_safe(path: str, workdir: str) -> Callable[[], Any]: #vers 1
+    """Streamed full rebuild into a temp file of a fragmented archive"""
+    img_file = _fragmented_copy(path, workdir)
+
+    def run():
+        if not img_file.rebuild_img_file():
+            raise RuntimeError("rebuild failed")
+    return run
+
+
+def stage_rebuild_fast(path: str, workdir: str) -> Callable[[], Any]: #vers 1
+    """In-place compaction of a fragmented archive"""
+    img_file = _fragmented_copy(path, workdir)
+
+    def run():
+        if not img_file.compact_img_file():
+            raise RuntimeError("compaction failed")
+    return run
+
+
+# Stage name -> setup function returning the timed callable (None = skipped)
+STAGES = {
+    'open': stage_open,
+    'open_indexed': stage_open_indexed,
+    'parse_entries': stage_parse_entries,
+    'populate_table': stage_populate_table,
+    'extract_all': stage_extract_all,
+    'add_many': stage_add_many,
+    'remove': stage_remove,
+    'rebuild_safe': stage_rebuild_safe,
+    'rebuild_fast': stage_rebuild_fast,
+}
+
+# Stages that change the archive - set up again for every run
+MUTATING_STAGES = {'add_many', 'remove', 'rebuild_safe', 'rebuild_fast'}
+
+
+def _time_stage(stage: str, path: str, workdir: str, repeat: int) -> Dict[str, Any]: #vers 1
+    """Run one stage repeat times, return seconds per run and best/median"""
+    runs = []
+    run = None
+    for _ in range(repeat):
+        if run is None or stage in MUTATING_STAGES:
+            with _quiet():
+                run = STAGES[stage](path, workdir)
+            if run is None:
+                return {'skipped': True}
+        with _quiet():
+            start = time.perf_counter()
+            run()
+            runs.append(time.perf_counter() - start)
+    return {
+        'runs': runs,
+        'best': min(runs),
+        'median': statistics.median(runs)
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, versions=DEFAULT_VERSIONS, stages=None, repeat: int = 3,
+                   seed: int = 1, size_scale: float = 1.0, workdir: Optional[str] = None,
+                   keep: bool = False) -> Dict[str, Any]: #vers 1
+    """Generate the archives and time every stage on each - returns the results document"""
+    stages = list(stages or STAGES)
+    own_workdir = workdir is None
+    workdir = workdir or tempfile.mkdtemp(prefix="img_benchmark_")
+    results = []
+    try:
+        for version in versions:
+            for count in sizes:
+                start = time.perf_counter()
+                archive = create_synthetic_archive(os.path.join(workdir, "archives"), version, count, seed, size_scale)
+                if archive is None:
+                    raise RuntimeError(f"could not generate {version} archive with {count} entries")
+                archive['generate_seconds'] = time.perf_counter() - start
+                print(f"[INFO] {version} {count} entries: {archive['archive_bytes']:,} bytes "
+                      f"({archive['generate_seconds']:.2f}s to generate)", file=sys.stderr)
+
+                stage_results = {}
+                for stage in stages:
+                    stage_dir = os.path.join(workdir, "stage")
+                    os.makedirs(stage_dir, exist_ok=True)
+                    try:
+                        stage_results[stage] = _time_stage(stage, archive['path'], stage_dir, repeat)
+                    except Exception as e:
+                        stage_results[stage] = {'error': str(e)}
+                    finally:
+                        shutil.rmtree(stage_dir, ignore_errors=True)
+                    result = stage_results[stage]
+                    if 'best' in result:
+                        print(f"[INFO]   {stage:<15} best {result['best'] * 1000:10.1f} ms  "
+                              f"median {result['median'] * 1000:10.1f} ms", file=sys.stderr)
+                    else:
+                        print(f"[INFO]   {stage:<15} {result.get('error', 'skipped')}", file=sys.stderr)
+
+                results.append({
+                    'archive': f"{version}-{count}",
+                    'version': version,
+                    'entries': count,
+                    'archive_bytes': archive['archive_bytes'],
+                    'generate_seconds': archive['generate_seconds'],
+                    'stages': stage_results
+                })
+                if not keep:
+                    for suffix in ('.img', '.dir'):
+                        leftover = archive['path'][:-4] + suffix
+                        if os.path.exists(leftover):
+                            os.remove(leftover)
+    finally:
+        if own_workdir and not keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+
+    return {
+        'format': RESULTS_FORMAT,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': numpy_version,
+        'qt': HAS_QT,
+        'config': {'sizes': list(sizes), 'versions': list(versions), 'stages': stages,
+                   'repeat': repeat, 'seed': seed, 'size_scale': size_scale},
+        'results': results
+    }
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    tolerance: float = 0.10) -> List[Dict[str, Any]]: #vers 1
+    """Per archive/stage best-time ratio current/baseline - regressed when over 1 + tolerance"""
+    base_index = {(r['archive'], stage): data.get('best')
+                  for r in baseline.get('results', []) for stage, data in r['stages'].items()}
+    rows = []
+    for result in current.get('results', []):
+        for stage, data in result['stages'].items():
+            before = base_index.get((result['archive'], stage))
+            after = data.get('best')
+            if not before or after is None:
+                continue
+            ratio = after / before
+            rows.append({'archive': result['archive'], 'stage': stage, 'baseline': before,
+                         'current': after, 'ratio': ratio, 'regressed': ratio > 1.0 + tolerance})
+    return rows
+
+
+def build_parser() -> argparse.ArgumentParser: #vers 1
+    """Command line options"""
+    parser = argparse.ArgumentParser(prog="img_benchmark", description="IMG Factory core archive benchmark")
+    parser.add_argument('--sizes', default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="entry counts, comma separated (default 1000,10000,100000)")
+    parser.add_argument('--versions', default=",".join(DEFAULT_VERSIONS), help="VER1,VER2")
+    parser.add_argument('--stages', default=",".join(STAGES), help="stages to run, comma separated")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per stage (best and median reported)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--size-scale', type=float, default=1.0, help="scale entry sizes (smaller = less disk)")
+    parser.add_argument('--workdir', help="folder for archives (default: temp folder, removed afterwards)")
+    parser.add_argument('--keep', action='store_true', help="keep generated archives")
+    parser.add_argument('-o', '--output', help="write JSON results here (default: stdout)")
+    parser.add_argument('--compare', help="baseline JSON - report ratios, exit 1 on regression")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="allowed slowdown before a regression (0.10 = 10%%)")
+    parser.add_argument('-v', '--verbose', action='store_true', help="show library debug output")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int: #vers 1
+    """Benchmark entry point - returns the exit status"""
+    global _verbose
+    args = build_parser().parse_args(argv)
+    _verbose = args.verbose
+
+    from apps.debug.img_debugger import img_debugger
+    img_debugger.log_to_console = _verbose
+    img_debugger.log_to_file = False
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    versions = [v.strip().upper() for v in args.versions.split(',') if v]
+    stages = [s.strip() for s in args.stages.split(',') if s]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        print(f"error: unknown stages: {', '.join(unknown)}", file=sys.stderr)
+        return 1
+
+    results = run_benchmarks(sizes, versions, stages, args.repeat, args.seed, args.size_scale,
+                             args.workdir, args.keep)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare_results(baseline, results, args.tolerance)
+        for row in rows:
+            flag = "REGRESSION" if row['regressed'] else ""
+            print(f"{row['archive']:<12} {row['stage']:<15} {row['baseline'] * 1000:10.1f} -> "
+                  f"{row['current'] * 1000:10.1f} ms  x{row['ratio']:.2f} {flag}", file=sys.stderr)
+        if any(row['regressed'] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+#this belongs in benchmarks/synthetic_archives.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - Synthetic IMG Archives
+
+"""
+Synthetic IMG Archives - Reproducible VER1 (DIR/IMG) and VER2 test archives.
+Entries are DFF, TXD and COL files with real RenderWare / COL headers
+(GTA VC versions for VER1, GTA SA for VER2) and a per-entry marker; the rest
+of each entry is left as zeroed sparse space so 100k-entry archives generate
+in seconds and use little disk.
+"""
+
+import os
+import random
+import struct
+from typing import List, Tuple, Optional, Dict, Any
+
+from apps.core.img_version1 import IMGVersion1Creator
+from apps.core.img_version2 import IMGVersion2Creator
+
+##Methods list -
+# create_synthetic_archive
+# make_entry_header
+# plan_entries
+# _pack_records
+# _write_entry_data
+
+##Classes -
+# SyntheticIMGVersion1Creator
+# SyntheticIMGVersion2Creator
+
+SECTOR_SIZE = 2048
+
+# RenderWare version stamps (see methods/rw_versions.py)
+RW_VERSION_VC = 0x1003FFFF
+RW_VERSION_SA = 0x1803FFFF
+
+# Type mix and size range (bytes) per type - roughly a GTA model archive
+ENTRY_TYPES = (
+    ('dff', 0.45, 1024, 24576),
+    ('txd', 0.35, 2048, 49152),
+    ('col', 0.20, 256, 8192),
+)
+
+# Planned entry: (name, size in bytes, header bytes written at the entry start)
+EntryPlan = Tuple[str, int, bytes]
+
+
+def make_entry_header(ext: str, index: int, size: int, version: str = "VER2") -> bytes: #vers 1
+    """Header bytes for a synthetic entry: RW chunk (DFF/TXD) or COL model header,
+    followed by the entry index so no two entries hash the same"""
+    rw_version = RW_VERSION_SA if version == "VER2" else RW_VERSION_VC
+    if ext == 'dff':
+        # Clump chunk, then its struct chunk: atomic/light/camera counts
+        header = struct.pack('<III', 0x10, size - 12, rw_version)
+        header += struct.pack('<IIIIII', 0x01, 12, rw_version, 1 + index % 8, 0, 0)
+    elif ext == 'txd':
+        # Texture dictionary chunk, then struct: texture count + device id
+        header = struct.pack('<III', 0x16, size - 12, rw_version)
+        header += struct.pack('<IIIHH', 0x01, 4, rw_version, 1 + index % 16, 0)
+    else:
+        # COL model: fourcc, size after this field, 22-byte name, model id
+        fourcc = b'COL3' if version == "VER2" else b'COLL'
+        name = f"model{index:06d}".encode('ascii')[:22].ljust(22, b'\x00')
+        header = fourcc + struct.pack('<I', size - 8) + name + struct.pack('<H', index & 0xFFFF)
+    return header + struct.pack('<I', index)
+
+
+def plan_entries(count: int, version: str = "VER2", seed: int = 1, size_scale: float = 1.0) -> List[EntryPlan]: #vers 1
+    """Deterministic entry list - same count/seed always gives the same archive"""
+    rng = random.Random(seed)
+    kinds = [kind for kind, _, _, _ in ENTRY_TYPES]
+    weights = [weight for _, weight, _, _ in ENTRY_TYPES]
+    ranges = {kind: (low, high) for kind, _, low, high in ENTRY_TYPES}
+    plans = []
+    for index in range(count):
+        ext = rng.choices(kinds, weights)[0]
+        low, high = ranges[ext]
+        size = max(64, int(rng.randint(low, high) * size_scale))
+        name = f"{ext}{index:07d}.{ext}"
+        plans.append((name, size, make_entry_header(ext, index, size, version)))
+    return plans
+
+
+def _write_entry_data(img_file, plans: List[EntryPlan], first_sector: int) -> List[Tuple[int, int]]: #vers 1
+    """Write entry headers back to back from first_sector, return (offset, size) in sectors"""
+    layout = []
+    sector = first_sector
+    for name, size, header in plans:
+        img_file.seek(sector * SECTOR_SIZE)
+        img_file.write(header)
+        sectors = (size + SECTOR_SIZE - 1) // SECTOR_SIZE
+        layout.append((sector, sectors))
+        sector += sectors
+    # Zero tail of the last entry - sparse on filesystems that support it
+    img_file.truncate(sector * SECTOR_SIZE)
+    return layout
+
+
+def _pack_records(plans: List[EntryPlan], layout: List[Tuple[int, int]]) -> bytes: #vers 1
+    """32-byte directory records: offset, size (sectors), 24-byte name"""
+    return b''.join(struct.pack('<II24s', offset, sectors, name.encode('ascii'))
+                    for (name, _, _), (offset, sectors) in zip(plans, layout))
+
+
+class SyntheticIMGVersion1Creator(IMGVersion1Creator):
+    """DIR/IMG pair with a planned list of entries"""
+
+    def create_synthetic(self, output_path: str, plans: List[EntryPlan]) -> bool: #vers 1
+        """Write the .img data and a plain record-only .dir (no count, as GTA3/VC read it)"""
+        try:
+            base = output_path[:-4] if output_path.lower().endswith(('.img', '.dir')) else output_path
+            self.img_path = base + '.img'
+            self.dir_path = base + '.dir'
+
+            with open(self.img_path, 'wb') as img_file:
+                layout = _write_entry_data(img_file, plans, 0)
+            with open(self.dir_path, 'wb') as dir_file:
+                dir_file.write(_pack_records(plans, layout))
+
+            self.entries = plans
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Error creating synthetic Version 1 IMG: {e}")
+            return False
+
+
+class SyntheticIMGVersion2Creator(IMGVersion2Creator):
+    """VER2 archive with a planned list of entries"""
+
+    def create_synthetic(self, output_path: str, plans: List[EntryPlan]) -> bool: #vers 1
+        """Write VER2 header, directory and entry data (data from the sector after the directory)"""
+        try:
+            if not output_path.lower().endswith('.img'):
+                output_path += '.img'
+            directory_end = 8 + len(plans) * 32
+            first_sector = (directory_end + SECTOR_SIZE - 1) // SECTOR_SIZE
+
+            with open(output_path, 'wb') as img_file:
+                layout = _write_entry_data(img_file, plans, first_sector)
+                img_file.seek(0)
+                img_file.write(b'VER2' + struct.pack('<I', len(plans)))
+                img_file.write(_pack_records(plans, layout))
+
+            self.file_path = output_path
+            self.entries = plans
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Error creating synthetic Version 2 IMG: {e}")
+            return False
+
+
+def create_synthetic_archive(folder: str, version: str, count: int, seed: int = 1,
+                             size_scale: float = 1.0) -> Optional[Dict[str, Any]]: #vers 1
+    """Generate a VER1 or VER2 archive with count entries in folder.
+    Returns path (the .img), version, entries and data bytes, or None on failure."""
+    os.makedirs(folder, exist_ok=True)
+    plans = plan_entries(count, version, seed, size_scale)
+    path = os.path.join(folder, f"synthetic_{version.lower()}_{count}.img")
+    if version == "VER1":
+        creator = SyntheticIMGVersion1Creator()
+    else:
+        creator = SyntheticIMGVersion2Creator()
+    if not creator.create_synthetic(path, plans):
+        return None
+    return {
+        'path': path,
+        'version': version,
+        'entries': count,
+        'archive_bytes': os.path.getsize(path)
+    }
+
+
+__all__ = [
+    'ENTRY_TYPES',
+    'SyntheticIMGVersion1Creator',
+    'SyntheticIMGVersion2Creator',
+    'create_synthetic_archive',
+    'make_entry_header',
+    'plan_entries'
+]
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-#this belongs in components/Img_Factory/imgfactory.py - Version: 76
+#this belongs in components/Img_Factory/imgfactory.py - Version: 82
 # X-Seti - December11 2025 - IMG Factory 1.5 - Fixed Imports
 
 """
@@ -15,6 +15,11 @@ from pathlib import Path
 
 print("Starting application...")
 
+# Startup profiler (--profile-startup or IMGFACTORY_PROFILE_STARTUP=1)
+from apps.debug.startup_profiler import startup_profiler
+if startup_profiler.is_requested():
+    startup_profiler.start()
+
 # PyQt6 imports
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -42,24 +47,20 @@ except ImportError:
 # App utilities
 from apps.utils.app_settings_system import AppSettings, apply_theme_to_app, SettingsDialog
 
-# Components
-from apps.components.Img_Creator.img_creator import NewIMGDialog, IMGCreationThread
+# Components - workshops, editors and tools load on first use
+from apps.methods.component_registry import load_component, get_component, call_component
 
 # Debug
 from apps.debug.debug_functions import set_col_debug_enabled
-from apps.debug.debug_functions import integrate_all_improvements, install_debug_control_system
 
 # Core functions
-from apps.core.img_formats import GameSpecificIMGDialog, IMGCreator
 from apps.core.file_extraction import setup_complete_extraction_integration
 from apps.core.extract import extract_textures_function
 from apps.core.file_type_filter import integrate_file_filtering
 from apps.methods.rw_versions import get_rw_version_name
 from apps.core.right_click_actions import setup_table_context_menu
 from apps.core.shortcuts import setup_all_shortcuts, create_debug_keyboard_shortcuts
-from apps.core.convert import convert_img, convert_img_format
 from apps.core.reload import integrate_reload_functions
-from apps.core.img_split import integrate_split_functions
 from apps.core.theme_integration import integrate_theme_system
 from apps.core.create import create_new_img
 from apps.core.open import _detect_and_open_file, open_file_dialog, _detect_file_type
@@ -85,31 +86,24 @@ from apps.core.inverse_selection import integrate_inverse_selection
 from apps.core.sort_via_ide import integrate_sort_via_ide
 from apps.core.advanced_img_tools import integrate_advanced_img_tools
 from apps.core.rw_unk_snapshot import integrate_unknown_rw_detection
-from apps.core.col_viewer_integration import integrate_col_viewer
 
 # GUI Layout
 from apps.gui.ide_dialog import integrate_ide_dialog
 from apps.gui.gui_backend import ButtonDisplayMode, GUIBackend
-from apps.gui.main_window import IMGFactoryMainWindow
-from apps.gui.col_display import update_col_info_bar_enhanced
 from apps.gui.gui_layout import IMGFactoryGUILayout
-from apps.gui.unified_button_theme import apply_unified_button_theme
 from apps.gui.gui_menu import IMGFactoryMenuBar
 from apps.gui.autosave_menu import integrate_autosave_menu
 from apps.gui.file_menu_integration import add_project_menu_items
 from apps.gui.directory_tree_system import integrate_directory_tree_system
 from apps.gui.tearoff_integration import integrate_tearoff_system
-from apps.gui.gui_context import (open_col_file_dialog, open_col_batch_proc_dialog, open_col_editor_dialog, analyze_col_file_dialog)
 
 # Shared Methods
-from apps.methods.img_core_classes import (IMGFile, IMGEntry, IMGVersion, Platform, IMGEntriesTable, FilterPanel, IMGFileInfoPanel, TabFilterWidget, integrate_filtering, create_entries_table_panel, format_file_size)
+from apps.methods.img_core_classes import (IMGFile, IMGEntry, IMGVersion, Platform, format_file_size)
 
 from apps.methods.col_core_classes import (COLFile, COLModel, COLVersion, COLMaterial, COLFaceGroup, COLSphere, COLBox, COLVertex, COLFace, Vector3, BoundingBox, diagnose_col_file)
 
-from apps.methods.col_integration import integrate_complete_col_system
 from apps.methods.col_functions import setup_complete_col_integration
 from apps.methods.col_parsing_functions import load_col_file_safely
-from apps.methods.col_structure_manager import COLStructureManager
 from apps.methods.img_analyze import analyze_img_corruption, show_analysis_dialog
 from apps.methods.img_integration import integrate_img_functions, img_core_functions
 from apps.methods.img_routing_operations import install_operation_routing
@@ -125,7 +119,6 @@ from apps.methods.import_highlight_system import enable_import_highlighting
 from apps.methods.img_entry_operations import integrate_entry_operations
 from apps.methods.mirror_tab_shared import show_mirror_tab_selection
 from apps.methods.ide_parser_functions import integrate_ide_parser
-from apps.methods.find_dups_functions import find_duplicates_by_hash, show_duplicates_dialog
 from apps.methods.dragdrop_functions import integrate_drag_drop_system
 from apps.methods.img_templates import IMGTemplateManager, TemplateManagerDialog
 from apps.methods.img_import_functions import integrate_img_import_functions
@@ -344,12 +337,13 @@ class IMGLoadThread(QThread):
         super().__init__()
         self.file_path = file_path
 
-    def run(self): #vers 1
+    def run(self): #vers 2
         try:
             self.progress_updated.emit(10, "Opening file...")
 
-            # Create IMG file instance
+            # Create IMG file instance - RW versions are scanned after the table shows
             img_file = IMGFile(self.file_path)
+            img_file.defer_rw_probe = True
 
             self.progress_updated.emit(30, "Detecting format...")
 
@@ -388,7 +382,7 @@ class IMGLoadThread(QThread):
 
 class IMGFactory(QMainWindow):
     """Main IMG Factory application window"""
-    def __init__(self, settings): #vers 62
+    def __init__(self, settings): #vers 63
         """Initialize IMG Factory with optimized loading order"""
         super().__init__()
 
@@ -564,8 +558,9 @@ class IMGFactory(QMainWindow):
         # Progress system
         #integrate_progress_system(self)
 
-        # Split functions
-        integrate_split_functions(self)
+        # Split functions (splitter loads on first use)
+        self.split_img = lambda: call_component('img_split', 'split_img', self)
+        self.split_img_via = lambda: call_component('img_split', 'split_img_via', self)
 
         # RW detection
         integrate_unknown_rw_detection(self)
@@ -917,16 +912,16 @@ class IMGFactory(QMainWindow):
 
 
     # Menu isolation: Docked workshops should not affect main window menu
-    def open_txd_workshop_docked(self, txd_name=None, txd_data=None): #vers 3
+    def open_txd_workshop_docked(self, txd_name=None, txd_data=None): #vers 5
         """Open TXD Workshop as overlay on file window"""
-        from apps.components.Txd_Editor.txd_workshop import TXDWorkshop
+        load_component('txd_workshop')
 
 
     # Menu isolation: Docked workshops should not affect main window menu
-    def open_col_workshop_docked(self, col_name=None, col_data=None): #vers 1
+    def open_col_workshop_docked(self, col_name=None, col_data=None): #vers 3
         """Open COL Workshop as overlay on file window - SIMILAR TO TXD VERSION"""
-        from apps.components.Col_Editor.col_workshop import COLWorkshop
-        from PyQt6.QtWidgets import QTableWidget
+        COLWorkshop = get_component('col_workshop', 'COLWorkshop')
+        from PyQt6.QtWidgets import QTableView
         from PyQt6.QtCore import Qt
 
         # Get current tab
@@ -939,8 +934,8 @@ class IMGFactory(QMainWindow):
         if not current_tab:
             return None
 
-        # Find the file list table to get its geometry
-        tables = current_tab.findChildren(QTableWidget)
+        # Find the file list table to get its geometry (entries table is a QTableView)
+        tables = current_tab.findChildren(QTableView)
 
         if not tables:
             self.log_message("No table found to overlay")
@@ -1000,7 +995,7 @@ class IMGFactory(QMainWindow):
 
         return workshop
 
-    def _handle_col_overlay_tab_switch(self, workshop, new_tab_index): #vers 1
+    def _handle_col_overlay_tab_switch(self, workshop, new_tab_index): #vers 2
         """Handle hiding/showing COL Workshop overlay on tab switch"""
         if not hasattr(workshop, 'is_overlay') or not workshop.is_overlay:
             return
@@ -1024,9 +1019,9 @@ class IMGFactory(QMainWindow):
         if not current_tab:
             return None
 
-        # Find the file list table to get its geometry
-        from PyQt6.QtWidgets import QTableWidget
-        tables = current_tab.findChildren(QTableWidget)
+        # Find the file list table to get its geometry (entries table is a QTableView)
+        from PyQt6.QtWidgets import QTableView
+        tables = current_tab.findChildren(QTableView)
 
         if not tables:
             self.log_message("No table found to overlay")
@@ -1337,7 +1332,7 @@ class IMGFactory(QMainWindow):
             QMessageBox.critical(self, "Save As Error", f"Failed to save IMG file:\n{str(e)}")
             return False
 
-    def _save_img_entry(self):
+    def _save_img_entry(self): #vers 2
         """Save IMG file with modification check - addresses issue #1"""
         try:
             if not hasattr(self, 'current_img') or not self.current_img:
@@ -1390,6 +1385,8 @@ class IMGFactory(QMainWindow):
                 if success:
                     # Reset the modified flag after successful save
                     self.current_img.modified = False
+                    if hasattr(self, 'refresh_img_status'):
+                        self.refresh_img_status()
                     self.log_message(f"IMG file saved: {file_path}")
                     QMessageBox.information(self, "Save", f"File saved successfully:\n{file_path}")
                     return True
@@ -2575,7 +2572,7 @@ class IMGFactory(QMainWindow):
         self.main_tab_widget.addTab(tab_widget, "No File")
 
 
-    def _find_table_in_tab(self, tab_widget): #vers 1
+    def _find_table_in_tab(self, tab_widget): #vers 2
         """Find the table widget in a specific tab - HELPER METHOD"""
         try:
             if not tab_widget:
@@ -2586,12 +2583,12 @@ class IMGFactory(QMainWindow):
                 return tab_widget.dedicated_table
 
             # Method 2: Search recursively through widget hierarchy
-            from PyQt6.QtWidgets import QTableWidget
+            from PyQt6.QtWidgets import QTableView
 
             def find_table_recursive(widget):
-                if isinstance(widget, QTableWidget):
+                if isinstance(widget, QTableView):
                     return widget
-                for child in widget.findChildren(QTableWidget):
+                for child in widget.findChildren(QTableView):
                     return child  # Return first table found
                 return None
 
@@ -3025,8 +3022,7 @@ class IMGFactory(QMainWindow):
                 return
 
             # STEP 2: Load TXD via workshop
-            from apps.components.Txd_Editor.txd_workshop import open_txd_workshop
-            workshop = open_txd_workshop(self, file_path)
+            workshop = call_component('txd_workshop', 'open_txd_workshop', self, file_path)
 
             if not workshop:
                 self.log_message("TXD workshop failed to open")
@@ -3118,9 +3114,9 @@ class IMGFactory(QMainWindow):
             traceback.print_exc()
 
 
-    def _open_txd_workshop(self, file_path=None): #vers 2
+    def _open_txd_workshop(self, file_path=None): #vers 3
         """Open TXD Workshop - connects to tab switching"""
-        from apps.components.Txd_Editor.txd_workshop import open_txd_workshop
+        open_txd_workshop = get_component('txd_workshop', 'open_txd_workshop')
 
         if not file_path:
             if hasattr(self, 'current_img') and self.current_img:
@@ -3699,7 +3695,7 @@ class IMGFactory(QMainWindow):
             self.log_message(f"Progress: {progress}% - {status}")
 
 
-    def _on_img_loaded(self, img_file): #vers 4
+    def _on_img_loaded(self, img_file): #vers 5
         """Handle IMG loading completion"""
         try:
             self.current_img = img_file
@@ -3723,6 +3719,11 @@ class IMGFactory(QMainWindow):
             entry_count = len(img_file.entries) if img_file.entries else 0
             self.log_message(f"Loaded: {file_name} ({entry_count} entries)")
 
+            # Fill RW Version / RW Address in the background
+            if getattr(img_file, 'defer_rw_probe', False):
+                from apps.methods.rw_version_scan import start_rw_version_scan
+                start_rw_version_scan(self, img_file, tab_widget)
+
             # Hide progress
             if hasattr(self.gui_layout, 'hide_progress'):
                 self.gui_layout.hide_progress()
@@ -3922,7 +3923,7 @@ class IMGFactory(QMainWindow):
         self.log_message("Export via tool functionality coming soon")
 
 
-    def import_files(self):
+    def import_files(self): #vers 2
         """Import files into current IMG"""
         if not self.current_img:
             QMessageBox.warning(self, "No IMG", "No IMG file is currently loaded.")
@@ -3959,6 +3960,8 @@ class IMGFactory(QMainWindow):
                     self._populate_real_img_table(self.current_img)
                 else:
                     populate_img_table(self.gui_layout.table, self.current_img)
+                if hasattr(self, 'refresh_img_status'):
+                    self.refresh_img_status()
 
                 self.log_message(f"Import complete: {imported_count}/{len(file_paths)} files imported")
 
@@ -4086,7 +4089,7 @@ class IMGFactory(QMainWindow):
             QMessageBox.critical(self, "Export Error", error_msg)
 
 
-    def remove_selected(self):
+    def remove_selected(self): #vers 2
         """Remove selected entries"""
         if not self.current_img:
             QMessageBox.warning(self, "No IMG", "No IMG file is currently loaded.")
@@ -4138,6 +4141,8 @@ class IMGFactory(QMainWindow):
                     self._populate_real_img_table(self.current_img)
                 else:
                     populate_img_table(self.gui_layout.table, self.current_img)
+                if hasattr(self, 'refresh_img_status'):
+                    self.refresh_img_status()
 
                 self.log_message(f"Removal complete: {removed_count} entries removed")
 
@@ -4347,10 +4352,10 @@ class IMGFactory(QMainWindow):
 
 
     # COL and editor functions
-    def open_col_editor(self): #vers 4
+    def open_col_editor(self): #vers 6
         """Open COL Workshop with current COL data and selected entry"""
         try:
-            from apps.components.Col_Editor.col_workshop import COLWorkshop
+            load_component('col_workshop')
 
             # Get selected COL entry name from table
             selected_col_name = None
@@ -4798,11 +4803,16 @@ class IMGFactory(QMainWindow):
         except Exception as e:
             self.log_message(f"❌ Search previous error: {e}")
 
-    def closeEvent(self, event): #vers 2
+    def closeEvent(self, event): #vers 4
         """Handle application close"""
         try:
             self._save_settings()
 
+            from apps.methods.rw_version_scan import cancel_all_rw_version_scans
+            cancel_all_rw_version_scans()
+            from apps.methods.asset_index_scan import cancel_asset_index_scan
+            cancel_asset_index_scan()
+
             # Clean up threads
             if hasattr(self, 'load_thread') and self.load_thread and self.load_thread.isRunning():
                 self.load_thread.quit()
@@ -4888,10 +4898,13 @@ def main():
            settings = DummySettings()
            print("Using DummySettings - theme system may be limited")
 
-       # Create main window
-       window = IMGFactory(settings)
+       # Create main window (per-call init timings with --profile-startup)
+       window = startup_profiler.profile_calls(IMGFactory, settings)
        # Show window
        window.show()
+       if startup_profiler.enabled:
+           startup_profiler.stop()
+           startup_profiler.report()
 
        return app.exec()
 
@@ -5499,11 +5512,8 @@ def show_hex_editor(main_window, row, entry_info):
     Show hex editor for selected file
     """
     try:
-        # Import the hex editor module
-        from apps.components.Hex_Editor import show_hex_editor_for_entry
-        
-        # Use the new hex editor implementation
-        show_hex_editor_for_entry(main_window, row, entry_info)
+        # Hex editor loads on first use
+        call_component('hex_editor', 'show_hex_editor_for_entry', main_window, row, entry_info)
         
     except Exception as e:
         main_window.log_message(f"❌ Error showing hex editor: {str(e)}")
@@ -5523,10 +5533,7 @@ def show_hex_editor_selected(main_window):
                 row = selected_items[0].row()
                 entry_info = get_entry_info(main_window, row)
                 if entry_info:
-                    # Import the hex editor module
-                    from apps.components.Hex_Editor import show_hex_editor_for_entry
-                    
-                    # Use the new hex editor implementation
-                    show_hex_editor_for_entry(main_window, row, entry_info)
+                    # Hex editor loads on first use
+                    call_component('hex_editor', 'show_hex_editor_for_entry', main_window, row, entry_info)
     except Exception as e:
         main_window.log_message(f"❌ Error showing hex editor for selected: {str(e)}")
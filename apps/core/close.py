@@ -1,4 +1,4 @@
-#this belongs in core/close.py - Version: 11
+#this belongs in core/close.py - Version: 14
 # X-Seti - September27 2025 - IMG Factory 1.5 - Close Functions Only
 
 """
@@ -16,6 +16,7 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout
 # close_tab
 # _clear_current_tab
 # _clear_all_tables_in_tab
+# _release_file_object
 
 ##Functions -
 # close_all_img
@@ -117,7 +118,7 @@ class IMGCloseManager:
         except Exception as e:
             self.log_message(f"Error closing all tabs: {str(e)}")
 
-    def close_tab(self, index): #vers 6
+    def close_tab(self, index): #vers 7
         """Close tab at index"""
         if self.main_window.main_tab_widget.count() <= 1:
             self._clear_current_tab()
@@ -129,6 +130,7 @@ class IMGCloseManager:
 
             if tab_widget:
                 self._clear_all_tables_in_tab(tab_widget)
+                self._release_file_object(tab_widget)
 
             # Remove tab - this triggers currentChanged signal automatically
             self.main_window.main_tab_widget.removeTab(index)
@@ -140,7 +142,7 @@ class IMGCloseManager:
         except Exception as e:
             self.log_message(f"Error closing tab {index}: {str(e)}")
 
-    def _clear_current_tab(self): #vers 2
+    def _clear_current_tab(self): #vers 3
         """Clear current tab contents"""
         try:
             current_index = self.main_window.main_tab_widget.currentIndex()
@@ -151,6 +153,7 @@ class IMGCloseManager:
 
             tab_widget = self.main_window.main_tab_widget.widget(current_index)
             if tab_widget:
+                self._release_file_object(tab_widget)
                 tab_widget.file_object = None
                 tab_widget.file_type = 'NONE'
                 tab_widget.file_path = None
@@ -169,17 +172,30 @@ class IMGCloseManager:
         except Exception as e:
             self.log_message(f"Error clearing current tab: {str(e)}")
 
-    def _clear_all_tables_in_tab(self, tab_widget): #vers 1
+    def _clear_all_tables_in_tab(self, tab_widget): #vers 2
         """Clear all table data in a tab widget"""
         try:
-            from PyQt6.QtWidgets import QTableWidget
-            tables = tab_widget.findChildren(QTableWidget)
+            from PyQt6.QtWidgets import QTableView
+            tables = tab_widget.findChildren(QTableView)
             for table in tables:
+                if not hasattr(table, 'setRowCount'):
+                    continue
                 table.clear()
                 table.setRowCount(0)
         except Exception as e:
             self.log_message(f"Error clearing tables: {str(e)}")
 
+    def _release_file_object(self, tab_widget): #vers 2
+        """Stop the tab's background RW scan and release open handles (IMG read session)"""
+        try:
+            from apps.methods.rw_version_scan import cancel_rw_version_scan
+            cancel_rw_version_scan(tab_widget)
+            file_object = getattr(tab_widget, 'file_object', None)
+            if file_object and hasattr(file_object, 'close_read_session'):
+                file_object.close_read_session()
+        except Exception as e:
+            self.log_message(f"Error releasing file handles: {str(e)}")
+
 
 __all__ = [
     'IMGCloseManager',
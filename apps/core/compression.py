@@ -1,4 +1,4 @@
-#this belongs in core/compression.py - Version: 1
+#this belongs in core/compression.py - Version: 7
 # X-Seti - August27 2025 - IMG Factory 1.5 - Compression Functions
 # Moved from apps.components.img_compression.py + added from img_manager.py
 
@@ -8,13 +8,20 @@ Consolidated from apps.components.img_compression.py with added analysis functio
 """
 
 import os
+import mmap
 import zlib
 import struct
 import time
+import random
+import bisect
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from typing import Dict, List, Any, Optional, Union, Callable
 from dataclasses import dataclass
 
+import numpy as np
+
 # Import compression libraries with fallbacks
 try:
     import lz4.frame
@@ -38,7 +45,12 @@ except ImportError:
 ##Methods list -
 # get_compression_ratio_analysis
 # analyze_compression_potential
+# estimate_archive_compression
+# compress_entry_payload
 # compress_img_entries
+# _compress_chunk_worker
+# _plan_compress_chunks
+# _sampled_entropy
 # decompress_img_entries
 # get_available_algorithms
 # format_compression_ratio
@@ -50,6 +62,22 @@ except ImportError:
 # IMGCompressor
 # CompressionAnalyzer
 
+# Parallel compression engine
+ENTROPY_SKIP = 7.5              # Bits per byte - sampled entries above this won't shrink
+ENTROPY_WINDOW = 4096           # Bytes per entropy sample window (start, middle, end)
+MIN_COMPRESS_SIZE = 2048        # Smaller entries can't lose a sector
+COMPRESS_CHUNK_BYTES = 16 * 1024 * 1024   # Input bytes per pool task
+POOL_MIN_BYTES = 32 * 1024 * 1024         # Below this, compress in-process
+FASTMAN92_HEADER_SIZE = 12      # original size, compressed size, version
+SECTOR_SIZE = 2048
+
+# Archive compressibility sampling
+SAMPLE_WINDOW = 64 * 1024       # Bytes per sampled window
+SAMPLE_WINDOWS_PER_ENTRY = 2
+SAMPLE_BUDGET_BYTES = 16 * 1024 * 1024    # Most bytes read for one estimate
+SAMPLE_TIME_BUDGET = 0.8        # Seconds spent compressing windows
+
+
 class CompressionAlgorithm(Enum):
     """Supported compression algorithms"""
     NONE = "none"
@@ -201,7 +229,8 @@ class IMGCompressor:
         """Decompress Fastman92 ZLIB format"""
         if self.settings.fastman92_header and len(data) >= 12:
             original_size, compressed_size, version = struct.unpack('<III', data[:12])
-            compressed_data = data[12:]
+            # Stored entries are padded to whole sectors
+            compressed_data = data[12:12 + compressed_size]
         else:
             compressed_data = data
         
@@ -211,7 +240,8 @@ class IMGCompressor:
         """Decompress Fastman92 LZ4 format"""
         if self.settings.fastman92_header and len(data) >= 12:
             original_size, compressed_size, version = struct.unpack('<III', data[:12])
-            compressed_data = data[12:]
+            # Stored entries are padded to whole sectors
+            compressed_data = data[12:12 + compressed_size]
         else:
             compressed_data = data
         
@@ -238,73 +268,178 @@ class CompressionAnalyzer:
     """Advanced compression analysis and optimization"""
     
     @staticmethod
-    def get_compression_ratio_analysis(img_file) -> Dict[str, Any]: #vers 1
-        """Analyze compression ratios for IMG entries - MOVED FROM img_manager.py"""
+    def get_compression_ratio_analysis(img_file, windows_per_entry: int = SAMPLE_WINDOWS_PER_ENTRY,
+                                       budget_bytes: int = SAMPLE_BUDGET_BYTES) -> Dict[str, Any]: #vers 2
+        """Analyze compression ratios for IMG entries from sampled windows
+        (see estimate_archive_compression) - entries are no longer read whole.
+        compressible_entries covers the sampled entries; 'estimate' holds the
+        archive-wide figures."""
         try:
+            estimate = CompressionAnalyzer.estimate_archive_compression(
+                img_file, windows_per_entry=windows_per_entry, budget_bytes=budget_bytes)
+            if 'error' in estimate:
+                return estimate
             analysis = {
                 'compressible_entries': [],
                 'already_compressed': [],
                 'potential_savings': 0,
                 'total_entries': len(img_file.entries) if img_file.entries else 0,
-                'analysis_summary': {}
+                'analysis_summary': {},
+                'estimate': estimate
             }
-            
-            total_uncompressed_size = 0
-            total_compressed_size = 0
-            compressible_count = 0
-            
+
             for entry in img_file.entries:
-                try:
-                    if hasattr(entry, 'is_compressed') and entry.is_compressed:
-                        # Entry is already compressed
-                        if hasattr(entry, 'uncompressed_size') and hasattr(entry, 'size'):
-                            ratio = (entry.uncompressed_size - entry.size) / entry.uncompressed_size * 100
-                            analysis['already_compressed'].append({
-                                'name': entry.name,
-                                'ratio': ratio,
-                                'savings': entry.uncompressed_size - entry.size,
-                                'uncompressed_size': entry.uncompressed_size,
-                                'compressed_size': entry.size
-                            })
-                            total_uncompressed_size += entry.uncompressed_size
-                            total_compressed_size += entry.size
-                    else:
-                        # Test compression potential
-                        data = entry.get_data() if hasattr(entry, 'get_data') else b''
-                        if data:
-                            compressed = zlib.compress(data, 6)
-                            if len(compressed) < len(data):
-                                savings = len(data) - len(compressed)
-                                ratio = savings / len(data) * 100
-                                analysis['compressible_entries'].append({
-                                    'name': entry.name,
-                                    'ratio': ratio,
-                                    'savings': savings,
-                                    'original_size': len(data),
-                                    'compressed_size': len(compressed)
-                                })
-                                analysis['potential_savings'] += savings
-                                compressible_count += 1
-                                total_uncompressed_size += len(data)
-                                total_compressed_size += len(compressed)
-                            
-                except Exception:
+                if getattr(entry.compression_type, 'value', 'none') in ('none', 'unknown') or not entry.uncompressed_size:
                     continue
-            
-            # Generate summary
+                analysis['already_compressed'].append({
+                    'name': entry.name,
+                    'ratio': (entry.uncompressed_size - entry.size) / entry.uncompressed_size * 100,
+                    'savings': entry.uncompressed_size - entry.size,
+                    'uncompressed_size': entry.uncompressed_size,
+                    'compressed_size': entry.size
+                })
+
+            for name, size, ratio in estimate['entry_ratios']:
+                if ratio < 1.0:
+                    savings = int(size * (1.0 - ratio))
+                    analysis['compressible_entries'].append({
+                        'name': name,
+                        'ratio': (1.0 - ratio) * 100,
+                        'savings': savings,
+                        'original_size': size,
+                        'compressed_size': size - savings
+                    })
+
+            zlib_ratio = estimate['estimated_ratio'].get('zlib', 1.0)
+            total = estimate['total_bytes'] - estimate['already_compressed_bytes']
+            analysis['potential_savings'] = estimate['estimated_savings'].get('zlib', 0)
             analysis['analysis_summary'] = {
-                'total_uncompressed_mb': total_uncompressed_size / (1024 * 1024),
-                'total_compressed_mb': total_compressed_size / (1024 * 1024),
-                'overall_savings_mb': (total_uncompressed_size - total_compressed_size) / (1024 * 1024),
-                'overall_compression_ratio': (total_compressed_size / total_uncompressed_size * 100) if total_uncompressed_size > 0 else 100,
-                'compressible_entries_count': compressible_count,
+                'total_uncompressed_mb': total / (1024 * 1024),
+                'total_compressed_mb': total * zlib_ratio / (1024 * 1024),
+                'overall_savings_mb': analysis['potential_savings'] / (1024 * 1024),
+                'overall_compression_ratio': zlib_ratio * 100,
+                'compressible_entries_count': len(analysis['compressible_entries']),
                 'already_compressed_count': len(analysis['already_compressed'])
             }
-            
             return analysis
-            
+
         except Exception as e:
             return {'error': str(e)}
+
+    @staticmethod
+    def estimate_archive_compression(img_file, algorithms: Optional[List[CompressionAlgorithm]] = None,
+                                     windows_per_entry: int = SAMPLE_WINDOWS_PER_ENTRY,
+                                     window_size: int = SAMPLE_WINDOW, budget_bytes: int = SAMPLE_BUDGET_BYTES,
+                                     time_budget: float = SAMPLE_TIME_BUDGET, seed: int = 0) -> Dict[str, Any]: #vers 1
+        """Archive-wide compression ratio estimate per algorithm (zlib, and lz4 when
+        available) from random windows of up to window_size bytes - windows_per_entry
+        per entry while that fits budget_bytes, otherwise windows spread over the
+        archive's data in proportion to entry size. Windows above ENTROPY_SKIP count
+        as stored (as compress_img_entries would leave them); windows are compressed
+        in random order until time_budget runs out. Entries already compressed and
+        pending (unsaved) ones are not sampled.
+        Returns total_bytes, sampled_bytes, windows, mean_entropy, estimated_ratio
+        and estimated_savings per algorithm value, worth_compressing, entry_ratios
+        [(name, size, zlib ratio)] for the sampled entries, elapsed."""
+        started = time.monotonic()
+        if algorithms is None:
+            algorithms = [CompressionAlgorithm.ZLIB] + ([CompressionAlgorithm.LZ4] if HAS_LZ4 else [])
+        entries = [entry for entry in img_file.entries
+                   if entry.size and entry._cached_data is None
+                   and getattr(entry.compression_type, 'value', 'none') in ('none', 'unknown')]
+        total_bytes = sum(entry.size for entry in img_file.entries)
+        already = sum(entry.size for entry in img_file.entries
+                      if getattr(entry.compression_type, 'value', 'none') not in ('none', 'unknown'))
+        sample_total = sum(entry.size for entry in entries)
+
+        # (entry index, start, length, bytes it stands for)
+        rng = random.Random(seed)
+        windows = []
+        per_entry = sum(min(windows_per_entry, -(-entry.size // window_size)) * min(entry.size, window_size)
+                        for entry in entries)
+        if per_entry <= budget_bytes:
+            for index, entry in enumerate(entries):
+                if entry.size <= window_size:
+                    windows.append((index, 0, entry.size, entry.size))
+                    continue
+                count = min(windows_per_entry, -(-entry.size // window_size))
+                for _ in range(count):
+                    windows.append((index, rng.randrange(entry.size - window_size + 1), window_size, entry.size / count))
+        elif sample_total:
+            # Stratified over the concatenated entry data - large entries get more windows
+            count = max(1, budget_bytes // window_size)
+            ends = []
+            position = 0
+            for entry in entries:
+                position += entry.size
+                ends.append(position)
+            stride = sample_total / count
+            for k in range(count):
+                point = int((k + rng.random()) * stride)
+                index = min(bisect.bisect_right(ends, point), len(entries) - 1)
+                entry = entries[index]
+                length = min(window_size, entry.size)
+                start = min(max(0, point - (ends[index] - entry.size)), entry.size - length)
+                windows.append((index, start, length, stride))
+
+        rng.shuffle(windows)
+        represented = 0.0
+        stored = {algorithm.value: 0.0 for algorithm in algorithms}
+        entropy_sum = 0.0
+        entry_ratio: Dict[int, List[float]] = {}
+        sampled = 0
+        done = 0
+        try:
+            fd = os.open(img_file.get_data_path(), os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        except OSError as e:
+            return {'error': str(e)}
+        try:
+            for index, start, length, weight in windows:
+                if done and time.monotonic() - started > time_budget:
+                    break
+                entry = entries[index]
+                if hasattr(os, 'pread'):
+                    data = os.pread(fd, length, entry.offset + start)
+                else:
+                    os.lseek(fd, entry.offset + start, os.SEEK_SET)
+                    data = os.read(fd, length)
+                if not data:
+                    continue
+                done += 1
+                sampled += len(data)
+                entropy = CompressionAnalyzer._calculate_entropy(data)
+                entropy_sum += entropy * len(data)
+                represented += weight
+                for algorithm in algorithms:
+                    if entropy > ENTROPY_SKIP:
+                        ratio = 1.0
+                    elif algorithm == CompressionAlgorithm.LZ4:
+                        ratio = min(1.0, len(lz4.block.compress(data, store_size=False)) / len(data))
+                    else:
+                        ratio = min(1.0, len(zlib.compress(data, 6)) / len(data))
+                    stored[algorithm.value] += weight * ratio
+                    if algorithm == algorithms[0]:
+                        entry_ratio.setdefault(index, []).append(ratio)
+        finally:
+            os.close(fd)
+
+        estimated_ratio = {name: (value / represented if represented else 1.0) for name, value in stored.items()}
+        estimated_savings = {name: int((1.0 - ratio) * sample_total) for name, ratio in estimated_ratio.items()}
+        best = min(estimated_ratio.values(), default=1.0)
+        return {
+            'total_bytes': total_bytes,
+            'already_compressed_bytes': already,
+            'sampled_bytes': sampled,
+            'windows': done,
+            'windows_planned': len(windows),
+            'mean_entropy': entropy_sum / sampled if sampled else 0.0,
+            'estimated_ratio': estimated_ratio,
+            'estimated_savings': estimated_savings,
+            'worth_compressing': best < 0.9,
+            'entry_ratios': [(entries[index].name, entries[index].size, sum(ratios) / len(ratios))
+                             for index, ratios in sorted(entry_ratio.items())],
+            'elapsed': time.monotonic() - started
+        }
     
     @staticmethod
     def analyze_compression_potential(data: bytes) -> Dict[str, Any]: #vers 1
@@ -346,111 +481,336 @@ class CompressionAnalyzer:
         return analysis
     
     @staticmethod
-    def _calculate_entropy(data: bytes) -> float:
-        """Calculate Shannon entropy of data"""
+    def _byte_histogram(data) -> np.ndarray: #vers 2
+        """Count of each byte value 0-255"""
+        return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+
+    @staticmethod
+    def _calculate_entropy(data: bytes) -> float: #vers 3
+        """Calculate Shannon entropy of data (bits per byte)"""
         if not data:
             return 0.0
-        
-        # Count byte frequencies
-        freq = {}
-        for byte in data:
-            freq[byte] = freq.get(byte, 0) + 1
-        
-        # Calculate entropy
-        entropy = 0.0
-        data_len = len(data)
-        
-        for count in freq.values():
-            probability = count / data_len
-            if probability > 0:
-                import math
-                entropy -= probability * math.log2(probability)
-        
-        return entropy
+        counts = CompressionAnalyzer._byte_histogram(data)
+        probabilities = counts[counts > 0] / len(data)
+        return float(-(probabilities * np.log2(probabilities)).sum())
     
     @staticmethod
-    def _calculate_repetition_score(data: bytes) -> float:
-        """Calculate how repetitive the data is"""
+    def _calculate_repetition_score(data: bytes) -> float: #vers 3
+        """Calculate how repetitive the data is - share of distinct 4-byte
+        patterns that occur more than once in the first 10000 bytes"""
         if len(data) < 256:
             return 0.0
         
         # Sample data to avoid performance issues
         sample_size = min(10000, len(data))
-        sample = data[:sample_size]
-        
-        # Count repeated patterns
-        patterns = {}
+        sample = bytes(data[:sample_size])
         pattern_length = 4
-        
-        for i in range(len(sample) - pattern_length + 1):
-            pattern = sample[i:i + pattern_length]
-            patterns[pattern] = patterns.get(pattern, 0) + 1
-        
-        # Calculate repetition score
         total_patterns = len(sample) - pattern_length + 1
-        repeated_patterns = sum(1 for count in patterns.values() if count > 1)
-        
+
+        values = np.frombuffer(sample, dtype=np.uint8).astype(np.uint32)
+        patterns = (values[:total_patterns] | values[1:total_patterns + 1] << 8
+                    | values[2:total_patterns + 2] << 16 | values[3:total_patterns + 3] << 24)
+        _, counts = np.unique(patterns, return_counts=True)
+        repeated_patterns = int((counts > 1).sum())
+
         return repeated_patterns / total_patterns if total_patterns > 0 else 0.0
 
 
+def _sampled_entropy(data) -> float: #vers 1
+    """Highest entropy of up to three ENTROPY_WINDOW samples (start, middle, end)"""
+    size = len(data)
+    if size <= ENTROPY_WINDOW * 3:
+        return CompressionAnalyzer._calculate_entropy(bytes(data))
+    starts = (0, (size - ENTROPY_WINDOW) // 2, size - ENTROPY_WINDOW)
+    return max(CompressionAnalyzer._calculate_entropy(bytes(data[start:start + ENTROPY_WINDOW]))
+               for start in starts)
+
+
+def compress_entry_payload(data, algorithm: CompressionAlgorithm, level: int = 6,
+                           min_ratio: float = 0.95) -> tuple: #vers 1
+    """Stored form of one entry: Fastman92 header + zlib or LZ4 block data.
+    Returns (payload or None, reason) - None when sampling or the result says
+    it would not save at least one sector and min_ratio of the size."""
+    size = len(data)
+    if size < MIN_COMPRESS_SIZE:
+        return None, 'too small'
+    if _sampled_entropy(data) > ENTROPY_SKIP:
+        return None, 'high entropy'
+    lz4_family = algorithm in (CompressionAlgorithm.LZ4, CompressionAlgorithm.FASTMAN92_LZ4)
+    compressor = IMGCompressor(CompressionSettings(
+        CompressionAlgorithm.FASTMAN92_LZ4 if lz4_family else CompressionAlgorithm.FASTMAN92_ZLIB,
+        level, fastman92_header=True))
+    if lz4_family:
+        payload = compressor._compress_fastman92_lz4(data)
+    else:
+        payload = compressor._compress_fastman92_zlib(data, level)
+    stored = (len(payload) + SECTOR_SIZE - 1) // SECTOR_SIZE
+    if len(payload) > size * min_ratio or stored >= (size + SECTOR_SIZE - 1) // SECTOR_SIZE:
+        return None, 'no significant compression benefit'
+    return payload, ''
+
+
+def _compress_chunk_worker(data_path: str, items: List[tuple], algorithm_value: str,
+                           level: int, min_ratio: float) -> List[tuple]: #vers 1
+    """Pool task: compress (index, offset, size) ranges of data_path -
+    returns (index, payload or None, reason) for each"""
+    algorithm = CompressionAlgorithm(algorithm_value)
+    results = []
+    with open(data_path, 'rb') as f:
+        try:
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (ValueError, OSError):
+            view = None
+        for index, offset, size in items:
+            try:
+                if view is not None:
+                    data = view[offset:offset + size]
+                else:
+                    f.seek(offset)
+                    data = f.read(size)
+                payload, reason = compress_entry_payload(data, algorithm, level, min_ratio)
+                results.append((index, payload, reason))
+            except Exception as e:
+                results.append((index, None, str(e)))
+        if view is not None:
+            view.release()
+    return results
+
+
+def _plan_compress_chunks(img_file, data_size: int, uncompressed) -> tuple: #vers 1
+    """Pool chunks of about COMPRESS_CHUNK_BYTES in directory order, plus the
+    entries copied as they are (already compressed, pending, past end of file,
+    or sharing a range with an earlier entry) - returns (chunks, copy_as_is)"""
+    chunks, chunk, chunk_bytes = [], [], 0
+    copy_as_is = set()
+    seen = set()
+    for index, entry in enumerate(img_file.entries):
+        key = (entry.offset, entry.size)
+        if (entry._cached_data is not None or entry.compression_type != uncompressed
+                or entry.offset + entry.size > data_size or key in seen):
+            copy_as_is.add(index)
+            continue
+        seen.add(key)
+        chunk.append((index, entry.offset, entry.size))
+        chunk_bytes += entry.size
+        if chunk_bytes >= COMPRESS_CHUNK_BYTES:
+            chunks.append(chunk)
+            chunk, chunk_bytes = [], 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks, copy_as_is
+
+
 def compress_img_entries(img_file, algorithm: CompressionAlgorithm = CompressionAlgorithm.ZLIB, 
-                        level: int = 6, progress_callback: Optional[Callable] = None) -> Dict[str, Any]: #vers 1
-    """Compress entries in IMG file"""
+                        level: int = 6, progress_callback: Optional[Callable] = None,
+                        write: bool = True, max_workers: Optional[int] = None,
+                        min_ratio: float = 0.95, cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]: #vers 4
+    """Compress entries in IMG file across a process pool.
+    Entries whose sampled entropy says they won't shrink are stored as they are.
+    With write, the archive is rebuilt as a stream: compressed payloads
+    (Fastman92 header + zlib/LZ4 block) and untouched entries go straight into a
+    temp file in directory order, which then replaces the archive; the tab's
+    background RW scan is stopped until the archive has been replaced.
+    progress_callback(done, total, message)."""
+    from apps.methods.img_core_classes import CompressionType as EntryCompression, IMGVersion
+    from apps.methods.img_stream_writer import (
+        align_to_sector, copy_file_range_all, pack_directory_record, preallocate, temp_path_for, write_at)
     try:
-        compressor = IMGCompressor(CompressionSettings(algorithm, level))
+        if algorithm not in (CompressionAlgorithm.ZLIB, CompressionAlgorithm.FASTMAN92_ZLIB,
+                             CompressionAlgorithm.LZ4, CompressionAlgorithm.FASTMAN92_LZ4):
+            return {'error': f"Algorithm {algorithm.value} can't be stored in an IMG entry"}
+        if algorithm in (CompressionAlgorithm.LZ4, CompressionAlgorithm.FASTMAN92_LZ4) and not HAS_LZ4:
+            return {'error': "LZ4 not available"}
+
         results = {
             'successful': [],
             'failed': [],
+            'skipped': 0,
+            'skipped_entropy': 0,
             'total_savings': 0,
-            'compression_ratio': 0
+            'compression_ratio': 0,
+            'bytes_written': 0,
+            'workers': 1,
+            'written': False,
+            'cancelled': False
         }
-        
-        total_original = 0
-        total_compressed = 0
-        
-        for i, entry in enumerate(img_file.entries):
-            if progress_callback:
-                progress_callback(i, len(img_file.entries), f"Compressing: {entry.name}")
-            
-            try:
-                data = entry.get_data() if hasattr(entry, 'get_data') else b''
-                if data:
-                    result = compressor.compress_data(data, algorithm, level)
-                    
-                    if result.success and result.compression_ratio < 0.95:  # Only if significant compression
+        entries = img_file.entries
+        total = len(entries)
+        data_path = img_file.get_data_path()
+        data_size = os.path.getsize(data_path)
+        # compression_type is only known once the entry headers are read - already
+        # compressed entries are copied as they are, not compressed again
+        img_file.probe_compressed_entries(entries)
+        chunks, copy_as_is = _plan_compress_chunks(img_file, data_size, EntryCompression.NONE)
+        if not chunks and all(entry._cached_data is None for entry in entries):
+            # Nothing left to compress - the archive stays as it is
+            write = False
+        stored_kind = (EntryCompression.LZ4 if algorithm in (CompressionAlgorithm.LZ4, CompressionAlgorithm.FASTMAN92_LZ4)
+                       else EntryCompression.ZLIB)
+
+        # Output stream: directory space reserved up front, payloads appended in directory order
+        version_1 = img_file.version != IMGVersion.VERSION_2
+        dir_path = data_path[:-4] + '.dir' if version_1 else None
+        data_start = 0 if version_1 else align_to_sector(8 + total * 32)
+        layout: List[Optional[tuple]] = [None] * total
+        compressed_kind: Dict[int, int] = {}      # index -> original size
+        placed: Dict[tuple, int] = {}             # source range -> index already written
+        position = [data_start]
+        dst_fd = src_fd = None
+        temp_path = temp_path_for(data_path)
+        scan = None
+
+        def store(index, payload=None):
+            """Place entry index at the end of the output - payload, or its current bytes"""
+            entry = entries[index]
+            key = (entry.offset, entry.size)
+            if payload is None and entry._cached_data is None and key in placed:
+                layout[index] = layout[placed[key]]
+                if placed[key] in compressed_kind:
+                    compressed_kind[index] = compressed_kind[placed[key]]
+                return
+            if payload is not None:
+                size = len(payload)
+                if write:
+                    write_at(dst_fd, payload, position[0])
+                compressed_kind[index] = entry.size
+            elif entry._cached_data is not None:
+                size = len(entry._cached_data)
+                if write:
+                    write_at(dst_fd, entry._cached_data, position[0])
+            else:
+                size = min(entry.size, max(0, data_size - entry.offset))
+                if write and size:
+                    copy_file_range_all(src_fd, dst_fd, entry.offset, position[0], size)
+            layout[index] = (position[0], size)
+            if entry._cached_data is None:
+                placed[key] = index
+            position[0] += align_to_sector(size)
+
+        outcome: Dict[int, tuple] = {}
+        next_index = [0]
+        last_report = [0.0]
+
+        def flush():
+            """Write every entry whose turn has come (directory order)"""
+            while next_index[0] < total:
+                index = next_index[0]
+                if index in copy_as_is:
+                    store(index)
+                elif index in outcome:
+                    payload, reason = outcome.pop(index)
+                    entry = entries[index]
+                    if payload is not None:
                         results['successful'].append({
                             'name': entry.name,
-                            'original_size': result.original_size,
-                            'compressed_size': result.compressed_size,
-                            'savings': result.original_size - result.compressed_size,
-                            'ratio': result.compression_ratio
+                            'original_size': entry.size,
+                            'compressed_size': len(payload),
+                            'savings': entry.size - len(payload),
+                            'ratio': len(payload) / entry.size
                         })
-                        
-                        total_original += result.original_size
-                        total_compressed += result.compressed_size
-                        results['total_savings'] += result.original_size - result.compressed_size
-                        
-                        # Update entry with compressed data (would need IMG file modification support)
-                        # entry.compressed_data = compressed_data
-                        # entry.is_compressed = True
-                    
+                    elif reason == 'high entropy':
+                        results['skipped_entropy'] += 1
+                    elif reason == 'too small':
+                        results['skipped'] += 1
                     else:
-                        results['failed'].append({
-                            'name': entry.name,
-                            'reason': 'No significant compression benefit'
-                        })
-                        
-            except Exception as e:
-                results['failed'].append({
-                    'name': entry.name,
-                    'reason': str(e)
-                })
-        
+                        results['failed'].append({'name': entry.name, 'reason': reason})
+                    store(index, payload)
+                else:
+                    break
+                next_index[0] += 1
+
+        def collect(chunk_results):
+            for index, payload, reason in chunk_results:
+                outcome[index] = (payload, reason)
+            flush()
+            now = time.monotonic()
+            if progress_callback and now - last_report[0] >= 0.1:
+                last_report[0] = now
+                progress_callback(next_index[0], total, f"Compressing: {next_index[0]}/{total} entries")
+
+        try:
+            if write:
+                scan = img_file.pause_rw_scan()
+                img_file.close_read_session()
+                src_fd = os.open(data_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+                dst_fd = os.open(temp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+                preallocate(dst_fd, data_start)
+
+            workers = max(1, min(max_workers or os.cpu_count() or 1, len(chunks)))
+            input_bytes = sum(size for chunk in chunks for _, _, size in chunk)
+            if workers == 1 or input_bytes < POOL_MIN_BYTES:
+                workers = 1
+                for chunk in chunks:
+                    if cancelled is not None and cancelled():
+                        results['cancelled'] = True
+                        break
+                    collect(_compress_chunk_worker(data_path, chunk, algorithm.value, level, min_ratio))
+            else:
+                # Bounded window keeps finished-but-unwritten payloads to a few chunks per worker
+                context = multiprocessing.get_context('spawn')
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                    futures = []
+                    submitted = 0
+                    while submitted < len(chunks) or futures:
+                        while submitted < len(chunks) and len(futures) < workers * 2:
+                            futures.append(pool.submit(_compress_chunk_worker, data_path, chunks[submitted],
+                                                       algorithm.value, level, min_ratio))
+                            submitted += 1
+                        collect(futures.pop(0).result())
+                        if cancelled is not None and cancelled():
+                            results['cancelled'] = True
+                            for future in futures:
+                                future.cancel()
+                            break
+            flush()
+
+            if write and not results['cancelled'] and next_index[0] == total:
+                records = b''.join(pack_directory_record(offset, size, entry.name)
+                                   for entry, (offset, size) in zip(entries, layout))
+                end = max(position[0], align_to_sector(data_start))
+                if version_1:
+                    with open(temp_path_for(dir_path), 'wb') as f:
+                        f.write(records)
+                        f.flush()
+                        os.fsync(f.fileno())
+                else:
+                    write_at(dst_fd, b'VER2' + struct.pack('<I', total) + records, 0)
+                os.ftruncate(dst_fd, end)
+                os.fsync(dst_fd)
+                os.close(dst_fd)
+                dst_fd = None
+                os.close(src_fd)
+                src_fd = None
+                os.replace(temp_path, data_path)
+                results['bytes_written'] = end
+                if version_1:
+                    os.replace(temp_path_for(dir_path), dir_path)
+
+                img_file._apply_layout(layout)
+                for index, original_size in compressed_kind.items():
+                    entries[index].compression_type = stored_kind
+                    entries[index].uncompressed_size = original_size
+                    entries[index].compression_level = level
+                img_file._directory_written(records)
+                results['written'] = True
+        finally:
+            if dst_fd is not None:
+                os.close(dst_fd)
+                for path in (temp_path, dir_path and temp_path_for(dir_path)):
+                    if path and os.path.exists(path):
+                        os.remove(path)
+            if src_fd is not None:
+                os.close(src_fd)
+            img_file.resume_rw_scan(scan)
+
+        results['workers'] = workers
         if progress_callback:
-            progress_callback(len(img_file.entries), len(img_file.entries), "Complete")
-        
+            progress_callback(total, total, "Complete")
+
+        total_original = sum(item['original_size'] for item in results['successful'])
+        total_compressed = sum(item['compressed_size'] for item in results['successful'])
+        results['total_savings'] = total_original - total_compressed
         results['compression_ratio'] = total_compressed / total_original if total_original > 0 else 1.0
-        
         return results
         
     except Exception as e:
@@ -619,6 +979,7 @@ __all__ = [
     'CompressionAnalyzer',
     'get_compression_ratio_analysis',
     'analyze_compression_potential',
+    'compress_entry_payload',
     'compress_img_entries',
     'decompress_img_entries',
     'get_available_algorithms',
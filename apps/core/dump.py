@@ -1,4 +1,4 @@
-#this belongs in core/dump.py - Version: 12
+#this belongs in core/dump.py - Version: 14
 # X-Seti - September04 2025 - IMG Factory 1.5 - Clean Dump Functions
 
 import os
@@ -6,9 +6,10 @@ import platform
 import subprocess
 from pathlib import Path
 from typing import List, Optional
-from PyQt6.QtWidgets import QMessageBox, QProgressDialog, QFileDialog, QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QMessageBox, QProgressDialog, QFileDialog
+from PyQt6.QtCore import Qt, QEventLoop
 from apps.methods.tab_system import get_current_file_from_active_tab
+from apps.methods.export_shared import ExportThread
 
 ##Methods list -
 # dump_all_function
@@ -83,43 +84,44 @@ def dump_selected_function(main_window): #vers 13 → FIXED: removed file_object
         return False
 
 
-def _dump_entries(file_object, entries_to_dump, dump_folder, main_window) -> bool: #vers 12
-    """Dump entries using file_object.read_entry_data()"""
+def _dump_entries(file_object, entries_to_dump, dump_folder, main_window) -> bool: #vers 14
+    """Dump entries through the parallel export engine (ExportThread), flat into dump_folder"""
     try:
-        # Check if file object has read_entry_data method
-        if not hasattr(file_object, 'read_entry_data'):
+        if not hasattr(file_object, 'get_data_path'):
             return False
         # Create progress dialog
-        progress_dialog = QProgressDialog("Dumping files...", "Cancel", 0, len(entries_to_dump), main_window)
+        progress_dialog = QProgressDialog("Dumping files...", "Cancel", 0, 100, main_window)
         progress_dialog.setWindowTitle("Dumping Files")
         progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
         progress_dialog.setValue(0)
         progress_dialog.show()
-        dumped_count = 0
+
+        options = {'organize_by_type': False, 'overwrite': True, 'skip_empty': True}
+        thread = ExportThread(main_window, entries_to_dump, dump_folder, options, img_file=file_object)
+        result = {'stats': {}}
+        loop = QEventLoop()
+
+        def on_progress(percent, message):
+            progress_dialog.setValue(percent)
+            progress_dialog.setLabelText(message.replace("Exporting", "Dumping"))
+
+        def on_finished(success, message, stats):
+            result['stats'] = stats if success else {}
+            if not success:
+                print(f"Dump entries error: {message}")
+            loop.quit()
+
+        thread.progress_updated.connect(on_progress)
+        thread.export_completed.connect(on_finished)
+        progress_dialog.canceled.connect(thread.stop_export)
         try:
-            for i, entry in enumerate(entries_to_dump):
-                # Update progress
-                progress_dialog.setValue(i)
-                entry_name = getattr(entry, 'name', f'entry_{i}')
-                progress_dialog.setLabelText(f"Dumping: {entry_name}")
-                QApplication.processEvents()
-                if progress_dialog.wasCanceled():
-                    break
-                # Create output path
-                output_path = os.path.join(dump_folder, entry_name)
-                try:
-                    # Use existing read_entry_data method
-                    entry_data = file_object.read_entry_data(entry)
-                    if entry_data and len(entry_data) > 0:
-                        # Write to file
-                        with open(output_path, 'wb') as f:
-                            f.write(entry_data)
-                        dumped_count += 1
-                except Exception as e:
-                    print(f"Failed to dump {entry_name}: {e}")
+            # Event loop runs while the engine copies - no processEvents per file
+            thread.start()
+            loop.exec()
+            thread.wait()
         finally:
             progress_dialog.close()
-        return dumped_count > 0
+        return result['stats'].get('exported', 0) > 0
     except Exception as e:
         print(f"Dump entries error: {e}")
         return False
@@ -1,4 +1,4 @@
-#this belongs in gui/ gui_search.py - Version: 1
+#this belongs in gui/ gui_search.py - Version: 3
 # X-Seti - July13 2025 - IMG Factory 1.5 - Consolidated Search Functions
 
 """
@@ -7,12 +7,28 @@ All search functionality in one place to avoid conflicts and duplication
 """
 
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-                            QCheckBox, QComboBox, QPushButton, QGroupBox, QMessageBox)
-from PyQt6.QtCore import QTimer, pyqtSignal
+                            QCheckBox, QComboBox, QPushButton, QGroupBox, QMessageBox,
+                            QListWidget, QListWidgetItem, QFileDialog)
+from PyQt6.QtCore import QTimer, pyqtSignal, Qt
 from PyQt6.QtGui import QShortcut, QKeySequence
 from typing import Optional, Dict, Any, List
+import os
 import re
 
+from apps.methods.img_search_index import get_search_index
+from apps.methods.img_asset_index import IMGAssetIndex
+from apps.methods.asset_index_scan import start_asset_index_scan
+
+# File type filter label -> entry extension
+FILE_TYPE_EXTENSIONS = {
+    'Models (DFF)': 'DFF',
+    'Textures (TXD)': 'TXD',
+    'Collision (COL)': 'COL',
+    'Animation (IFP)': 'IFP',
+    'Audio (WAV)': 'WAV',
+    'Scripts (SCM)': 'SCM'
+}
+
 
 class SearchManager:
     """Main search manager for IMG Factory"""
@@ -165,33 +181,25 @@ class SearchManager:
             self.main_window.log_message(f"Search error: {e}")
             return []
     
-    def _find_matches(self, search_text, options):
-        """Find matching entries based on search criteria"""
-        matches = []
-        
+    def _find_matches(self, search_text, options): #vers 2
+        """Find matching entries based on search criteria - through the archive's
+        search index (names lowercased once, longer queries narrow the last result)"""
         # Check if this is a replace operation
         search_mode = options.get('search_mode', 'search')
         replace_text = options.get('replace_text', '')
-        
+
+        file_type = options.get('file_type', 'All Files')
+        matches = get_search_index(self.main_window.current_img).search(
+            search_text,
+            case_sensitive=options.get('case_sensitive', False),
+            whole_word=options.get('whole_word', False),
+            regex=options.get('regex', False),
+            extension=None if file_type == 'All Files' else FILE_TYPE_EXTENSIONS.get(file_type, ''))
+
         # Prepare search text
         if not options.get('case_sensitive', False):
             search_text = search_text.lower()
         
-        for i, entry in enumerate(self.main_window.current_img.entries):
-            entry_name = entry.name
-            
-            # Apply case sensitivity
-            if not options.get('case_sensitive', False):
-                entry_name = entry_name.lower()
-            
-            # File type filter
-            if not self._matches_file_type(entry.name, options.get('file_type', 'All Files')):
-                continue
-            
-            # Check if matches search criteria
-            if self._matches_search_criteria(entry_name, search_text, options):
-                matches.append(i)
-        
         # Handle replace operations
         if search_mode == 'replace_all' and replace_text:
             self._perform_replace_all(matches, search_text, replace_text, options)
@@ -202,7 +210,7 @@ class SearchManager:
         
         return matches
 
-    def _perform_replace_all(self, matches, search_text, replace_text, options):
+    def _perform_replace_all(self, matches, search_text, replace_text, options): #vers 2
         """Perform replace all operation on matched entries"""
         try:
             count = 0
@@ -237,8 +245,8 @@ class SearchManager:
                     if (hasattr(self.main_window, 'gui_layout') and 
                         hasattr(self.main_window.gui_layout, 'table')):
                         table = self.main_window.gui_layout.table
-                        if match_idx < table.rowCount():
-                            table.item(match_idx, 0).setText(new_name)
+                        for row in self._match_rows(table, [match_idx]):
+                            table.item(row, 0).setText(new_name)
             
             self.main_window.log_message(f"Replace All: {count} entries updated")
             QMessageBox.information(
@@ -259,23 +267,13 @@ class SearchManager:
                 f"An error occurred during replace: {str(e)}"
             )
     
-    def _matches_file_type(self, filename, file_type):
+    def _matches_file_type(self, filename, file_type): #vers 2
         """Check if file matches the selected file type filter"""
         if file_type == 'All Files':
             return True
         
         extension = filename.split('.')[-1].upper() if '.' in filename else ''
-        
-        type_mapping = {
-            'Models (DFF)': 'DFF',
-            'Textures (TXD)': 'TXD',
-            'Collision (COL)': 'COL',
-            'Animation (IFP)': 'IFP',
-            'Audio (WAV)': 'WAV',
-            'Scripts (SCM)': 'SCM'
-        }
-        
-        return extension == type_mapping.get(file_type, '')
+        return extension == FILE_TYPE_EXTENSIONS.get(file_type, '')
     
     def _matches_search_criteria(self, entry_name, search_text, options):
         """Check if entry name matches search criteria"""
@@ -290,30 +288,42 @@ class SearchManager:
         else:
             return search_text in entry_name
     
-    def _highlight_matches(self, matches):
-        """Highlight matching entries in table"""
+    def _match_rows(self, table, matches): #vers 1
+        """Table rows of matched entry indices - the entries model knows where each
+        entry is shown (rows may be sorted), plain tables use archive order"""
+        if hasattr(table, 'entry_model'):
+            entries = self.main_window.current_img.entries
+            return table.entry_model.rows_for_entries(entries[i] for i in matches)
+        row_count = table.rowCount()
+        return [row for row in matches if row < row_count]
+
+    def _highlight_matches(self, matches): #vers 2
+        """Highlight matching entries in table - one selection change for all rows"""
         try:
             if not hasattr(self.main_window, 'gui_layout') or not hasattr(self.main_window.gui_layout, 'table'):
                 return
             
             table = self.main_window.gui_layout.table
+            rows = self._match_rows(table, matches)
+            if hasattr(table, 'select_rows'):
+                table.select_rows(rows)
+                return
+
             table.clearSelection()
-            
-            for row in matches:
-                if row < table.rowCount():
-                    table.selectRow(row)
+            for row in rows:
+                table.selectRow(row)
             
         except Exception as e:
             self.main_window.log_message(f"Highlight error: {e}")
     
-    def _select_first_match(self):
+    def _select_first_match(self): #vers 2
         """Select and scroll to first match"""
         try:
             if self.current_matches and hasattr(self.main_window, 'gui_layout'):
                 table = self.main_window.gui_layout.table
-                first_match = self.current_matches[0]
-                if first_match < table.rowCount():
-                    table.scrollToItem(table.item(first_match, 0))
+                rows = self._match_rows(table, self.current_matches[:1])
+                if rows:
+                    table.scrollToItem(table.item(rows[0], 0))
                     self.current_match_index = 0
         except Exception as e:
             self.main_window.log_message(f"Select first match error: {e}")
@@ -360,7 +370,7 @@ class SearchManager:
         
         self._jump_to_current_match()
     
-    def _jump_to_current_match(self):
+    def _jump_to_current_match(self): #vers 2
         """Jump to current match in table"""
         try:
             if (self.current_matches and 
@@ -368,12 +378,16 @@ class SearchManager:
                 hasattr(self.main_window, 'gui_layout')):
                 
                 table = self.main_window.gui_layout.table
-                match_row = self.current_matches[self.current_match_index]
+                rows = self._match_rows(table, [self.current_matches[self.current_match_index]])
                 
-                if match_row < table.rowCount():
-                    table.clearSelection()
-                    table.selectRow(match_row)
-                    table.scrollToItem(table.item(match_row, 0))
+                if rows:
+                    match_row = rows[0]
+                    if hasattr(table, 'select_rows'):
+                        table.select_rows([match_row], current=match_row)
+                    else:
+                        table.clearSelection()
+                        table.selectRow(match_row)
+                        table.scrollToItem(table.item(match_row, 0))
                     
                     self.main_window.log_message(
                         f"🔍 Match {self.current_match_index + 1} of {len(self.current_matches)}"
@@ -398,16 +412,18 @@ class ASearchDialog(QDialog):
     
     search_requested = pyqtSignal(str, dict)
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None): #vers 2
         super().__init__(parent)
         self.matches = []
         self.current_match = -1
+        self.index_thread = None
         self.setWindowTitle("Advanced Search")
         self.setModal(True)
-        self.resize(400, 300)
+        self.resize(500, 450)
         self._setup_ui()
+        self._refresh_asset_index()
     
-    def _setup_ui(self):
+    def _setup_ui(self): #vers 2
         """Setup dialog UI"""
         layout = QVBoxLayout(self)
 
@@ -435,6 +451,10 @@ class ASearchDialog(QDialog):
         self.regex_check = QCheckBox("Regular expression")
         options_layout.addWidget(self.regex_check)
 
+        self.all_archives_check = QCheckBox("All indexed archives (name or * ? wildcards)")
+        self.all_archives_check.toggled.connect(self._on_all_archives_toggled)
+        options_layout.addWidget(self.all_archives_check)
+
         search_layout.addLayout(options_layout)
 
         # File type filter
@@ -458,6 +478,22 @@ class ASearchDialog(QDialog):
         self.results_label.setStyleSheet("color: #666666; font-style: italic;")
         results_layout.addWidget(self.results_label)
 
+        # Cross-archive results - double click opens the archive
+        self.asset_results = QListWidget()
+        self.asset_results.setVisible(False)
+        self.asset_results.itemDoubleClicked.connect(self._open_asset_result)
+        results_layout.addWidget(self.asset_results)
+
+        index_layout = QHBoxLayout()
+        self.index_status_label = QLabel("")
+        self.index_status_label.setStyleSheet("color: #666666;")
+        index_layout.addWidget(self.index_status_label)
+        index_layout.addStretch()
+        self.index_folder_btn = QPushButton("Index Folder...")
+        self.index_folder_btn.clicked.connect(self._index_folder)
+        index_layout.addWidget(self.index_folder_btn)
+        results_layout.addLayout(index_layout)
+
         layout.addWidget(results_group)
 
         # Buttons
@@ -484,12 +520,16 @@ class ASearchDialog(QDialog):
         # Focus on search input
         self.search_input.setFocus()
     
-    def _do_search(self):
+    def _do_search(self): #vers 2
         """Perform search"""
         search_text = self.search_input.text().strip()
         if not search_text:
             QMessageBox.warning(self, "Search", "Please enter search text.")
             return
+
+        if self.all_archives_check.isChecked():
+            self._search_all_archives(search_text)
+            return
         
         options = {
             'case_sensitive': self.case_sensitive_check.isChecked(),
@@ -512,6 +552,96 @@ class ASearchDialog(QDialog):
         if hasattr(self.parent(), 'search_manager'):
             self.parent().search_manager.find_next()
     
+    def _on_all_archives_toggled(self, checked): #vers 1
+        """Cross-archive search only matches names - hide what does not apply"""
+        self.asset_results.setVisible(checked)
+        for widget in (self.case_sensitive_check, self.whole_word_check, self.regex_check, self.find_next_btn):
+            widget.setEnabled(not checked)
+        if not checked:
+            self.find_next_btn.setEnabled(bool(self.matches))
+
+    def _search_all_archives(self, search_text): #vers 1
+        """Query the asset index - every archive under the indexed folders"""
+        try:
+            extension = FILE_TYPE_EXTENSIONS.get(self.type_combo.currentText())
+            with IMGAssetIndex() as index:
+                results = index.find(search_text)
+            if extension:
+                results = [row for row in results if row['type'].upper() == extension]
+
+            self.asset_results.clear()
+            for row in results:
+                item = QListWidgetItem(f"{row['name']}  -  {row['archive']}  ({row['size']:,} bytes)")
+                item.setData(Qt.ItemDataRole.UserRole, row['archive'])
+                self.asset_results.addItem(item)
+
+            if results:
+                archives = len({row['archive'] for row in results})
+                self.results_label.setText(f"Found {len(results)} entries in {archives} archives")
+                self.results_label.setStyleSheet("color: #006600; font-weight: bold;")
+            else:
+                self.results_label.setText("No matches in indexed archives")
+                self.results_label.setStyleSheet("color: #CC0000; font-weight: bold;")
+
+        except Exception as e:
+            print(f"[ERROR] Asset index search failed: {e}")
+            self.results_label.setText(f"Index search error: {e}")
+
+    def _open_asset_result(self, item): #vers 1
+        """Open the archive holding the double clicked entry"""
+        archive = item.data(Qt.ItemDataRole.UserRole)
+        main_window = self.parent()
+        if archive and hasattr(main_window, 'load_file_unified'):
+            main_window.load_file_unified(archive)
+
+    def _index_folder(self): #vers 1
+        """Add a game or project folder to the asset index"""
+        start = getattr(self.parent(), 'game_root', None) or ""
+        folder = QFileDialog.getExistingDirectory(self, "Index IMG Archives In Folder", start)
+        if folder:
+            self._start_index_scan([folder])
+
+    def _refresh_asset_index(self): #vers 1
+        """Bring indexed folders (and the game root) up to date in the background"""
+        try:
+            with IMGAssetIndex() as index:
+                roots = index.roots()
+                summary = index.summary()
+            game_root = getattr(self.parent(), 'game_root', None)
+            if game_root and os.path.isdir(game_root) and os.path.abspath(game_root) not in roots:
+                roots.append(game_root)
+            self.index_status_label.setText(
+                f"Index: {summary['entries']:,} entries in {summary['archives']} archives")
+            self._start_index_scan(roots)
+        except Exception as e:
+            print(f"[WARNING] Asset index unavailable: {e}")
+            self.index_status_label.setText("Index unavailable")
+
+    def _start_index_scan(self, roots): #vers 1
+        if not roots:
+            return
+        thread = start_asset_index_scan(roots)
+        if thread is None:
+            self.index_status_label.setText("Index update already running...")
+            return
+        self.index_thread = thread
+        self.index_folder_btn.setEnabled(False)
+        thread.progress.connect(self._on_index_progress)
+        thread.scan_finished.connect(self._on_index_finished)
+
+    def _on_index_progress(self, done, total, path): #vers 1
+        self.index_status_label.setText(f"Indexing {done}/{total}: {os.path.basename(path)}")
+
+    def _on_index_finished(self, stats, cancelled): #vers 1
+        self.index_thread = None
+        self.index_folder_btn.setEnabled(True)
+        state = "Index update cancelled" if cancelled else "Index up to date"
+        self.index_status_label.setText(
+            f"{state}: {stats['indexed']} archives read, {stats['skipped']} unchanged")
+        # Rerun a cross-archive search so it sees the new entries
+        if not cancelled and self.all_archives_check.isChecked() and self.search_input.text().strip():
+            self._search_all_archives(self.search_input.text().strip())
+
     def update_results(self, match_count, total_entries):
         """Update results display"""
         if match_count > 0:
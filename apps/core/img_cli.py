@@ -0,0 +1,377 @@
+#this belongs in core/img_cli.py - Version: 6
+# X-Seti - October16 2026 - IMG Factory 1.5 - IMG Command Line
+
+"""
+IMG Command Line - Headless IMG tools on the Qt-free format classes.
+Commands: list, extract, add, remove, rebuild, validate, dedupe, index, find.
+Library output ([DEBUG] lines) is hidden unless --verbose is given.
+"""
+
+import os
+import sys
+import fnmatch
+import argparse
+from typing import List, Optional
+
+from apps.methods.library_output import library_output
+
+##Methods list -
+# build_parser
+# cmd_add
+# cmd_dedupe
+# cmd_extract
+# cmd_find
+# cmd_index
+# cmd_list
+# cmd_rebuild
+# cmd_remove
+# cmd_validate
+# main
+# _library_output
+# _open_archive
+# _select_entries
+# _validate_archive
+
+
+_verbose = False
+
+
+def _library_output(): #vers 2
+    """Route library prints to stderr with --verbose, drop them otherwise"""
+    return library_output(_verbose, sys.stderr)
+
+
+def _open_archive(path: str): #vers 1
+    """Open an IMG archive (VER2 .img, or either file of a DIR/IMG pair)"""
+    from apps.methods.img_core_classes import IMGFile
+    if not os.path.exists(path):
+        raise SystemExit(f"error: {path}: no such file")
+    img_file = IMGFile(path)
+    with _library_output():
+        opened = img_file.open()
+    if not opened:
+        raise SystemExit(f"error: {path}: not a readable IMG archive")
+    return img_file
+
+
+def _select_entries(img_file, names: List[str], patterns: List[str]): #vers 1
+    """Entries matching the given names (case-insensitive) or glob patterns - all if none given"""
+    if not names and not patterns:
+        return list(img_file.entries)
+    selected = []
+    for name in names:
+        entry = img_file.get_entry(name)
+        if entry is None:
+            print(f"warning: {name}: not in archive", file=sys.stderr)
+        else:
+            selected.append(entry)
+    for pattern in patterns:
+        pattern = pattern.lower()
+        selected.extend(e for e in img_file.entries if fnmatch.fnmatch(e.name.lower(), pattern))
+    # Keep directory order, drop repeats
+    seen = set()
+    return [e for e in selected if not (id(e) in seen or seen.add(id(e)))]
+
+
+def cmd_list(args) -> int: #vers 1
+    """List entries: offset, size, name (and type / RW version with --long)"""
+    from apps.methods.img_core_classes import format_file_size
+    img_file = _open_archive(args.archive)
+    entries = _select_entries(img_file, [], args.pattern or [])
+    for entry in entries:
+        if args.long:
+            print(f"{entry.offset:>12} {entry.size:>10}  {entry.name:<24} {entry.extension:<5} {entry.rw_version_name or ''}")
+        else:
+            print(entry.name)
+    if args.long:
+        total = sum(e.size for e in entries)
+        print(f"{len(entries)} entries, {format_file_size(total)}")
+    return 0
+
+
+def cmd_extract(args) -> int: #vers 2
+    """Extract entries into a folder with the parallel zero-copy export engine"""
+    from apps.methods.img_export_engine import export_entries
+    img_file = _open_archive(args.archive)
+    entries = _select_entries(img_file, args.names, args.pattern or [])
+    stats = export_entries(img_file, entries, args.output, max_workers=args.jobs)
+    for name in stats['failed_names']:
+        print(f"error: {name}: export failed", file=sys.stderr)
+    print(f"Extracted {stats['exported']}/{len(entries)} entries to {args.output}")
+    return 1 if stats['failed'] else 0
+
+
+def cmd_add(args) -> int: #vers 1
+    """Add or replace entries from files, then save once"""
+    img_file = _open_archive(args.archive)
+    added = 0
+    for path in args.files:
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"error: {path}: {e}", file=sys.stderr)
+            continue
+        with _library_output():
+            ok = img_file.add_entry(os.path.basename(path), data, auto_save=False)
+        if ok:
+            added += 1
+        else:
+            print(f"error: {path}: could not add", file=sys.stderr)
+    if not added:
+        return 1
+    with _library_output():
+        saved = img_file.save_img_file()
+    if not saved:
+        print(f"error: {args.archive}: save failed", file=sys.stderr)
+        return 1
+    print(f"Added {added}/{len(args.files)} files")
+    return 0 if added == len(args.files) else 1
+
+
+def cmd_remove(args) -> int: #vers 2
+    """Remove entries by name or pattern, then save once"""
+    img_file = _open_archive(args.archive)
+    entries = _select_entries(img_file, args.names, args.pattern or [])
+    if not entries:
+        print("Nothing to remove")
+        return 1
+    with _library_output():
+        removed = img_file.remove_entries([entry.name for entry in entries])
+        saved = img_file.save_img_file(full_rebuild=args.rebuild)
+    if not saved:
+        print(f"error: {args.archive}: save failed", file=sys.stderr)
+        return 1
+    print(f"Removed {removed} entries")
+    return 0
+
+
+def cmd_rebuild(args) -> int: #vers 2
+    """Rebuild archives - fast compacts in place, safe streams into a new file,
+    dedupe streams into a new file with identical entries sharing their data.
+    Several archives are spread over the batch process pool."""
+    if len(args.archives) > 1:
+        from apps.methods.img_batch_rebuild import run_batch_rebuild
+        results = run_batch_rebuild(args.archives, args.mode, args.jobs, args.per_disk)
+        failed = 0
+        for result in results:
+            print(f"{result['file_path']}: {result['message']}")
+            failed += 0 if result['success'] else 1
+        return 1 if failed else 0
+
+    img_file = _open_archive(args.archives[0])
+    before = os.path.getsize(img_file.get_data_path())
+    with _library_output():
+        if args.mode == "fast":
+            ok = img_file.compact_img_file()
+        else:
+            ok = img_file.rebuild_img_file(deduplicate=(args.mode == "dedupe"))
+    if not ok:
+        print(f"error: {args.archives[0]}: rebuild failed", file=sys.stderr)
+        return 1
+    after = os.path.getsize(img_file.get_data_path())
+    print(f"{args.archives[0]}: {before} -> {after} bytes")
+    if args.mode == "dedupe":
+        stats = img_file.last_rebuild_stats
+        print(f"{stats.get('shared_entries', 0)} entries share data, {stats.get('bytes_saved', 0)} bytes saved")
+    return 0
+
+
+def _validate_archive(img_file) -> List[str]: #vers 2
+    """Structural problems: duplicate names, overlaps, entries past the end of the data file"""
+    from apps.methods.img_core_classes import IMGVersion
+    problems = []
+    data_size = os.path.getsize(img_file.get_data_path())
+
+    seen = {}
+    for entry in img_file.entries:
+        key = entry.name.lower()
+        if key in seen:
+            problems.append(f"duplicate name: {entry.name}")
+        seen[key] = entry
+        if entry.offset % 2048:
+            problems.append(f"{entry.name}: offset 0x{entry.offset:X} not sector aligned")
+        if entry.offset + entry.size > data_size:
+            problems.append(f"{entry.name}: data ends at {entry.offset + entry.size}, file is {data_size} bytes")
+
+    if img_file.version == IMGVersion.VERSION_2:
+        directory_end = 8 + len(img_file.entries) * 32
+        for entry in img_file.entries:
+            if entry.size and entry.offset < directory_end:
+                problems.append(f"{entry.name}: data inside the directory (0x{entry.offset:X})")
+
+    directory = img_file.get_directory()
+    entries = list(img_file.entries)
+    # Entries pointing at exactly the same range are deduplicated, not broken
+    for first, second in directory.find_overlaps(ignore_shared=True):
+        problems.append(f"overlap: {entries[first].name} / {entries[second].name}")
+    return problems
+
+
+def cmd_validate(args) -> int: #vers 1
+    """Check archive structure; exit status 1 when problems are found"""
+    status = 0
+    for path in args.archives:
+        img_file = _open_archive(path)
+        problems = _validate_archive(img_file)
+        stats = img_file.get_free_space_map().get_stats()
+        for problem in problems:
+            print(f"{path}: {problem}")
+        print(f"{path}: {len(img_file.entries)} entries, {len(problems)} problems, "
+              f"{stats['free_bytes']} bytes free in {stats['hole_count']} holes")
+        if problems:
+            status = 1
+    return status
+
+
+def cmd_dedupe(args) -> int: #vers 2
+    """Report duplicate entries; --remove drops later copies (first one kept) and saves"""
+    from apps.methods.img_duplicates import (
+        find_duplicates_by_hash, find_duplicates_by_name, find_duplicates_by_size)
+    img_file = _open_archive(args.archive)
+    with img_file:
+        if args.by == "name":
+            groups = find_duplicates_by_name(img_file)
+        elif args.by == "size":
+            groups = find_duplicates_by_size(img_file)
+        else:
+            groups = find_duplicates_by_hash(img_file)
+
+    for key, names in groups.items():
+        print(f"{key}: {', '.join(names)}")
+    extra = sum(len(names) - 1 for names in groups.values())
+    print(f"{len(groups)} duplicate groups, {extra} extra copies")
+
+    if args.remove and extra:
+        if args.by == "size":
+            print("error: --remove needs --by hash or --by name", file=sys.stderr)
+            return 1
+        with _library_output():
+            if args.by == "name":
+                # Same name - drop the later directory records
+                for names in groups.values():
+                    for name in names[1:]:
+                        index = max(i for i, e in enumerate(img_file.entries) if e.name == name)
+                        img_file.entries.pop(index)
+            else:
+                img_file.remove_entries([name for names in groups.values() for name in names[1:]])
+            saved = img_file.save_img_file()
+        if not saved:
+            print(f"error: {args.archive}: save failed", file=sys.stderr)
+            return 1
+        print(f"Removed {extra} entries")
+    return 0
+
+
+def cmd_index(args) -> int: #vers 1
+    """Index every archive under the folders into the cross-archive asset index"""
+    from apps.methods.img_asset_index import IMGAssetIndex
+    status = 0
+    with IMGAssetIndex(args.db) as index:
+        for root in args.folders:
+            if not os.path.isdir(root):
+                print(f"error: {root}: not a folder", file=sys.stderr)
+                status = 1
+                continue
+            with _library_output():
+                stats = index.update_folder(root, hash_entries=args.hash)
+            print(f"{root}: {stats['archives']} archives, {stats['indexed']} indexed "
+                  f"({stats['entries']} entries), {stats['skipped']} unchanged, "
+                  f"{stats['removed']} removed, {stats['failed']} failed")
+            if stats['failed']:
+                status = 1
+        summary = index.summary()
+    print(f"Index: {summary['entries']} entries in {summary['archives']} archives")
+    return status
+
+
+def cmd_find(args) -> int: #vers 1
+    """Look entry names up in the asset index; exit status 1 when nothing matches"""
+    from apps.methods.img_asset_index import IMGAssetIndex
+    with IMGAssetIndex(args.db) as index:
+        results = index.find(args.query, limit=args.limit, root=args.root)
+    for row in results:
+        print(f"{row['archive']}\t{row['offset']:>10}\t{row['size']:>10}\t{row['name']}")
+    return 0 if results else 1
+
+
+def build_parser() -> argparse.ArgumentParser: #vers 4
+    """Argument parser for all commands"""
+    parser = argparse.ArgumentParser(prog="imgcli", description="IMG Factory command line tools")
+    parser.add_argument('-v', '--verbose', action='store_true', help="show library debug output")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('list', help="list entries")
+    p.add_argument('archive')
+    p.add_argument('-l', '--long', action='store_true', help="offset, size, type and RW version")
+    p.add_argument('-p', '--pattern', action='append', help="glob filter, e.g. '*.dff'")
+    p.set_defaults(func=cmd_list)
+
+    p = commands.add_parser('extract', help="extract entries")
+    p.add_argument('archive')
+    p.add_argument('names', nargs='*')
+    p.add_argument('-p', '--pattern', action='append', help="glob filter, e.g. '*.txd'")
+    p.add_argument('-o', '--output', default='.', help="output folder")
+    p.add_argument('-j', '--jobs', type=int, default=None, help="copy threads")
+    p.set_defaults(func=cmd_extract)
+
+    p = commands.add_parser('add', help="add or replace entries from files")
+    p.add_argument('archive')
+    p.add_argument('files', nargs='+')
+    p.set_defaults(func=cmd_add)
+
+    p = commands.add_parser('remove', help="remove entries")
+    p.add_argument('archive')
+    p.add_argument('names', nargs='*')
+    p.add_argument('-p', '--pattern', action='append', help="glob filter")
+    p.add_argument('--rebuild', action='store_true', help="rebuild instead of rewriting the directory only")
+    p.set_defaults(func=cmd_remove)
+
+    p = commands.add_parser('rebuild', help="rebuild / compact archives")
+    p.add_argument('archives', nargs='+')
+    p.add_argument('-m', '--mode', choices=['fast', 'safe', 'dedupe'], default='fast',
+                   help="fast: compact in place, safe: stream into a new file, "
+                        "dedupe: safe + identical entries share one copy")
+    p.add_argument('-j', '--jobs', type=int, default=None, help="worker processes (several archives)")
+    p.add_argument('--per-disk', type=int, default=2, help="archives busy at once per disk")
+    p.set_defaults(func=cmd_rebuild)
+
+    p = commands.add_parser('validate', help="check archive structure")
+    p.add_argument('archives', nargs='+')
+    p.set_defaults(func=cmd_validate)
+
+    p = commands.add_parser('dedupe', help="find (and remove) duplicate entries")
+    p.add_argument('archive')
+    p.add_argument('--by', choices=['hash', 'name', 'size'], default='hash')
+    p.add_argument('--remove', action='store_true', help="remove later copies and save")
+    p.set_defaults(func=cmd_dedupe)
+
+    p = commands.add_parser('index', help="index all archives under folders for 'find'")
+    p.add_argument('folders', nargs='+')
+    p.add_argument('--hash', action='store_true', help="also store content hashes")
+    p.add_argument('--db', default=None, help="index database (default: user cache folder)")
+    p.set_defaults(func=cmd_index)
+
+    p = commands.add_parser('find', help="find entries in all indexed archives")
+    p.add_argument('query', help="name part, or glob with * ? [")
+    p.add_argument('--root', default=None, help="only archives under this folder")
+    p.add_argument('-n', '--limit', type=int, default=500)
+    p.add_argument('--db', default=None, help="index database (default: user cache folder)")
+    p.set_defaults(func=cmd_find)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int: #vers 1
+    """CLI entry point - returns the exit status"""
+    global _verbose
+    args = build_parser().parse_args(argv)
+    _verbose = args.verbose
+
+    from apps.debug.img_debugger import img_debugger
+    img_debugger.log_to_console = _verbose
+    img_debugger.log_to_file = False
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-#this belongs in core/img_merger.py - Version: 9
+#this belongs in core/img_merger.py - Version: 10
 # X-Seti - September26 2025 - IMG Factory 1.5 - IMG Merge Functions
 # Credit MexUK 2007 IMG Factory 1.2
 
@@ -9,7 +9,6 @@ Option 2: Pick 2 IMG files from folder to merge
 """
 
 import os
-import struct
 from typing import List, Optional, Dict, Any
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -20,7 +19,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
 # Import core IMG functions
-from apps.methods.img_core_classes import IMGFile, IMGVersion, IMGEntry
+from apps.methods.img_core_classes import IMGVersion
+from apps.methods.img_archive_merge import merge_archives, unique_entry_name
 
 ##Methods list -
 # merge_img_function
@@ -33,8 +33,8 @@ from apps.methods.img_core_classes import IMGFile, IMGVersion, IMGEntry
 # IMGMergeDialog
 # MergeWorkerThread
 
-class MergeWorkerThread(QThread): #vers 3
-    """Worker thread for IMG merging operations"""
+class MergeWorkerThread(QThread): #vers 4
+    """Worker thread for IMG merging operations - streams entry data source to output"""
     progress_updated = pyqtSignal(int, str)
     merge_completed = pyqtSignal(bool, str)
 
@@ -44,236 +44,35 @@ class MergeWorkerThread(QThread): #vers 3
         self.output_path = output_path
         self.options = options
 
-    def run(self):
-        """Run merge operation in thread"""
+    def run(self): #vers 4
+        """Run merge operation in thread - one directory pass per source, then one streamed write"""
         try:
-            self.progress_updated.emit(10, "Initializing merge operation...")
-
-            # Collect all entries from source files
-            all_entries = []
-            existing_names = set()
-            total_entries = 0
-            successful_entries = 0
-            skipped_entries = 0
-            duplicate_strategy = self.options.get('duplicate_strategy', 'rename')
-
-            # Count total entries
-            for img_path in self.source_imgs:
-                try:
-                    temp_img = IMGFile(img_path)
-                    if temp_img.open():
-                        total_entries += len(temp_img.entries)
-                        temp_img.close()
-                except Exception:
-                    continue
-
-            self.progress_updated.emit(20, f"Processing {total_entries} entries from {len(self.source_imgs)} IMG files...")
-
-            processed_entries = 0
-
-            # Collect entries from each source IMG
-            for i, img_path in enumerate(self.source_imgs):
-                try:
-                    source_img = IMGFile(img_path)
-                    if not source_img.open():
-                        self.progress_updated.emit(
-                            20 + (i * 60 // len(self.source_imgs)),
-                            f"Failed to open: {os.path.basename(img_path)}"
-                        )
-                        continue
-
-                    self.progress_updated.emit(
-                        20 + (i * 60 // len(self.source_imgs)),
-                        f"Reading from: {os.path.basename(img_path)} ({len(source_img.entries)} entries)"
-                    )
-
-                    # Open file manually for reading entry data
-                    with open(img_path, 'rb') as img_file:
-                        # Read entries from this IMG
-                        for entry in source_img.entries:
-                            processed_entries += 1
-
-                            # Handle duplicates
-                            final_name = entry.name
-                            if entry.name in existing_names:
-                                if duplicate_strategy == 'skip':
-                                    skipped_entries += 1
-                                    continue
-                                elif duplicate_strategy == 'rename':
-                                    final_name = self._generate_unique_name(entry.name, existing_names)
-
-                            # Read entry data from file
-                            try:
-                                img_file.seek(entry.offset)
-                                entry_data = img_file.read(entry.size)
-
-                                if not entry_data or len(entry_data) == 0:
-                                    skipped_entries += 1
-                                    continue
-
-                                # DEBUG: Print actual size being stored
-                                actual_size = len(entry_data)
-                                print(f"DEBUG: {final_name} - read {actual_size} bytes")
-
-                                # Store entry info
-                                all_entries.append({
-                                    'name': final_name,
-                                    'data': entry_data,
-                                    'size': actual_size  # Use calculated size, not len(entry_data)
-                                })
-
-                                existing_names.add(final_name)
-                                successful_entries += 1
-
-                            except Exception:
-                                skipped_entries += 1
-                                continue
-
-                            # Update progress
-                            if processed_entries % 50 == 0:
-                                progress = 20 + (processed_entries * 60 // total_entries)
-                                self.progress_updated.emit(
-                                    progress,
-                                    f"Processed {processed_entries}/{total_entries} entries"
-                                )
-
-                    source_img.close()
-
-                except Exception:
-                    continue
-
-            if successful_entries == 0:
-                self.merge_completed.emit(False, "No entries were successfully read")
-                return
-
-            self.progress_updated.emit(80, "Writing merged IMG file...")
-
-            version = self.options.get('version', IMGVersion.VERSION_2)
-
-            try:
-                with open(self.output_path, 'wb') as out_file:
-                    # Write version header (4 bytes)
-                    if version == IMGVersion.VERSION_2:
-                        out_file.write(b'VER2')
-                    else:
-                        out_file.write(b'VER\x01')
-
-                    # Write number of entries (4 bytes at offset 4)
-                    out_file.write(struct.pack('<I', successful_entries))
-
-                    # Calculate where data starts (after header + directory)
-                    # Header: 8 bytes (VER2 + count)
-                    # Directory: 32 bytes per entry (offset 4 + size 4 + name 24)
-                    data_start = 8 + (successful_entries * 32)
-
-                    # Align to 2048 byte boundary
-                    if data_start < 2048:
-                        data_start = 2048
-
-                    current_offset = data_start
-
-                    # Build directory entries
-                    directory_data = b''
-                    for entry_info in all_entries:
-                        # Get size from entry_info
-                        size_value = entry_info.get('size', 0)
-
-                        # DEBUG: Verify size before packing
-                        print(f"WRITE: {entry_info['name']} - size={size_value}")
-
-                        if size_value == 0:
-                            print(f"WARNING: {entry_info['name']} has 0 size!")
-
-                        # Offset (4 bytes)
-                        directory_data += struct.pack('<I', current_offset)
-                        # Size (4 bytes)
-                        directory_data += struct.pack('<I', size_value)
-                        # Name (24 bytes, null-terminated/padded)
-                        name_bytes = entry_info['name'].encode('ascii', errors='replace')[:23]
-                        name_bytes = name_bytes.ljust(24, b'\x00')
-                        directory_data += name_bytes
-
-                        current_offset += size_value
-
-                    # Write directory at offset 8
-                    out_file.seek(8)
-                    out_file.write(directory_data)
-
-                    # Pad to data start offset
-                    out_file.seek(data_start)
-
-                    # Write all entry data
-                    for entry_info in all_entries:
-                        out_file.write(entry_info['data'])
-
-
-
-                self.progress_updated.emit(100, "Merge complete!")
-
-                # Verify output
-                if os.path.exists(self.output_path):
-                    file_size = os.path.getsize(self.output_path)
-                    success_msg = (
-                        f"Merge completed successfully!\n\n"
-                        f"Output: {os.path.basename(self.output_path)}\n"
-                        f"Total entries: {successful_entries}\n"
-                        f"Skipped: {skipped_entries}\n"
-                        f"Size: {file_size / (1024*1024):.1f} MB"
-                    )
-                    self.merge_completed.emit(True, success_msg)
-                else:
-                    self.merge_completed.emit(False, "Output file was not created")
-
-            except Exception as e:
-                self.merge_completed.emit(False, f"Failed to write merged IMG: {str(e)}")
+            self.progress_updated.emit(0, f"Reading {len(self.source_imgs)} IMG directories...")
+            stats = merge_archives(
+                self.source_imgs, self.output_path,
+                version=self.options.get('version', IMGVersion.VERSION_2),
+                duplicate_strategy=self.options.get('duplicate_strategy', 'rename'),
+                progress_callback=self.progress_updated.emit)
+
+            self.progress_updated.emit(100, "Merge complete!")
+            skipped = stats['skipped'] + stats['invalid']
+            success_msg = (
+                f"Merge completed successfully!\n\n"
+                f"Output: {os.path.basename(self.output_path)}\n"
+                f"Total entries: {stats['entries']}\n"
+                f"Renamed: {stats['renamed']}, Replaced: {stats['replaced']}\n"
+                f"Skipped: {skipped}\n"
+                f"Size: {stats['output_size'] / (1024*1024):.1f} MB"
+            )
+            if stats['failed_sources']:
+                failed = ', '.join(os.path.basename(path) for path in stats['failed_sources'])
+                success_msg += f"\n\nCould not open: {failed}"
+            self.merge_completed.emit(True, success_msg)
 
         except Exception as e:
             self.merge_completed.emit(False, f"Merge failed: {str(e)}")
 
 
-    def merge_completed(self, success: bool, message: str):
-        """Handle merge completion"""
-        self.progress_bar.setVisible(False)
-        self.progress_label.setVisible(False)
-        self.merge_btn.setEnabled(True)
-
-        if success:
-            QMessageBox.information(self, "Merge Complete", message)
-
-            # Ask if user wants to open the merged file
-            reply = QMessageBox.question(
-                self,
-                "Open Merged File?",
-                "Would you like to open the merged IMG file now?"
-            )
-
-            if reply == QMessageBox.StandardButton.Yes and self.parent():
-                # Load the merged file in main window
-                self.parent()._load_img_file_in_new_tab(self.output_path)
-
-            self.accept()
-        else:
-            QMessageBox.critical(self, "Merge Failed", message)
-
-        def _generate_unique_name(self, base_name: str, existing_names: set) -> str:
-            """Generate unique name for duplicate entries"""
-            if '.' in base_name:
-                name_part, ext = base_name.rsplit('.', 1)
-            else:
-                name_part, ext = base_name, ''
-
-            counter = 1
-            while True:
-                if ext:
-                    new_name = f"{name_part}_{counter}.{ext}"
-                else:
-                    new_name = f"{name_part}_{counter}"
-
-                if new_name not in existing_names:
-                    return new_name
-                counter += 1
-
-
 class IMGMergeDialog(QDialog): #vers 3
     """Dialog for merging IMG files with 2 options"""
 
@@ -640,10 +439,17 @@ def merge_img_function(main_window): #vers 5
         QMessageBox.critical(main_window, "Merge Error", f"Failed to show merge dialog: {str(e)}")
 
 
-def merge_from_open_tabs(tab_paths: List[str], output_path: str, **options) -> bool: #vers 1
-    """Merge IMG files from open tabs - Option 1"""
-    # This would use the same logic as MergeWorkerThread but synchronously
-    return False
+def merge_from_open_tabs(tab_paths: List[str], output_path: str, **options) -> bool: #vers 2
+    """Merge IMG files from open tabs - Option 1 (synchronous, same engine as MergeWorkerThread)"""
+    try:
+        merge_archives(tab_paths, output_path,
+                       version=options.get('version', IMGVersion.VERSION_2),
+                       duplicate_strategy=options.get('duplicate_strategy', 'rename'),
+                       progress_callback=options.get('progress_callback'))
+        return True
+    except Exception as e:
+        print(f"[ERROR] Merge failed: {e}")
+        return False
 
 
 def merge_from_files(file_paths: List[str], output_path: str, **options) -> bool: #vers 1
@@ -662,23 +468,10 @@ def show_merge_dialog(parent=None) -> Optional[str]: #vers 1
         return None
 
 
-def _generate_unique_name(base_name: str, existing_names: set) -> str: #vers 1
+def _generate_unique_name(base_name: str, existing_names: set) -> str: #vers 2
     """Generate unique name for duplicate entries"""
-    if '.' in base_name:
-        name_part, ext = base_name.rsplit('.', 1)
-    else:
-        name_part, ext = base_name, ''
-
-    counter = 1
-    while True:
-        if ext:
-            new_name = f"{name_part}_{counter}.{ext}"
-        else:
-            new_name = f"{name_part}_{counter}"
-
-        if new_name not in existing_names:
-            return new_name
-        counter += 1
+    taken = {name.lower() for name in existing_names}
+    return unique_entry_name(base_name, taken)
 
 
 __all__ = [
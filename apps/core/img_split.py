@@ -1,4 +1,4 @@
-#this belongs in core/img_split.py - Version: 3
+#this belongs in core/img_split.py - Version: 4
 # X-Seti - July31 2025 - IMG Factory 1.5 - Complete Split Functions
 
 """
@@ -7,7 +7,6 @@ Split IMG files using IDE data to organize models and textures
 """
 
 import os
-import struct
 from typing import Dict, List, Set, Optional, Tuple
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QPushButton,
@@ -18,6 +17,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 
+from apps.methods.img_split_writer import (
+    SPLIT_FOLDER, SPLIT_IMG_V1, SPLIT_IMG_V2, plan_split, write_split)
+
 ##Methods list -
 # split_img
 # split_img_via
@@ -122,40 +124,6 @@ class IDEParser:
             print(f"Error parsing IDE file {ide_path}: {e}")
             return False
     
-    def _remove_split_files_from_original(self, file_groups: Dict[str, List]): #vers 1
-        """Remove split files from original IMG if preserve_structure is unchecked"""
-        try:
-            # Collect all files that were split out
-            split_files = set()
-            for group_name, files in file_groups.items():
-                for entry in files:
-                    split_files.add(entry.name.lower())
-            
-            # Remove split files from original IMG
-            original_count = len(self.img_file.entries)
-            self.img_file.entries = [
-                entry for entry in self.img_file.entries 
-                if entry.name.lower() not in split_files
-            ]
-            
-            removed_count = original_count - len(self.img_file.entries)
-            
-            # Save the modified original IMG
-            if hasattr(self.img_file, 'save_img_file'):
-                self.img_file.save_img_file()
-            elif hasattr(self.img_file, '_rebuild_version1') and hasattr(self.img_file, '_rebuild_version2'):
-                if getattr(self.img_file, 'version', 2) == 1:
-                    self.img_file._rebuild_version1()
-                else:
-                    self.img_file._rebuild_version2()
-            
-            self.progress_updated.emit(100, f"Removed {removed_count} files from original IMG")
-            self.stats['removed_from_original'] = removed_count
-            
-        except Exception as e:
-            self.progress_updated.emit(100, f"Warning: Could not modify original IMG: {str(e)}")
-            print(f"Error removing files from original IMG: {e}")
-    
     def _parse_section_entry(self, section: str, line: str, line_num: int): #vers 1
         """Parse individual section entry"""
         parts = [part.strip() for part in line.split(',')]
@@ -633,8 +601,8 @@ class SplitThread(QThread):
             'output_dir': split_options['output_dir']
         }
     
-    def run(self): #vers 1
-        """Run the split operation"""
+    def run(self): #vers 2
+        """Run the split operation - all outputs planned, then one ordered pass over the source"""
         try:
             self.progress_updated.emit(0, "Initializing split operation...")
             
@@ -642,18 +610,24 @@ class SplitThread(QThread):
             self.progress_updated.emit(10, "Analyzing IMG entries...")
             file_groups = self._analyze_files()
             
-            # Create groups
-            self.progress_updated.emit(30, f"Creating {len(file_groups)} file groups...")
-            
-            for i, (group_name, files) in enumerate(file_groups.items()):
-                progress = 30 + int((i / len(file_groups)) * 60)
-                self.progress_updated.emit(progress, f"Processing group: {group_name}")
-                
-                if not self._create_group(group_name, files):
-                    self.split_completed.emit(False, f"Failed to create group: {group_name}", self.stats)
-                    return
-                
-                self.stats['groups_created'] += 1
+            output_format = self.split_options['output_format']
+            if output_format == "Folder Structure":
+                kind = SPLIT_FOLDER
+            elif "IMG v1" in output_format:
+                kind = SPLIT_IMG_V1
+            else:
+                kind = SPLIT_IMG_V2
+            targets = plan_split(file_groups, self.split_options['output_dir'], kind)
+            self.progress_updated.emit(20, f"Writing {len(targets)} outputs for {len(file_groups)} file groups...")
+
+            result = write_split(self.img_file, targets, progress_callback=self._report_progress)
+            self.stats['groups_created'] = len(targets)
+            self.stats['bytes_written'] = result['bytes']
+
+            # Folder groups get a listing of what went into them
+            if kind == SPLIT_FOLDER and self.split_options['create_index']:
+                for target in targets:
+                    self._create_index_file(target.path, target.entries)
             
             self.progress_updated.emit(100, "Split operation completed!")
             
@@ -666,6 +640,45 @@ class SplitThread(QThread):
             
         except Exception as e:
             self.split_completed.emit(False, str(e), self.stats)
+
+    def _report_progress(self, done: int, total: int, target_name: str): #vers 1
+        """Writer progress (already time-coalesced) -> progress_updated, 20-95%"""
+        percent = 20 + (done * 75 // total if total else 75)
+        self.progress_updated.emit(percent, f"Written {done}/{total} entries ({target_name})")
+
+    def _remove_split_files_from_original(self, file_groups: Dict[str, List]): #vers 2
+        """Remove split files from original IMG if preserve_structure is unchecked"""
+        try:
+            # Collect all files that were split out
+            split_files = set()
+            for group_name, files in file_groups.items():
+                for entry in files:
+                    split_files.add(entry.name.lower())
+            
+            # Remove split files from original IMG
+            original_count = len(self.img_file.entries)
+            self.img_file.entries = [
+                entry for entry in self.img_file.entries 
+                if entry.name.lower() not in split_files
+            ]
+            
+            removed_count = original_count - len(self.img_file.entries)
+            
+            # Save the modified original IMG
+            if hasattr(self.img_file, 'save_img_file'):
+                self.img_file.save_img_file()
+            elif hasattr(self.img_file, '_rebuild_version1') and hasattr(self.img_file, '_rebuild_version2'):
+                if getattr(self.img_file, 'version', 2) == 1:
+                    self.img_file._rebuild_version1()
+                else:
+                    self.img_file._rebuild_version2()
+            
+            self.progress_updated.emit(100, f"Removed {removed_count} files from original IMG")
+            self.stats['removed_from_original'] = removed_count
+            
+        except Exception as e:
+            self.progress_updated.emit(100, f"Warning: Could not modify original IMG: {str(e)}")
+            print(f"Error removing files from original IMG: {e}")
     
     def _analyze_files(self) -> Dict[str, List]: #vers 1
         """Analyze IMG files and create groups"""
@@ -724,268 +737,8 @@ class SplitThread(QThread):
         
         return None
     
-    def _create_group(self, group_name: str, files: List) -> bool: #vers 1
-        """Create a file group based on output format"""
-        try:
-            output_format = self.split_options['output_format']
-            
-            if output_format == "Folder Structure":
-                return self._create_folder_group(group_name, files)
-            elif "IMG v1" in output_format:
-                return self._create_img_group(group_name, files, version=1)
-            elif "IMG v2" in output_format:
-                return self._create_img_group(group_name, files, version=2)
-            
-            return False
-            
-        except Exception as e:
-            print(f"Error creating group {group_name}: {e}")
-            return False
-    
-    def _create_folder_group(self, group_name: str, files: List) -> bool: #vers 1
-        """Create folder-based group"""
-        try:
-            group_dir = os.path.join(self.split_options['output_dir'], group_name)
-            os.makedirs(group_dir, exist_ok=True)
-            
-            # Extract files to folder
-            for entry in files:
-                # FIXED: Use correct method to get entry data
-                file_data = self._get_entry_data(entry)
-                file_path = os.path.join(group_dir, entry.name)
-                with open(file_path, 'wb') as f:
-                    f.write(file_data)
-            
-            # Create index file if requested
-            if self.split_options['create_index']:
-                self._create_index_file(group_dir, files)
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error creating folder group: {e}")
-            return False
-    
-    def _create_img_group(self, group_name: str, files: List, version: int) -> bool: #vers 2
-        """Create IMG file group with version limits"""
-        try:
-            # Apply version-specific file limits
-            max_files_v1 = 32652
-            max_files_v2 = 130608  # 4x version 1
-            
-            max_files = max_files_v1 if version == 1 else max_files_v2
-            
-            # Use default limits since size controls were removed
-            effective_max = max_files  # Use full version limit
-            
-            if len(files) > effective_max:
-                # Split into multiple IMG files if too many files
-                return self._create_multiple_img_files(group_name, files, version, effective_max)
-            
-            # Create single IMG file since within limits
-            return self._create_single_img_file(group_name, files, version)
-            
-        except Exception as e:
-            print(f"Error creating IMG group: {e}")
-            return False
-    
-    def _create_multiple_img_files(self, base_name: str, files: List, version: int, max_files: int) -> bool: #vers 1
-        """Create multiple IMG files when file count exceeds limits"""
-        try:
-            # Split files into chunks
-            file_chunks = [files[i:i + max_files] for i in range(0, len(files), max_files)]
-            
-            for i, chunk in enumerate(file_chunks):
-                chunk_name = f"{base_name}_part{i+1:02d}" if len(file_chunks) > 1 else base_name
-                
-                if not self._create_single_img_file(chunk_name, chunk, version):
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error creating multiple IMG files: {e}")
-            return False
-    
-    def _create_single_img_file(self, img_name: str, files: List, version: int) -> bool: #vers 2
-        """Create a single IMG file with proper structure"""
-        try:
-            img_path = os.path.join(self.split_options['output_dir'], f"{img_name}.img")
-            
-            if version == 1:
-                return self._create_version1_img(img_path, img_name, files)
-            else:
-                return self._create_version2_img(img_path, files)
-            
-        except Exception as e:
-            print(f"Error creating single IMG file {img_name}: {e}")
-            return False
-    
-    def _create_version1_img(self, img_path: str, img_name: str, files: List) -> bool: #vers 3
-        """Create Version 1 IMG with proper entry detection - FIXED"""
-        try:
-            from apps.methods.detect_file_type_and_version import create_enhanced_entry
-            
-            dir_path = img_path.replace('.img', '.dir')
-            
-            # Collect entry data and create enhanced entries
-            enhanced_entries = []
-            entry_data_list = []
-            current_offset = 0
-            
-            for file_entry in files:
-                file_data = self._get_entry_data(file_entry)
-                
-                # Skip empty files
-                if not file_data:
-                    print(f"Warning: Skipping empty file {file_entry.name}")
-                    continue
-                
-                # Create enhanced entry with detection capabilities
-                enhanced_entry = create_enhanced_entry(
-                    name=file_entry.name,
-                    offset=current_offset,
-                    size=len(file_data),
-                    file_data=file_data,
-                    img_file=None  # No parent IMG yet
-                )
-                
-                enhanced_entries.append(enhanced_entry)
-                entry_data_list.append(file_data)
-                
-                # Align to sector boundary (2048 bytes)
-                aligned_size = ((len(file_data) + 2047) // 2048) * 2048
-                current_offset += aligned_size
-            
-            if len(enhanced_entries) == 0:
-                print("Error: No valid entries to write")
-                return False
-            
-            # Write DIR file
-            with open(dir_path, 'wb') as f:
-                for entry in enhanced_entries:
-                    # Convert to sectors
-                    offset_sectors = entry.offset // 2048
-                    size_sectors = ((entry.size + 2047) // 2048)
-                    
-                    # Pack entry: offset(4), size(4), name(24)
-                    entry_data = struct.pack('<II', offset_sectors, size_sectors)
-                    name_bytes = entry.name.encode('ascii')[:24].ljust(24, b'\x00')
-                    entry_data += name_bytes
-                    
-                    f.write(entry_data)
-            
-            # Write IMG file
-            with open(img_path, 'wb') as f:
-                for i, data in enumerate(entry_data_list):
-                    f.seek(enhanced_entries[i].offset)
-                    f.write(data)
-                    
-                    # Pad to sector boundary
-                    current_pos = f.tell()
-                    sector_end = ((current_pos + 2047) // 2048) * 2048
-                    if current_pos < sector_end:
-                        f.write(b'\x00' * (sector_end - current_pos))
-            
-            dir_size = os.path.getsize(dir_path)
-            img_size = os.path.getsize(img_path)
-            print(f"✅ Created Version 1 IMG: {len(enhanced_entries)} entries, DIR: {dir_size:,} bytes, IMG: {img_size:,} bytes")
-            return True
-            
-        except Exception as e:
-            print(f"Error creating Version 1 IMG: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-    
-    def _create_version2_img(self, img_path: str, files: List) -> bool: #vers 3
-        """Create Version 2 IMG with proper entry detection - FIXED"""
-        try:
-            from apps.methods.detect_file_type_and_version import create_enhanced_entry
-            
-            entry_count = len(files)
-            
-            # Calculate directory size: VER2(4) + count(4) + entries(32 each)
-            header_size = 8  # VER2 + entry count
-            directory_size = header_size + (entry_count * 32)
-            
-            # Collect entry data and create enhanced entries
-            enhanced_entries = []
-            entry_data_list = []
-            current_offset = directory_size
-            
-            for file_entry in files:
-                file_data = self._get_entry_data(file_entry)
-                
-                # Skip empty files
-                if not file_data:
-                    print(f"Warning: Skipping empty file {file_entry.name}")
-                    continue
-                
-                # Create enhanced entry with detection capabilities
-                enhanced_entry = create_enhanced_entry(
-                    name=file_entry.name,
-                    offset=current_offset,
-                    size=len(file_data),
-                    file_data=file_data,
-                    img_file=None  # No parent IMG yet
-                )
-                
-                enhanced_entries.append(enhanced_entry)
-                entry_data_list.append(file_data)
-                
-                # Align to sector boundary (2048 bytes)
-                aligned_size = ((len(file_data) + 2047) // 2048) * 2048
-                current_offset += aligned_size
-            
-            # Update entry count to match actual valid entries
-            entry_count = len(enhanced_entries)
-            
-            if entry_count == 0:
-                print("Error: No valid entries to write")
-                return False
-            
-            # Write IMG file
-            with open(img_path, 'wb') as f:
-                # Write VER2 header
-                f.write(b'VER2')  # Version identifier
-                f.write(struct.pack('<I', entry_count))  # Entry count
-                
-                # Write directory
-                for entry in enhanced_entries:
-                    # Convert to sectors
-                    offset_sectors = entry.offset // 2048
-                    size_sectors = ((entry.size + 2047) // 2048)
-                    
-                    # Pack entry: offset(4), size(4), name(24)
-                    entry_data = struct.pack('<II', offset_sectors, size_sectors)
-                    name_bytes = entry.name.encode('ascii')[:24].ljust(24, b'\x00')
-                    entry_data += name_bytes
-                    
-                    f.write(entry_data)
-                
-                # Write file data
-                for i, data in enumerate(entry_data_list):
-                    f.seek(enhanced_entries[i].offset)
-                    f.write(data)
-                    
-                    # Pad to sector boundary
-                    current_pos = f.tell()
-                    sector_end = ((current_pos + 2047) // 2048) * 2048
-                    if current_pos < sector_end:
-                        f.write(b'\x00' * (sector_end - current_pos))
-            
-            print(f"✅ Created Version 2 IMG: {entry_count} entries, {os.path.getsize(img_path):,} bytes")
-            return True
-            
-        except Exception as e:
-            print(f"Error creating Version 2 IMG: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-    
-    def _create_index_file(self, group_dir: str, files: List): #vers 1
-        """Create index file for a group"""
+    def _create_index_file(self, group_dir: str, files: List): #vers 2
+        """Create index file for a group - sizes from the directory, no entry data read"""
         try:
             index_path = os.path.join(group_dir, "index.txt")
             
@@ -995,42 +748,10 @@ class SplitThread(QThread):
                 f.write(f"Total files: {len(files)}\n\n")
                 
                 for entry in files:
-                    file_data = self._get_entry_data(entry)
-                    f.write(f"{entry.name} ({len(file_data):,} bytes)\n")
+                    f.write(f"{entry.name} ({entry.size:,} bytes)\n")
             
         except Exception as e:
             print(f"Error creating index file: {e}")
-    
-    def _get_entry_data(self, entry) -> bytes: #vers 1
-        """Get entry data using correct method"""
-        try:
-            # Try cached data first
-            if hasattr(entry, '_cached_data') and entry._cached_data:
-                return entry._cached_data
-            
-            # Try read_data method
-            if hasattr(entry, 'read_data'):
-                return entry.read_data()
-            
-            # Try get_data method
-            if hasattr(entry, 'get_data'):
-                return entry.get_data()
-            
-            # Try direct data attribute
-            if hasattr(entry, 'data'):
-                return entry.data
-            
-            # Use IMG file's read_entry_data method
-            if hasattr(entry, 'img_file') and hasattr(entry.img_file, 'read_entry_data'):
-                return entry.img_file.read_entry_data(entry)
-            
-            # Fallback: empty data
-            print(f"Warning: Could not read data for entry {entry.name}")
-            return b''
-            
-        except Exception as e:
-            print(f"Error reading entry data for {entry.name}: {e}")
-            return b''
 
 __all__ = [
     'split_img',
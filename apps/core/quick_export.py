@@ -1,4 +1,4 @@
-#this belongs in core/quick_export.py - Version: 3
+#this belongs in core/quick_export.py - Version: 4
 # X-Seti - Aug15 2025 - IMG Factory 1.5 - Quick Export Functions with COL Support
 
 """
@@ -94,7 +94,7 @@ def quick_export_function(main_window): #vers 4
             main_window.log_message(f"❌ Quick export error: {str(e)}")
         QMessageBox.critical(main_window, "Quick Export Error", f"Quick export failed: {str(e)}")
 
-def _start_quick_export_with_progress(main_window, entries, assists_folder, export_options, file_type): #vers 3
+def _start_quick_export_with_progress(main_window, entries, assists_folder, export_options, file_type): #vers 4
     """Start quick IMG export with minimal progress display - FROM ORIGINAL"""
     try:
         # Create export thread - FROM ORIGINAL
@@ -135,8 +135,8 @@ def _start_quick_export_with_progress(main_window, entries, assists_folder, expo
         
         def handle_cancel():
             if export_thread.isRunning():
-                export_thread.terminate()
-                export_thread.wait()
+                # Workers stop after the file they are copying - no terminate mid-write
+                export_thread.stop_export()
                 if hasattr(main_window, 'log_message'):
                     main_window.log_message("🚫 Quick export cancelled by user")
         
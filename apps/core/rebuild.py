@@ -1,4 +1,4 @@
-#this belongs in core/rebuild.py - Version: 8
+#this belongs in core/rebuild.py - Version: 10
 # X-Seti - November19 2025 - IMG Factory 1.5 - Native Rebuild Functions
 """
 Native IMG rebuild using imgfactory objects directly - NO conversion needed
@@ -21,12 +21,15 @@ from apps.methods.imgcol_exists import set_context
 # rebuild_current_img_native
 # fast_rebuild_current
 # safe_rebuild_current
+# dedupe_rebuild_current
 # show_rebuild_mode_dialog
+# _perform_compact_rebuild
+# _perform_dedupe_rebuild
 # _perform_native_rebuild
 # _calculate_data_start_offset
 # integrate_rebuild_functions
 
-def rebuild_current_img_native(main_window, mode: str = "auto") -> bool: #vers 9
+def rebuild_current_img_native(main_window, mode: str = "auto") -> bool: #vers 11
     """Native IMG rebuild using imgfactory objects directly - TAB AWARE"""
     try:
         set_context(main_window)
@@ -42,8 +45,13 @@ def rebuild_current_img_native(main_window, mode: str = "auto") -> bool: #vers 9
             return False
         log_operation_progress(main_window, "REBUILD", "Starting native rebuild",
                              f"Mode: {mode}, File: {os.path.basename(file_object.file_path)}")
-        # Perform the rebuild
-        success = _perform_native_rebuild(file_object, mode, main_window)
+        # Perform the rebuild - fast mode compacts in place, others rewrite everything
+        if mode == "fast":
+            success = _perform_compact_rebuild(file_object, main_window)
+        elif mode == "dedupe":
+            success = _perform_dedupe_rebuild(file_object, main_window)
+        else:
+            success = _perform_native_rebuild(file_object, mode, main_window)
         if success:
             # Refresh current tab to show changes
             if hasattr(main_window, 'refresh_current_tab_data'):
@@ -64,7 +72,7 @@ def rebuild_current_img_native(main_window, mode: str = "auto") -> bool: #vers 9
 
 
 def fast_rebuild_current(main_window) -> bool:
-    """Fast rebuild mode - optimized for speed"""
+    """Fast rebuild mode - compacts in place, only entries after the first hole move"""
     return rebuild_current_img_native(main_window, mode="fast")
 
 
@@ -73,7 +81,12 @@ def safe_rebuild_current(main_window) -> bool:
     return rebuild_current_img_native(main_window, mode="safe")
 
 
-def show_rebuild_mode_dialog(main_window) -> bool:
+def dedupe_rebuild_current(main_window) -> bool: #vers 1
+    """Deduplicate rebuild - identical entries share one copy of their data"""
+    return rebuild_current_img_native(main_window, mode="dedupe")
+
+
+def show_rebuild_mode_dialog(main_window) -> bool: #vers 2
     """Show rebuild mode selection dialog"""
     try:
         dialog = QDialog(main_window)
@@ -88,7 +101,7 @@ def show_rebuild_mode_dialog(main_window) -> bool:
         # Mode selection
         mode_group = QButtonGroup(dialog)
         fast_radio = QRadioButton("Fast Rebuild")
-        fast_radio.setToolTip("Quick rebuild optimized for speed")
+        fast_radio.setToolTip("Compact in place - only entries after the first gap are moved")
         fast_radio.setChecked(True)  # Default selection
         mode_group.addButton(fast_radio, 0)
         layout.addWidget(fast_radio)
@@ -100,6 +113,10 @@ def show_rebuild_mode_dialog(main_window) -> bool:
         auto_radio.setToolTip("Automatically choose best rebuild method")
         mode_group.addButton(auto_radio, 2)
         layout.addWidget(auto_radio)
+        dedupe_radio = QRadioButton("Deduplicate Rebuild")
+        dedupe_radio.setToolTip("Full rebuild - identical entries point at one shared copy of their data")
+        mode_group.addButton(dedupe_radio, 3)
+        layout.addWidget(dedupe_radio)
         # Buttons
         button_layout = QHBoxLayout()
         rebuild_btn = QPushButton("Rebuild")
@@ -118,6 +135,8 @@ def show_rebuild_mode_dialog(main_window) -> bool:
                 return fast_rebuild_current(main_window)
             elif selected_id == 1:
                 return safe_rebuild_current(main_window)
+            elif selected_id == 3:
+                return dedupe_rebuild_current(main_window)
             else:
                 return rebuild_current_img_native(main_window, mode="auto")
         return False
@@ -127,6 +146,54 @@ def show_rebuild_mode_dialog(main_window) -> bool:
         return rebuild_current_img_native(main_window)
 
 
+def _perform_compact_rebuild(img_file, main_window) -> bool: #vers 2
+    """Fast rebuild - slide entries after the first hole down and rewrite the directory"""
+    try:
+        if not hasattr(img_file, 'compact_img_file'):
+            return _perform_native_rebuild(img_file, "fast", main_window)
+        # Partly overlapping entries cannot be slid - they need the full rewrite.
+        # Deduplicated entries (same range exactly) move together.
+        if img_file.get_directory().find_overlaps(ignore_shared=True):
+            log_operation_progress(main_window, "REBUILD", "Overlapping entries", "Using full rebuild")
+            return _perform_native_rebuild(img_file, "fast", main_window)
+
+        log_operation_progress(main_window, "REBUILD", "Compacting in place",
+                             f"Entries: {len(img_file.entries)}")
+        progress_callback = create_progress_callback(main_window, "Compacting IMG")
+        success = img_file.compact_img_file(progress_callback)
+        if success:
+            log_operation_progress(main_window, "REBUILD", "Compaction successful")
+        else:
+            log_operation_progress(main_window, "REBUILD", "Compaction failed")
+        return success
+    except Exception as e:
+        log_operation_progress(main_window, "REBUILD", "Compaction failed", str(e))
+        return False
+
+
+def _perform_dedupe_rebuild(img_file, main_window) -> bool: #vers 1
+    """Full rebuild where byte-identical entries share one sector range"""
+    try:
+        if not hasattr(img_file, 'rebuild_img_file'):
+            return _perform_native_rebuild(img_file, "dedupe", main_window)
+
+        log_operation_progress(main_window, "REBUILD", "Deduplicating rebuild",
+                             f"Entries: {len(img_file.entries)}")
+        progress_callback = create_progress_callback(main_window, "Rebuilding IMG")
+        success = img_file.rebuild_img_file(progress_callback, deduplicate=True)
+        if success:
+            stats = getattr(img_file, 'last_rebuild_stats', {})
+            log_operation_progress(main_window, "REBUILD", "Deduplication successful",
+                                 f"{stats.get('shared_entries', 0)} shared entries, "
+                                 f"{stats.get('bytes_saved', 0) // 1024} KB saved")
+        else:
+            log_operation_progress(main_window, "REBUILD", "Deduplication failed")
+        return success
+    except Exception as e:
+        log_operation_progress(main_window, "REBUILD", "Deduplication failed", str(e))
+        return False
+
+
 def _perform_native_rebuild(img_file, mode: str, main_window) -> bool:
     """Core native rebuild implementation"""
     try:
@@ -202,7 +269,7 @@ def _calculate_data_start_offset(version_info: Dict, entry_count: int) -> int:
         return 8 + (entry_count * 32)
 
 
-def integrate_rebuild_functions(main_window) -> bool: #vers 4
+def integrate_rebuild_functions(main_window) -> bool: #vers 5
     """Integrate native rebuild functions into main window - TAB AWARE"""
     try:
         # Main rebuild functions
@@ -211,6 +278,7 @@ def integrate_rebuild_functions(main_window) -> bool: #vers 4
         # Mode-specific functions
         main_window.fast_rebuild_current = lambda: fast_rebuild_current(main_window)
         main_window.safe_rebuild_current = lambda: safe_rebuild_current(main_window)
+        main_window.dedupe_rebuild_current = lambda: dedupe_rebuild_current(main_window)
         main_window.show_rebuild_dialog = lambda: show_rebuild_mode_dialog(main_window)
         # Additional aliases for compatibility
         main_window.fast_rebuild = main_window.fast_rebuild_current
@@ -230,6 +298,7 @@ __all__ = [
     'rebuild_current_img_native',
     'fast_rebuild_current',
     'safe_rebuild_current',
+    'dedupe_rebuild_current',
     'show_rebuild_mode_dialog',
     'integrate_rebuild_functions'
 ]
@@ -1,4 +1,4 @@
-#this belongs in core/ rebuild_all.py - Version: 6
+#this belongs in core/ rebuild_all.py - Version: 9
 # X-Seti - August26 2025 - IMG Factory 1.5 - Batch Rebuild All Functions
 
 import os
@@ -11,7 +11,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
 
-from apps.core.rebuild import rebuild_current_img_native, _perform_native_rebuild
+from apps.core.rebuild import rebuild_current_img_native
+from apps.methods.img_batch_rebuild import DEFAULT_PER_DISK, plan_worker_count, run_batch_rebuild
 from apps.methods.img_shared_operations import (
     create_progress_callback, validate_img_structure, cleanup_temp_files,
     log_operation_progress
@@ -32,81 +33,120 @@ from apps.methods.tab_system import get_current_file_from_active_tab, validate_t
 # integrate_batch_rebuild_functions
 
 class BatchRebuildThread(QThread):
-    """Background thread for batch rebuild operations"""
+    """Background thread driving the batch rebuild process pool"""
 
     progress_updated = pyqtSignal(int, str, int)  # overall_progress, current_file, file_index
+    file_progress = pyqtSignal(str, int, str)     # file_path, percent, message
     file_completed = pyqtSignal(str, bool, str)   # file_path, success, message
     batch_completed = pyqtSignal(int, int, list)  # total_files, success_count, failed_files
 
-    def __init__(self, targets: List[Dict], mode: str = "fast"):
+    def __init__(self, targets: List[Dict], mode: str = "fast", max_workers: Optional[int] = None,
+                 per_disk: int = DEFAULT_PER_DISK): #vers 3
         super().__init__()
         self.targets = targets
         self.mode = mode
+        self.max_workers = max_workers
+        self.per_disk = per_disk
         self.should_stop = False
-        set_context(main_window)
+        self.cancel_token = threading.Event()
+        # Background RW scans of open archives, stopped until the batch is done
+        self.paused_scans = []
 
-    def run(self):
-        """Execute batch rebuild"""
+    def run(self): #vers 2
+        """Execute batch rebuild - archives are spread over a process pool"""
         total_files = len(self.targets)
         success_count = 0
         failed_files = []
+        file_percent = {}
+        open_objects = {}
+        order = {}
 
-        for i, target in enumerate(self.targets):
-            if self.should_stop:
-                break
-
-            file_path = target['file_path']
-            file_name = os.path.basename(file_path)
-
-            self.progress_updated.emit(
-                int((i * 100) / total_files),
-                f"Rebuilding {file_name}",
-                i + 1
-            )
-
-            try:
-                # Perform rebuild
-                success = self._rebuild_single_target(target)
+        for target in self.targets:
+            img_file = target.get('img_object')
+            file_path = img_file.file_path if img_file else target['file_path']
+            if img_file and not self._prepare_open_archive(img_file):
+                failed_files.append(file_path)
+                self.file_completed.emit(file_path, False, "Could not save pending changes")
+                continue
+            if img_file:
+                open_objects[file_path] = img_file
+            file_percent[file_path] = 0
+            order[file_path] = len(order) + 1
+
+        def on_progress(file_path: str, percent: int, message: str):
+            file_percent[file_path] = percent
+            self.file_progress.emit(file_path, percent, message)
+            overall = int(sum(file_percent.values()) / max(1, len(file_percent)))
+            self.progress_updated.emit(overall, f"Rebuilding {os.path.basename(file_path)}",
+                                       order.get(file_path, 0))
+
+        def on_result(result: Dict):
+            nonlocal success_count
+            file_path = result['file_path']
+            file_percent[file_path] = 100
+            if result['success']:
+                success_count += 1
+                self._refresh_open_archive(open_objects.get(file_path), result.get('layout'))
+            else:
+                failed_files.append(file_path)
+            self.file_completed.emit(file_path, result['success'], result['message'])
 
-                if success:
-                    success_count += 1
-                    self.file_completed.emit(file_path, True, "Rebuild successful")
-                else:
+        try:
+            run_batch_rebuild(list(file_percent), self.mode, self.max_workers, self.per_disk,
+                              self.cancel_token, on_progress, on_result)
+        except Exception as e:
+            for file_path in file_percent:
+                if file_percent[file_path] < 100:
                     failed_files.append(file_path)
-                    self.file_completed.emit(file_path, False, "Rebuild failed")
-
-            except Exception as e:
-                failed_files.append(file_path)
-                self.file_completed.emit(file_path, False, f"Error: {str(e)}")
+                    self.file_completed.emit(file_path, False, f"Error: {str(e)}")
 
         self.batch_completed.emit(total_files, success_count, failed_files)
 
-
-    def _rebuild_single_target(self, target: Dict) -> bool:
-        """Rebuild a single IMG target"""
+    def _prepare_open_archive(self, img_file) -> bool: #vers 2
+        """Stop the tab's RW scan, write unsaved changes and release the read session
+        before a worker takes the file"""
         try:
-            img_file = target['img_object']
-            if not img_file:
-                return False
-
-            # Use the same native rebuild as single file rebuild
-            return _perform_native_rebuild(img_file, self.mode, None)
-
+            scan = img_file.pause_rw_scan() if hasattr(img_file, 'pause_rw_scan') else None
+            if scan is not None:
+                self.paused_scans.append((img_file, scan))
+            if any(getattr(e, '_cached_data', None) is not None for e in img_file.entries):
+                if not img_file.save_img_file():
+                    return False
+            if hasattr(img_file, 'close_read_session'):
+                img_file.close_read_session()
+            return True
         except Exception:
             return False
 
-    def stop(self):
-        """Stop the batch rebuild process"""
+    def _refresh_open_archive(self, img_file, layout): #vers 1
+        """Point an open tab's entries at the offsets the worker wrote"""
+        if img_file is None:
+            return
+        try:
+            if layout is not None and len(layout) == len(img_file.entries) and hasattr(img_file, '_apply_layout'):
+                img_file._apply_layout(layout)
+            else:
+                # Entry list no longer matches the directory - reload it
+                img_file.is_open = False
+                img_file.open()
+        except Exception as e:
+            print(f"[WARNING] Could not refresh {img_file.file_path} after rebuild: {e}")
+
+    def stop(self): #vers 2
+        """Stop the batch rebuild - workers finish the chunk they are copying"""
         self.should_stop = True
+        self.cancel_token.set()
 
 
 class BatchRebuildDialog(QDialog):
     """Dialog for batch rebuild operations"""
 
-    def __init__(self, main_window):
+    def __init__(self, main_window, folder_path: Optional[str] = None): #vers 2
         super().__init__(main_window)
         self.main_window = main_window
+        self.folder_path = folder_path
         self.targets = []
+        self.target_items = {}
         self.rebuild_thread = None
 
         self.setWindowTitle("Batch Rebuild IMG Files")
@@ -152,10 +192,18 @@ class BatchRebuildDialog(QDialog):
 
         options_layout.addWidget(QLabel("Max Concurrent:"))
         self.concurrent_spin = QSpinBox()
-        self.concurrent_spin.setRange(1, 4)
-        self.concurrent_spin.setValue(1)
+        self.concurrent_spin.setRange(1, max(1, os.cpu_count() or 1))
+        self.concurrent_spin.setValue(max(1, os.cpu_count() or 1))
+        self.concurrent_spin.setToolTip("Archives rebuilt in parallel (worker processes)")
         options_layout.addWidget(self.concurrent_spin)
 
+        options_layout.addWidget(QLabel("Per Disk:"))
+        self.per_disk_spin = QSpinBox()
+        self.per_disk_spin.setRange(1, 8)
+        self.per_disk_spin.setValue(DEFAULT_PER_DISK)
+        self.per_disk_spin.setToolTip("Archives read/written at the same time on one physical disk")
+        options_layout.addWidget(self.per_disk_spin)
+
         layout.addWidget(options_group)
 
         # Target files list
@@ -215,12 +263,16 @@ class BatchRebuildDialog(QDialog):
 
 
 
-    def _refresh_targets(self):
+    def _refresh_targets(self): #vers 2
         """Refresh the target files list"""
         self.targets_list.clear()
         self.targets = []
+        self.target_items = {}
+
+        if self.folder_path:
+            self.targets = _collect_img_files_from_folder(self.folder_path)
 
-        if self.open_tabs_radio.isChecked():
+        elif self.open_tabs_radio.isChecked():
             self.targets = _collect_open_img_tabs(self.main_window)
 
         elif self.highlight_radio.isChecked():
@@ -234,6 +286,9 @@ class BatchRebuildDialog(QDialog):
             file_name = os.path.basename(target['file_path'])
             item = QListWidgetItem(f"{file_name} ({target['source']})")
             self.targets_list.addItem(item)
+            img_object = target.get('img_object')
+            file_path = img_object.file_path if img_object else target['file_path']
+            self.target_items[file_path] = (item, f"{file_name} ({target['source']})")
 
         # Update button state
         self.start_btn.setEnabled(len(self.targets) > 0)
@@ -265,7 +320,7 @@ class BatchRebuildDialog(QDialog):
         
         return targets
 
-    def _start_rebuild(self):
+    def _start_rebuild(self): #vers 2
         """Start batch rebuild process"""
         if not self.targets:
             QMessageBox.warning(self, "No Targets", "No IMG files found to rebuild")
@@ -281,9 +336,11 @@ class BatchRebuildDialog(QDialog):
         mode_map = {"Fast": "fast", "Safe": "safe", "Auto": "auto"}
         mode = mode_map[self.mode_combo.currentText()]
 
-        # Start rebuild thread
-        self.rebuild_thread = BatchRebuildThread(valid_targets, mode)
+        # Start rebuild thread - it spreads the archives over a process pool
+        self.rebuild_thread = BatchRebuildThread(valid_targets, mode,
+                                                 self.concurrent_spin.value(), self.per_disk_spin.value())
         self.rebuild_thread.progress_updated.connect(self._on_progress_updated)
+        self.rebuild_thread.file_progress.connect(self._on_file_progress)
         self.rebuild_thread.file_completed.connect(self._on_file_completed)
         self.rebuild_thread.batch_completed.connect(self._on_batch_completed)
 
@@ -294,7 +351,9 @@ class BatchRebuildDialog(QDialog):
         self.stop_btn.setEnabled(True)
         self.close_btn.setEnabled(False)
 
-        self.progress_log.append(f"Starting batch rebuild of {len(valid_targets)} files...")
+        paths = [t['img_object'].file_path if t.get('img_object') else t['file_path'] for t in valid_targets]
+        workers = plan_worker_count(paths, self.concurrent_spin.value(), self.per_disk_spin.value())
+        self.progress_log.append(f"Starting batch rebuild of {len(valid_targets)} files ({workers} workers)...")
 
     def _stop_rebuild(self):
         """Stop batch rebuild process"""
@@ -307,8 +366,19 @@ class BatchRebuildDialog(QDialog):
         self.overall_progress.setValue(progress)
         self.current_file_label.setText(f"File {file_index}/{len(self.targets)}: {current_file}")
 
-    def _on_file_completed(self, file_path: str, success: bool, message: str):
+    def _on_file_progress(self, file_path: str, percent: int, message: str): #vers 1
+        """Show per-file progress next to each target"""
+        item_info = self.target_items.get(file_path)
+        if item_info:
+            item, label = item_info
+            item.setText(f"{label} - {percent}% {message}")
+
+    def _on_file_completed(self, file_path: str, success: bool, message: str): #vers 2
         """Handle individual file completion"""
+        item_info = self.target_items.get(file_path)
+        if item_info:
+            item, label = item_info
+            item.setText(f"{label} - {message}")
         file_name = os.path.basename(file_path)
         try:
             from apps.methods.imgfactory_svg_icons import get_success_icon, get_error_icon
@@ -321,11 +391,19 @@ class BatchRebuildDialog(QDialog):
             status = "Completed" if success else "Failed"
         self.progress_log.append(f"{status} {file_name}: {message}")
 
-    def _on_batch_completed(self, total_files: int, success_count: int, failed_files: List[str]):
+    def _on_batch_completed(self, total_files: int, success_count: int, failed_files: List[str]): #vers 2
         """Handle batch completion"""
         self.overall_progress.setValue(100)
         self.current_file_label.setText("Batch rebuild completed")
 
+        # Rebuilt open archives have new offsets and free space
+        if hasattr(self.main_window, 'refresh_img_status'):
+            self.main_window.refresh_img_status()
+        # RW scans stopped for the batch carry on at the new offsets
+        for img_file, scan in self.rebuild_thread.paused_scans:
+            img_file.resume_rw_scan(scan)
+        self.rebuild_thread.paused_scans = []
+
         # Update UI state
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
@@ -350,8 +428,8 @@ class BatchRebuildDialog(QDialog):
                 f"{failed_count} files failed:\n\n{failed_text}")
 
 
-def rebuild_all_img(main_window): #vers 1
-    """Rebuild all IMG files in a folder"""
+def rebuild_all_img(main_window): #vers 2
+    """Rebuild all IMG files in a folder (and its subfolders) on the batch process pool"""
     try:
         folder_path = QFileDialog.getExistingDirectory(
             main_window, "Select Folder with IMG Files", "", QFileDialog.Option.ShowDirsOnly
@@ -359,45 +437,13 @@ def rebuild_all_img(main_window): #vers 1
         if not folder_path:
             return False
 
-        # Find all IMG files
-        img_files = []
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                if file.lower().endswith('.img'):
-                    img_files.append(os.path.join(root, file))
-
-        if not img_files:
+        if not _collect_img_files_from_folder(folder_path):
             QMessageBox.information(main_window, "No IMG Files", "No IMG files found in selected folder")
             return False
 
-        # Rebuild with progress
-        progress = QProgressDialog("Rebuilding IMG files...", "Cancel", 0, len(img_files), main_window)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.show()
-        rebuilt = 0
-
-        for i, img_path in enumerate(img_files):
-            progress.setValue(i)
-            QApplication.processEvents()
-            if progress.wasCanceled():
-                break
-
-            # Load IMG
-            from apps.methods.img_core_classes import IMGFile
-            img = IMGFile(img_path)
-            if not img.open():
-                continue
-
-            # Mock tab context
-            main_window.current_img = img
-            # Call native rebuild
-            from apps.core.rebuild import rebuild_current_img_native
-            if rebuild_current_img_native(main_window):
-                rebuilt += 1
-
-        progress.close()
-        QMessageBox.information(main_window, "Rebuild Complete", f"Rebuilt {rebuilt}/{len(img_files)} IMG files")
-        return rebuilt > 0
+        dialog = BatchRebuildDialog(main_window, folder_path)
+        dialog.exec()
+        return True
     except Exception as e:
         QMessageBox.critical(main_window, "Rebuild Error", f"Error: {str(e)}")
         return False
@@ -474,8 +520,8 @@ def _collect_open_img_tabs(main_window) -> List[Dict]:
     return targets
 
 
-def _collect_img_files_from_folder(folder_path: str) -> List[Dict]:
-    """Collect IMG files from folder"""
+def _collect_img_files_from_folder(folder_path: str) -> List[Dict]: #vers 2
+    """Collect IMG files from folder and its subfolders"""
     targets = []
 
     try:
@@ -483,8 +529,10 @@ def _collect_img_files_from_folder(folder_path: str) -> List[Dict]:
         if not folder.exists():
             return targets
 
-        # Find IMG files
-        for img_file in folder.glob("*.img"):
+        # Find IMG files (any case - GTA installs mix .img and .IMG)
+        for img_file in sorted(folder.rglob("*")):
+            if img_file.suffix.lower() != '.img' or not img_file.is_file():
+                continue
             targets.append({
                 'file_path': str(img_file),
                 'img_object': None,  # Will need to load these
@@ -125,21 +125,15 @@ class RWSnapshotManager:
             print(f"[WARNING] Error checking unknown RW file {entry.name}: {e}")
             return False
 
-    def extract_rw_header_info(self, entry: IMGEntry, img_file: IMGFile) -> Optional[Dict[str, Any]]: #vers 1
+    def extract_rw_header_info(self, entry: IMGEntry, img_file: IMGFile) -> Optional[Dict[str, Any]]: #vers 2
         """Extract detailed RW header information from file"""
         try:
-            # Read file header (first 32 bytes for analysis)
-            if img_file.version.value == 1:  # VERSION_1
-                img_path = img_file.file_path.replace('.dir', '.img')
-                if not os.path.exists(img_path):
-                    return None
-                file_path = img_path
-            else:
-                file_path = img_file.file_path
-                
-            with open(file_path, 'rb') as f:
-                f.seek(entry.offset)
-                header_data = f.read(min(32, entry.size))
+            # Read file header (first 32 bytes for analysis) through the read session
+            view = img_file.read_entry_view(entry)
+            try:
+                header_data = view[:min(32, entry.size)].tobytes()
+            finally:
+                view.release()
                 
             if len(header_data) < 12:
                 return None
@@ -0,0 +1,187 @@
+#this belongs in debug/startup_profiler.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - Startup Profiler
+
+"""
+Startup Profiler - Import and init timings for IMG Factory start up.
+Enabled with --profile-startup or IMGFACTORY_PROFILE_STARTUP=1. Times every
+module import (cumulative and self time) through a meta path hook and every
+call made directly by the main window __init__, then prints both tables once
+the window is shown. Does nothing unless enabled.
+"""
+
+import os
+import sys
+import time
+from typing import Dict, List, Tuple, Optional, Callable, Any
+
+##Methods list -
+# is_requested
+# start
+# stop
+# record_init
+# profile_calls
+# report
+
+##Classes -
+# StartupProfiler
+# _TimingFinder
+# _TimingLoader
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_ENV = "IMGFACTORY_PROFILE_STARTUP"
+
+
+class _TimingLoader:
+    """Wraps a module loader - times exec_module, everything else passes through"""
+
+    def __init__(self, loader, profiler: 'StartupProfiler'): #vers 1
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name): #vers 1
+        return getattr(self._loader, name)
+
+    def exec_module(self, module): #vers 1
+        self._profiler._enter_import(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._leave_import(module.__name__)
+
+
+class _TimingFinder:
+    """Meta path hook - finds specs through the other finders and wraps their loaders"""
+
+    def __init__(self, profiler: 'StartupProfiler'): #vers 1
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None): #vers 1
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimingLoader(spec.loader, self._profiler)
+        return spec
+
+
+class StartupProfiler:
+    """Collects import and init timings while IMG Factory starts"""
+
+    def __init__(self): #vers 1
+        self.enabled = False
+        self.started_at = time.perf_counter()
+        self.imports: Dict[str, Tuple[float, float]] = {}   # module -> (cumulative, self) seconds
+        self.init_calls: List[Tuple[str, str, float]] = []  # (module, call, seconds) in call order
+        self._import_stack: List[list] = []                 # [module, start, child seconds]
+        self._finder: Optional[_TimingFinder] = None
+
+    @staticmethod
+    def is_requested(argv: Optional[List[str]] = None) -> bool: #vers 1
+        """True when the command line or environment asks for a startup profile"""
+        argv = sys.argv if argv is None else argv
+        return PROFILE_FLAG in argv or os.environ.get(PROFILE_ENV, "") not in ("", "0")
+
+    def start(self): #vers 1
+        """Install the import hook (once)"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.started_at = time.perf_counter()
+        self._finder = _TimingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def stop(self): #vers 1
+        """Remove the import hook - collected timings are kept"""
+        if self._finder is not None and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+        self.enabled = False
+
+    def _enter_import(self, name: str): #vers 1
+        self._import_stack.append([name, time.perf_counter(), 0.0])
+
+    def _leave_import(self, name: str): #vers 1
+        module, start, children = self._import_stack.pop()
+        total = time.perf_counter() - start
+        self.imports[module] = (total, total - children)
+        if self._import_stack:
+            self._import_stack[-1][2] += total
+
+    def record_init(self, module: str, call: str, seconds: float): #vers 1
+        """Add one init step (also used for components loaded on demand)"""
+        if self.enabled:
+            self.init_calls.append((module, call, seconds))
+
+    def profile_calls(self, func: Callable, *args, **kwargs) -> Any: #vers 1
+        """Run func and time each call it makes directly (one level deep).
+        func may be a class - its __init__ is profiled. Runs func plainly when disabled."""
+        if not self.enabled:
+            return func(*args, **kwargs)
+
+        target = getattr(func, '__init__', func) if isinstance(func, type) else func
+        target_code = getattr(target, '__code__', None)
+        if target_code is None:
+            return func(*args, **kwargs)
+
+        root = []
+        starts = {}
+
+        def tracer(frame, event, arg):
+            if event == 'call':
+                if not root and frame.f_code is target_code:
+                    root.append(frame)
+                elif root and frame.f_back is root[0]:
+                    starts[frame] = time.perf_counter()
+            elif event == 'return':
+                start = starts.pop(frame, None)
+                if start is not None:
+                    code = frame.f_code
+                    self.init_calls.append((frame.f_globals.get('__name__', '?'),
+                                            getattr(code, 'co_qualname', code.co_name),
+                                            time.perf_counter() - start))
+
+        previous = sys.getprofile()
+        sys.setprofile(tracer)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sys.setprofile(previous)
+
+    def report(self, limit: int = 25): #vers 1
+        """Print import and init tables, slowest first"""
+        elapsed = time.perf_counter() - self.started_at
+        print(f"[DEBUG] Startup profile - {elapsed * 1000:.1f} ms to window shown")
+
+        print(f"[DEBUG] Imports: {len(self.imports)} modules, slowest (self time):")
+        print(f"{'self ms':>10} {'total ms':>10}  module")
+        for module, (total, own) in sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)[:limit]:
+            print(f"{own * 1000:>10.1f} {total * 1000:>10.1f}  {module}")
+
+        if self.init_calls:
+            per_module: Dict[str, float] = {}
+            for module, call, seconds in self.init_calls:
+                per_module[module] = per_module.get(module, 0.0) + seconds
+            print(f"[DEBUG] Init: {len(self.init_calls)} steps, slowest:")
+            print(f"{'ms':>10}  call")
+            for module, call, seconds in sorted(self.init_calls, key=lambda item: item[2], reverse=True)[:limit]:
+                print(f"{seconds * 1000:>10.1f}  {module}.{call}")
+            print("[DEBUG] Init time per module:")
+            for module, seconds in sorted(per_module.items(), key=lambda item: item[1], reverse=True)[:limit]:
+                print(f"{seconds * 1000:>10.1f}  {module}")
+
+
+# Global startup profiler - started by the launcher / imgfactory when requested
+startup_profiler = StartupProfiler()
+
+
+__all__ = [
+    'PROFILE_ENV',
+    'PROFILE_FLAG',
+    'StartupProfiler',
+    'startup_profiler'
+]
@@ -1,4 +1,4 @@
-#this belongs in gui/ gui_layout.py - Version: 27
+#this belongs in gui/ gui_layout.py - Version: 30
 # X-Seti - JULY29 2025 - Img Factory 1.5 - GUI Layout Module
 
 import os
@@ -24,9 +24,9 @@ from apps.methods.imgfactory_svg_icons import (
 from apps.locals.localization import tr_button
 from typing import Optional, Dict, Any, List, Callable
 from dataclasses import dataclass, field
-from apps.components.Img_Creator.img_creator import NewIMGDialog, IMGCreationThread
-from apps.components.Ide_Editor.ide_editor import open_ide_editor
+from apps.methods.component_registry import lazy_component
 from apps.gui.gui_backend import GUIBackend, ButtonDisplayMode
+from apps.gui.img_entry_table import IMGEntryTableView
 
 #core
 from apps.core.impotr import import_files_function
@@ -44,9 +44,6 @@ from apps.core.rebuild import rebuild_current_img_native
 from apps.core.rebuild_all import rebuild_all_open_tabs
 #from apps.core.rebuild import rebuild_current_img #old function.
 from apps.core.dump import dump_all_function # dump_selected_function, integrate_dump_functions
-from apps.core.img_split import split_img, integrate_split_functions
-from apps.core.img_merger import merge_img_function
-from apps.core.convert import convert_img, convert_img_format
 from apps.core.rename import rename_entry
 from apps.core.imgcol_replace import replace_selected
 from apps.core.extract import extract_textures_function
@@ -58,6 +55,12 @@ from apps.methods.colour_ui_for_loaded_img import integrate_color_ui_system
 from apps.gui.gui_context import open_col_editor_dialog
 #from apps.methods.refresh_table_functions import refresh_table
 
+# Tools load on first use (component registry)
+open_ide_editor = lazy_component('ide_editor', 'open_ide_editor')
+split_img = lazy_component('img_split', 'split_img')
+merge_img_function = lazy_component('img_merger', 'merge_img_function')
+convert_img_format = lazy_component('img_convert', 'convert_img_format')
+
 
 def edit_txd_file(main_window): #vers 3
     """Edit selected TXD file with TXD Workshop"""
@@ -1198,7 +1201,7 @@ class IMGFactoryGUILayout:
         return left_container
 
 
-    def _create_file_window(self): #vers 3
+    def _create_file_window(self): #vers 4
         """Create file window with tabs for different views"""
         file_window = QWidget()
         file_layout = QVBoxLayout(file_window)
@@ -1213,8 +1216,8 @@ class IMGFactoryGUILayout:
         entries_layout = QVBoxLayout(entries_tab)
         entries_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create main table
-        self.table = QTableWidget()
+        # Create main table - virtual, cells are formatted when painted
+        self.table = IMGEntryTableView()
         self.table.setColumnCount(9)
         self.table.setHorizontalHeaderLabels([
             "Num", "Name", "Extension", "Size", "Hash", "Hex", "Version", "Compression", "Status"
@@ -1885,9 +1888,12 @@ class IMGFactoryGUILayout:
             elif hasattr(self.main_window, 'statusBar'):
                 self.main_window.statusBar().showMessage("Ready")
 
-    def update_file_info(self, info_text): #vers 1
+    def update_file_info(self, info_text): #vers 2
         """Update file info using unified progress for completion"""
-        if hasattr(self.main_window, 'update_img_status'):
+        if getattr(self.main_window, 'current_img', None) and hasattr(self.main_window, 'refresh_img_status'):
+            # The loaded IMG carries the count along with free space and compression
+            self.main_window.refresh_img_status()
+        elif hasattr(self.main_window, 'update_img_status'):
             # Extract info from text if possible
             if "entries" in info_text:
                 try:
@@ -0,0 +1,647 @@
+#this belongs in gui/img_entry_table.py - Version: 3
+# X-Seti - October16 2026 - IMG Factory 1.5 - Virtual IMG Entry Table
+
+"""
+Virtual IMG Entry Table - Model/view table for the IMG entries panel.
+IMGEntryTableModel reads the archive entries directly and formats each cell in
+data() when the view paints it, so opening gta3.img no longer builds 130k
+QTableWidgetItems. Highlight and pin state are per-row flags. Cells set through
+setItem() / item().setX() are kept as sparse overrides (COL files, moved rows).
+
+IMGEntryTableView keeps the QTableWidget calls the rest of IMG Factory uses
+(item, setItem, selectedItems, rowCount, setRowCount, itemSelectionChanged ...)
+so callers work unchanged; item() returns a light IMGTableCell handle.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt6.QtWidgets import QTableView, QTableWidgetItem, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QItemSelection, QItemSelectionModel, pyqtSignal
+from PyQt6.QtGui import QBrush, QColor, QFont, QIcon
+
+from apps.methods.populate_img_table import IMGTablePopulator
+
+##Methods list -
+# entry_row_flags
+
+##Classes -
+# IMGEntryTableModel
+# IMGEntryTableView
+# IMGTableCell
+
+# Per-row flags
+ROW_IMPORTED = 0x01
+ROW_REPLACED = 0x02
+ROW_PINNED = 0x04
+
+IMG_COLUMNS = ["Name", "Type", "Size", "Offset", "RW Address", "RW Version", "Compression", "Status"]
+RW_COLUMNS = (4, 5)   # RW Address, RW Version - filled by the background RW scan
+
+_ROLE_DISPLAY = int(Qt.ItemDataRole.DisplayRole)
+_ROLE_EDIT = int(Qt.ItemDataRole.EditRole)
+_ROLE_TOOLTIP = int(Qt.ItemDataRole.ToolTipRole)
+_ROLE_DECORATION = int(Qt.ItemDataRole.DecorationRole)
+_ROLE_BACKGROUND = int(Qt.ItemDataRole.BackgroundRole)
+_ROLE_FOREGROUND = int(Qt.ItemDataRole.ForegroundRole)
+_ROLE_FONT = int(Qt.ItemDataRole.FontRole)
+_ROLE_FLAGS = -1   # Cell override key for item flags
+
+# Roles copied from a QTableWidgetItem passed to setItem()
+_ITEM_ROLES = tuple(int(role) for role in (
+    Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.DecorationRole, Qt.ItemDataRole.ToolTipRole,
+    Qt.ItemDataRole.StatusTipRole, Qt.ItemDataRole.FontRole, Qt.ItemDataRole.TextAlignmentRole,
+    Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.CheckStateRole,
+    Qt.ItemDataRole.UserRole))
+
+# Same defaults as a new QTableWidgetItem
+_DEFAULT_FLAGS = (Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled |
+                  Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled)
+
+_TABLE_WIDGET_SELECTOR = re.compile(r'\bQTableWidget\b')
+
+
+def entry_row_flags(entry: Any) -> int: #vers 1
+    """Highlight / pin flags for one entry (same rules as populate_table_row_minimal)"""
+    flags = 0
+    if getattr(entry, 'is_new_entry', False):
+        flags |= ROW_REPLACED if getattr(entry, 'is_replaced', False) else ROW_IMPORTED
+    if getattr(entry, 'is_pinned', False):
+        flags |= ROW_PINNED
+    return flags
+
+
+class IMGEntryTableModel(QAbstractTableModel):
+    """Table model over a list of IMG entries - cells are formatted on demand"""
+
+    def __init__(self, parent=None): #vers 2
+        super().__init__(parent)
+        self._headers: List[str] = []
+        self._columns = 0
+        self._entries: List[Any] = []     # Row -> entry, None for rows filled through setItem
+        self._flags = bytearray()         # Row -> ROW_* flags
+        self._cells: Dict[Tuple[int, int], Dict[int, Any]] = {}   # Sparse per-cell overrides
+        self._row_lookup: Optional[Dict[int, int]] = None         # id(entry) -> row, built on demand
+        self._formatter = IMGTablePopulator(None)
+        self._column_text = (
+            self._name_text,
+            self._formatter.get_img_entry_type_simple,
+            self._formatter.format_img_entry_size_simple,
+            self._offset_text,
+            self._formatter.get_rw_address_light,
+            self._formatter.get_rw_version_light,
+            self._formatter.get_compression_info,
+            self._formatter.get_info_light,
+        )
+        # Highlight styles - as create_img_table_item
+        bold = QFont()
+        bold.setBold(True)
+        self._bold_font = bold
+        self._styles = {
+            ROW_IMPORTED: (QBrush(QColor(200, 255, 200)), QBrush(QColor(0, 100, 0)), "Recently imported file"),
+            ROW_REPLACED: (QBrush(QColor(255, 255, 200)), QBrush(QColor(150, 100, 0)), "Recently replaced file"),
+        }
+        self._lock_icon: Optional[QIcon] = None
+
+    # - Entry source
+
+    def set_entries(self, entries) -> int: #vers 2
+        """Show entries (IMG column layout) - O(rows) for the flag pass, no per-cell work"""
+        self.beginResetModel()
+        self._entries = list(entries or [])
+        self._flags = bytearray(entry_row_flags(entry) for entry in self._entries)
+        self._row_lookup = None
+        self._cells = {}
+        if self._columns < len(IMG_COLUMNS):
+            self._columns = len(IMG_COLUMNS)
+        if not self._headers:
+            self._headers = list(IMG_COLUMNS)
+        self.endResetModel()
+        return len(self._entries)
+
+    def entry_at(self, row: int) -> Any: #vers 1
+        """IMG entry shown in row (None for plain rows)"""
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return None
+
+    def rows_for_entries(self, entries) -> List[int]: #vers 1
+        """Rows showing the given entries (sorted, entries not shown are skipped)"""
+        if self._row_lookup is None:
+            self._row_lookup = {id(entry): row for row, entry in enumerate(self._entries) if entry is not None}
+        lookup = self._row_lookup
+        rows = [lookup.get(id(entry), -1) for entry in entries]
+        return sorted(row for row in rows if row >= 0)
+
+    def row_flags(self, row: int) -> int: #vers 1
+        return self._flags[row] if 0 <= row < len(self._flags) else 0
+
+    def set_row_flags(self, row: int, flags: int): #vers 1
+        """Change highlight / pin flags of one row"""
+        if 0 <= row < len(self._flags) and self._flags[row] != flags:
+            self._flags[row] = flags
+            self.dataChanged.emit(self.index(row, 0), self.index(row, max(0, self._columns - 1)))
+
+    def refresh_row_flags(self): #vers 1
+        """Re-read highlight / pin state from the entries (after pinning or importing)"""
+        self._flags = bytearray(entry_row_flags(entry) if entry is not None else 0 for entry in self._entries)
+        if self._entries and self._columns:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._entries) - 1, self._columns - 1))
+
+    def refresh_rw_columns(self): #vers 1
+        """Repaint RW Address / RW Version after a background scan batch"""
+        rows = len(self._entries)
+        if rows and self._columns > RW_COLUMNS[-1]:
+            self.dataChanged.emit(self.index(0, RW_COLUMNS[0]), self.index(rows - 1, RW_COLUMNS[-1]))
+
+    # - Cell formatting
+
+    def _name_text(self, entry: Any) -> str: #vers 1
+        return str(entry.name) if hasattr(entry, 'name') else "Unnamed"
+
+    def _offset_text(self, entry: Any) -> str: #vers 1
+        return f"0x{entry.offset:08X}" if hasattr(entry, 'offset') else "N/A"
+
+    def cell_text(self, row: int, column: int) -> str: #vers 1
+        value = self.cell_data(row, column, _ROLE_DISPLAY)
+        return "" if value is None else str(value)
+
+    def cell_data(self, row: int, column: int, role: int) -> Any: #vers 1
+        """Value for one cell and role - overrides first, then the entry"""
+        role = int(role)
+        if role == _ROLE_EDIT:
+            role = _ROLE_DISPLAY
+        cell = self._cells.get((row, column))
+        if cell is not None and role in cell:
+            return cell[role]
+        entry = self._entries[row]
+        if entry is None:
+            return None
+
+        if role == _ROLE_DISPLAY:
+            if column < len(self._column_text):
+                try:
+                    return self._column_text[column](entry)
+                except Exception:
+                    return "Error"
+            return None
+
+        flags = self._flags[row]
+        if not flags:
+            return None
+        style = self._styles.get(flags & (ROW_IMPORTED | ROW_REPLACED))
+        if role == _ROLE_BACKGROUND:
+            return style[0] if style else None
+        if role == _ROLE_FOREGROUND:
+            return style[1] if style else None
+        if role == _ROLE_FONT:
+            return self._bold_font if style else None
+        if role == _ROLE_DECORATION:
+            return self._pinned_icon() if flags & ROW_PINNED else None
+        if role == _ROLE_TOOLTIP:
+            tips = ["Pinned"] if flags & ROW_PINNED else []
+            if style:
+                tips.append(style[2])
+            return " | ".join(tips)
+        return None
+
+    def _pinned_icon(self) -> Optional[QIcon]: #vers 1
+        if self._lock_icon is None:
+            try:
+                from apps.methods.imgfactory_svg_icons import SVGIconFactory
+                self._lock_icon = SVGIconFactory.lock_icon(size=16, color=None)
+            except Exception:
+                self._lock_icon = QIcon()
+        return self._lock_icon
+
+    def has_cell(self, row: int, column: int) -> bool: #vers 1
+        """True where a QTableWidget would have an item"""
+        if not (0 <= row < len(self._entries) and 0 <= column < self._columns):
+            return False
+        return self._entries[row] is not None or (row, column) in self._cells
+
+    def set_cell_data(self, row: int, column: int, role: int, value: Any): #vers 1
+        """Override one role of one cell"""
+        if not (0 <= row < len(self._entries) and 0 <= column < self._columns):
+            return
+        role = int(role)
+        if role == _ROLE_EDIT:
+            role = _ROLE_DISPLAY
+        self._cells.setdefault((row, column), {})[role] = value
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index)
+
+    def set_cell_item(self, row: int, column: int, item: Optional[QTableWidgetItem]): #vers 1
+        """Replace a cell with the contents of a QTableWidgetItem (setItem)"""
+        if not (0 <= row < len(self._entries) and 0 <= column < self._columns):
+            return
+        if item is None:
+            self._cells.pop((row, column), None)
+        else:
+            cell = {role: item.data(role) for role in _ITEM_ROLES}
+            cell[_ROLE_FLAGS] = item.flags()
+            self._cells[(row, column)] = cell
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index)
+
+    # - QAbstractTableModel
+
+    def rowCount(self, parent=QModelIndex()) -> int: #vers 1
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()) -> int: #vers 1
+        return 0 if parent.isValid() else self._columns
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole): #vers 1
+        if not index.isValid():
+            return None
+        return self.cell_data(index.row(), index.column(), role)
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool: #vers 1
+        if not index.isValid():
+            return False
+        self.set_cell_data(index.row(), index.column(), role, value)
+        return True
+
+    def flags(self, index): #vers 1
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        cell = self._cells.get((index.row(), index.column()))
+        if cell is not None and _ROLE_FLAGS in cell:
+            return cell[_ROLE_FLAGS]
+        return _DEFAULT_FLAGS
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole): #vers 1
+        if int(role) != _ROLE_DISPLAY:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._headers) and self._headers[section]:
+                return self._headers[section]
+        return str(section + 1)
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder): #vers 2
+        """Sort rows - Size and Offset by value, other columns by text"""
+        count = len(self._entries)
+        if count < 2 or not (0 <= column < self._columns):
+            return
+
+        def key(row): #vers 1
+            entry = self._entries[row]
+            cell = self._cells.get((row, column))
+            if entry is not None and (cell is None or _ROLE_DISPLAY not in cell):
+                if column == 2:
+                    return (0, getattr(entry, 'size', 0) or 0, "")
+                if column == 3:
+                    return (0, getattr(entry, 'offset', 0) or 0, "")
+            return (1, 0, self.cell_text(row, column).lower())
+
+        self.layoutAboutToBeChanged.emit()
+        order_rows = sorted(range(count), key=key, reverse=(order == Qt.SortOrder.DescendingOrder))
+        position = [0] * count
+        for new_row, old_row in enumerate(order_rows):
+            position[old_row] = new_row
+        self._entries = [self._entries[row] for row in order_rows]
+        self._flags = bytearray(self._flags[row] for row in order_rows)
+        self._cells = {(position[row], col): cell for (row, col), cell in self._cells.items()}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(position[index.row()], index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self._row_lookup = None
+        self.layoutChanged.emit()
+
+    # - Row / column structure (QTableWidget equivalents)
+
+    def set_headers(self, labels: List[str]): #vers 1
+        labels = [str(label) for label in labels]
+        if len(labels) > self._columns:
+            self.set_column_count(len(labels))
+        self._headers = labels
+        if self._columns:
+            self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self._columns - 1)
+
+    def set_column_count(self, count: int): #vers 1
+        count = max(0, count)
+        if count > self._columns:
+            self.beginInsertColumns(QModelIndex(), self._columns, count - 1)
+            self._columns = count
+            self.endInsertColumns()
+        elif count < self._columns:
+            self.beginRemoveColumns(QModelIndex(), count, self._columns - 1)
+            self._columns = count
+            self._headers = self._headers[:count]
+            self._cells = {key: cell for key, cell in self._cells.items() if key[1] < count}
+            self.endRemoveColumns()
+
+    def set_row_count(self, count: int): #vers 2
+        count = max(0, count)
+        self._row_lookup = None
+        rows = len(self._entries)
+        if count > rows:
+            self.beginInsertRows(QModelIndex(), rows, count - 1)
+            self._entries.extend([None] * (count - rows))
+            self._flags.extend(bytes(count - rows))
+            self.endInsertRows()
+        elif count < rows:
+            self.beginRemoveRows(QModelIndex(), count, rows - 1)
+            del self._entries[count:]
+            del self._flags[count:]
+            self._cells = {key: cell for key, cell in self._cells.items() if key[0] < count}
+            self.endRemoveRows()
+
+    def insert_row(self, row: int): #vers 2
+        row = min(max(0, row), len(self._entries))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._row_lookup = None
+        self._entries.insert(row, None)
+        self._flags.insert(row, 0)
+        self._cells = {((r + 1 if r >= row else r), c): cell for (r, c), cell in self._cells.items()}
+        self.endInsertRows()
+
+    def remove_row(self, row: int): #vers 2
+        if not (0 <= row < len(self._entries)):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._row_lookup = None
+        del self._entries[row]
+        del self._flags[row]
+        self._cells = {((r - 1 if r > row else r), c): cell
+                       for (r, c), cell in self._cells.items() if r != row}
+        self.endRemoveRows()
+
+    def clear_contents(self, headers: bool = False): #vers 2
+        """Drop entries and cells, keep the row count (headers too unless asked)"""
+        self.beginResetModel()
+        self._entries = [None] * len(self._entries)
+        self._flags = bytearray(len(self._entries))
+        self._row_lookup = None
+        self._cells = {}
+        if headers:
+            self._headers = []
+        self.endResetModel()
+
+
+class IMGTableCell:
+    """QTableWidgetItem-like handle on one model cell - made on request, holds no data"""
+    __slots__ = ('_view', '_row', '_column')
+
+    def __init__(self, view: 'IMGEntryTableView', row: int, column: int): #vers 1
+        self._view = view
+        self._row = row
+        self._column = column
+
+    def __eq__(self, other): #vers 1
+        return (isinstance(other, IMGTableCell) and other._view is self._view
+                and other._row == self._row and other._column == self._column)
+
+    def __hash__(self): #vers 1
+        return hash((id(self._view), self._row, self._column))
+
+    def _get(self, role): #vers 1
+        return self._view.entry_model.cell_data(self._row, self._column, role)
+
+    def _set(self, role, value): #vers 1
+        self._view.entry_model.set_cell_data(self._row, self._column, role, value)
+
+    def row(self) -> int: #vers 1
+        return self._row
+
+    def column(self) -> int: #vers 1
+        return self._column
+
+    def tableWidget(self) -> 'IMGEntryTableView': #vers 1
+        return self._view
+
+    def text(self) -> str: #vers 1
+        return self._view.entry_model.cell_text(self._row, self._column)
+
+    def setText(self, text: str): #vers 1
+        self._set(Qt.ItemDataRole.DisplayRole, str(text))
+
+    def data(self, role): #vers 1
+        return self._get(role)
+
+    def setData(self, role, value): #vers 1
+        self._set(role, value)
+
+    def toolTip(self) -> str: #vers 1
+        return self._get(Qt.ItemDataRole.ToolTipRole) or ""
+
+    def setToolTip(self, tip: str): #vers 1
+        self._set(Qt.ItemDataRole.ToolTipRole, tip)
+
+    def icon(self) -> QIcon: #vers 1
+        return self._get(Qt.ItemDataRole.DecorationRole) or QIcon()
+
+    def setIcon(self, icon: QIcon): #vers 1
+        self._set(Qt.ItemDataRole.DecorationRole, icon)
+
+    def background(self) -> QBrush: #vers 1
+        return self._get(Qt.ItemDataRole.BackgroundRole) or QBrush()
+
+    def setBackground(self, brush): #vers 1
+        self._set(Qt.ItemDataRole.BackgroundRole, QBrush(brush))
+
+    def foreground(self) -> QBrush: #vers 1
+        return self._get(Qt.ItemDataRole.ForegroundRole) or QBrush()
+
+    def setForeground(self, brush): #vers 1
+        self._set(Qt.ItemDataRole.ForegroundRole, QBrush(brush))
+
+    def font(self) -> QFont: #vers 1
+        return QFont(self._get(Qt.ItemDataRole.FontRole) or self._view.font())
+
+    def setFont(self, font: QFont): #vers 1
+        self._set(Qt.ItemDataRole.FontRole, QFont(font))
+
+    def textAlignment(self): #vers 1
+        return self._get(Qt.ItemDataRole.TextAlignmentRole) or 0
+
+    def setTextAlignment(self, alignment): #vers 1
+        self._set(Qt.ItemDataRole.TextAlignmentRole, alignment)
+
+    def checkState(self): #vers 1
+        return self._get(Qt.ItemDataRole.CheckStateRole) or Qt.CheckState.Unchecked
+
+    def setCheckState(self, state): #vers 1
+        self._set(Qt.ItemDataRole.CheckStateRole, state)
+
+    def flags(self): #vers 1
+        return self._view.entry_model.flags(self._view.entry_model.index(self._row, self._column))
+
+    def setFlags(self, flags): #vers 1
+        self._set(_ROLE_FLAGS, flags)
+
+    def isSelected(self) -> bool: #vers 1
+        return self._view.selectionModel().isSelected(self._view.entry_model.index(self._row, self._column))
+
+    def setSelected(self, selected: bool): #vers 1
+        command = QItemSelectionModel.SelectionFlag.Select if selected else QItemSelectionModel.SelectionFlag.Deselect
+        self._view.selectionModel().select(self._view.entry_model.index(self._row, self._column), command)
+
+
+class IMGEntryTableView(QTableView):
+    """Entries table on IMGEntryTableModel with the QTableWidget calls IMG Factory uses"""
+    itemSelectionChanged = pyqtSignal()
+    itemClicked = pyqtSignal(object)
+    itemDoubleClicked = pyqtSignal(object)
+    cellClicked = pyqtSignal(int, int)
+    cellDoubleClicked = pyqtSignal(int, int)
+
+    def __init__(self, parent=None): #vers 1
+        super().__init__(parent)
+        self.entry_model = IMGEntryTableModel(self)
+        self.setModel(self.entry_model)
+        self.selectionModel().selectionChanged.connect(lambda selected, deselected: self.itemSelectionChanged.emit())
+        self.clicked.connect(self._on_clicked)
+        self.doubleClicked.connect(self._on_double_clicked)
+
+    def _on_clicked(self, index): #vers 1
+        self.cellClicked.emit(index.row(), index.column())
+        item = self.item(index.row(), index.column())
+        if item is not None:
+            self.itemClicked.emit(item)
+
+    def _on_double_clicked(self, index): #vers 1
+        self.cellDoubleClicked.emit(index.row(), index.column())
+        item = self.item(index.row(), index.column())
+        if item is not None:
+            self.itemDoubleClicked.emit(item)
+
+    def set_img_entries(self, entries) -> int: #vers 1
+        """Show IMG entries - returns the row count. Rows keep archive order
+        (sort indicator cleared) so nothing is formatted until it is painted."""
+        self.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        return self.entry_model.set_entries(entries)
+
+    def entry_at(self, row: int) -> Any: #vers 1
+        return self.entry_model.entry_at(row)
+
+    # - QTableWidget compatible calls
+
+    def rowCount(self) -> int: #vers 1
+        return self.entry_model.rowCount()
+
+    def setRowCount(self, rows: int): #vers 1
+        self.entry_model.set_row_count(rows)
+
+    def columnCount(self) -> int: #vers 1
+        return self.entry_model.columnCount()
+
+    def setColumnCount(self, columns: int): #vers 1
+        self.entry_model.set_column_count(columns)
+
+    def setHorizontalHeaderLabels(self, labels: List[str]): #vers 1
+        self.entry_model.set_headers(labels)
+
+    def horizontalHeaderItem(self, column: int) -> Optional[QTableWidgetItem]: #vers 1
+        if not (0 <= column < self.columnCount()):
+            return None
+        return QTableWidgetItem(str(self.entry_model.headerData(column, Qt.Orientation.Horizontal)))
+
+    def insertRow(self, row: int): #vers 1
+        self.entry_model.insert_row(row)
+
+    def removeRow(self, row: int): #vers 1
+        self.entry_model.remove_row(row)
+
+    def clearContents(self): #vers 1
+        self.entry_model.clear_contents()
+
+    def clear(self): #vers 1
+        self.entry_model.clear_contents(headers=True)
+
+    def item(self, row: int, column: int) -> Optional[IMGTableCell]: #vers 1
+        if self.entry_model.has_cell(row, column):
+            return IMGTableCell(self, row, column)
+        return None
+
+    def setItem(self, row: int, column: int, item): #vers 1
+        if isinstance(item, IMGTableCell):
+            source = item
+            item = QTableWidgetItem()
+            for role in _ITEM_ROLES:
+                item.setData(role, source.data(role))
+            item.setFlags(source.flags())
+        self.entry_model.set_cell_item(row, column, item)
+
+    def itemAt(self, position) -> Optional[IMGTableCell]: #vers 1
+        index = self.indexAt(position)
+        return self.item(index.row(), index.column()) if index.isValid() else None
+
+    def selectedItems(self) -> List[IMGTableCell]: #vers 1
+        has_cell = self.entry_model.has_cell
+        return [IMGTableCell(self, index.row(), index.column())
+                for index in self.selectionModel().selectedIndexes()
+                if has_cell(index.row(), index.column())]
+
+    def select_rows(self, rows, current: Optional[int] = None) -> int: #vers 1
+        """Select whole rows in one selection change - consecutive rows become one range.
+        current: row made current (scrolled to) without changing the selection."""
+        model = self.entry_model
+        last_column = max(0, model.columnCount() - 1)
+        selection = QItemSelection()
+        start = previous = None
+        for row in sorted(rows):
+            if start is not None and row == previous + 1:
+                previous = row
+                continue
+            if start is not None:
+                selection.select(model.index(start, 0), model.index(previous, last_column))
+            start = previous = row
+        if start is not None:
+            selection.select(model.index(start, 0), model.index(previous, last_column))
+        selection_model = self.selectionModel()
+        selection_model.select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect |
+                               QItemSelectionModel.SelectionFlag.Rows)
+        if current is not None and 0 <= current < model.rowCount():
+            index = model.index(current, 0)
+            selection_model.setCurrentIndex(index, QItemSelectionModel.SelectionFlag.NoUpdate)
+            self.scrollTo(index)
+        return len(rows)
+
+    def currentRow(self) -> int: #vers 1
+        return self.currentIndex().row()
+
+    def currentColumn(self) -> int: #vers 1
+        return self.currentIndex().column()
+
+    def currentItem(self) -> Optional[IMGTableCell]: #vers 1
+        index = self.currentIndex()
+        return self.item(index.row(), index.column()) if index.isValid() else None
+
+    def setCurrentCell(self, row: int, column: int): #vers 1
+        self.setCurrentIndex(self.entry_model.index(row, column))
+
+    def setCurrentItem(self, item): #vers 1
+        if item is not None:
+            self.setCurrentCell(item.row(), item.column())
+
+    def scrollToItem(self, item, hint=QAbstractItemView.ScrollHint.EnsureVisible): #vers 1
+        if item is not None:
+            self.scrollTo(self.entry_model.index(item.row(), item.column()), hint)
+
+    def cellWidget(self, row: int, column: int): #vers 1
+        return self.indexWidget(self.entry_model.index(row, column))
+
+    def setCellWidget(self, row: int, column: int, widget): #vers 1
+        self.setIndexWidget(self.entry_model.index(row, column), widget)
+
+    def sortItems(self, column: int, order=Qt.SortOrder.AscendingOrder): #vers 1
+        self.entry_model.sort(column, order)
+
+    def setStyleSheet(self, style_sheet: str): #vers 1
+        """Theme code writes QTableWidget selectors - apply them to this view"""
+        super().setStyleSheet(_TABLE_WIDGET_SELECTOR.sub('QTableView', style_sheet or ""))
+
+
+__all__ = [
+    'IMG_COLUMNS',
+    'IMGEntryTableModel',
+    'IMGEntryTableView',
+    'IMGTableCell',
+    'ROW_IMPORTED',
+    'ROW_PINNED',
+    'ROW_REPLACED',
+    'RW_COLUMNS',
+    'entry_row_flags'
+]
@@ -0,0 +1,208 @@
+#this belongs in gui/img_table_widgets.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - IMG Table Widgets
+
+"""
+IMG Table Widgets - Qt widgets for the IMG entries panel.
+Moved out of methods/img_core_classes.py so the IMG format classes import without Qt.
+"""
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QPushButton, QComboBox, QLineEdit, QGroupBox, QLabel)
+from PyQt6.QtCore import pyqtSignal, Qt
+
+from apps.methods.img_core_classes import CompressionType
+from apps.debug.img_debugger import img_debugger
+
+##Methods list -
+# create_entries_table_panel
+# integrate_filtering
+# populate_table_with_sample_data
+
+##Classes -
+# FilterPanel
+# IMGEntriesTable
+# IMGFileInfoPanel
+# TabFilterWidget
+
+class IMGEntriesTable(QTableWidget):
+    """Enhanced table widget for IMG entries"""
+    entry_double_clicked = pyqtSignal(object)
+    
+    def __init__(self, parent=None): #vers 1
+        super().__init__(parent)
+        self.setColumnCount(7)
+        self.setHorizontalHeaderLabels(['Name', 'Type', 'Size', 'Offset', 'Version', 'Compression', 'Status'])
+        
+        # Setup table properties
+        self.setAlternatingRowColors(True)
+        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
+        
+        # Auto-resize columns
+        header = self.horizontalHeader()
+        header.setStretchLastSection(True)
+        for i in range(6):
+            header.setSectionResizeMode(i, header.ResizeMode.ResizeToContents)
+
+class FilterPanel(QWidget):
+    """Filter panel for IMG entries"""
+    filter_changed = pyqtSignal(str)
+    
+    def __init__(self, parent=None): #vers 1
+        super().__init__(parent)
+        self._setup_ui()
+    
+    def _setup_ui(self): #vers 1
+        layout = QVBoxLayout(self)
+        
+        # File type filter
+        type_group = QGroupBox("File Type Filter")
+        type_layout = QHBoxLayout(type_group)
+        
+        self.type_combo = QComboBox()
+        self.type_combo.addItems(['All', 'DFF', 'TXD', 'COL', 'IFP', 'IPL', 'DAT', 'WAV'])
+        self.type_combo.currentTextChanged.connect(self.filter_changed.emit)
+        type_layout.addWidget(self.type_combo)
+        
+        # Search filter
+        search_group = QGroupBox("Search")
+        search_layout = QHBoxLayout(search_group)
+        
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search entries...")
+        self.search_edit.textChanged.connect(self.filter_changed.emit)
+        search_layout.addWidget(self.search_edit)
+        
+        layout.addWidget(type_group)
+        layout.addWidget(search_group)
+
+class IMGFileInfoPanel(QWidget):
+    """Information panel for IMG file details"""
+    
+    def __init__(self, parent=None): #vers 1
+        super().__init__(parent)
+        self._setup_ui()
+    
+    def _setup_ui(self): #vers 1
+        layout = QVBoxLayout(self)
+        
+        self.info_label = QLabel("No IMG file loaded")
+        layout.addWidget(self.info_label)
+
+class TabFilterWidget(QWidget):
+    """Tab-specific filter widget"""
+    
+    def __init__(self, parent=None): #vers 1
+        super().__init__(parent)
+        self._setup_ui()
+    
+    def _setup_ui(self): #vers 1
+        layout = QHBoxLayout(self)
+        
+        self.filter_combo = QComboBox()
+        self.filter_combo.addItems(['All Files', 'Models (DFF)', 'Textures (TXD)', 'Collision (COL)', 'Animations (IFP)'])
+        layout.addWidget(self.filter_combo)
+
+def integrate_filtering(main_window): #vers 2
+    """Integrate filtering functionality into main window"""
+    try:
+        # Create filter widget
+        filter_widget = FilterPanel(main_window)
+
+        # Connect filter widget to table
+        if hasattr(filter_widget, 'filter_changed'):
+            filter_widget.filter_changed.connect(table_widget.apply_filter)
+
+        return filter_widget
+    except Exception as e:
+        img_debugger.error(f"Error integrating filtering: {e}")
+        return None
+
+def create_entries_table_panel(main_window): #vers 4
+    """Create the complete entries table panel"""
+    panel = QWidget()
+    layout = QVBoxLayout(panel)
+    layout.setContentsMargins(0, 0, 0, 0)
+
+    # IMG file information
+    info_group = QGroupBox("IMG File Information")
+    info_layout = QVBoxLayout(info_group)
+
+    main_window.file_info_panel = IMGFileInfoPanel()
+    info_layout.addWidget(main_window.file_info_panel)
+
+    layout.addWidget(info_group)
+
+    # Filter panel
+    filter_group = QGroupBox("Filter & Search")
+    filter_layout = QVBoxLayout(filter_group)
+
+    main_window.filter_panel = FilterPanel()
+    filter_layout.addWidget(main_window.filter_panel)
+
+    layout.addWidget(filter_group)
+
+    # Entries table
+    entries_group = QGroupBox("Archive Entries")
+    entries_layout = QVBoxLayout(entries_group)
+
+    main_window.entries_table = IMGEntriesTable()
+    entries_layout.addWidget(main_window.entries_table)
+
+    layout.addWidget(entries_group)
+
+    # Connect filter to table
+    main_window.filter_panel.filter_changed.connect(main_window.entries_table.apply_filter)
+
+    # SIMPLIFIED CONNECTION - Let main app handle its own signals
+    # Don't auto-connect anything from here to prevent conflicts
+
+    if hasattr(main_window, 'on_entry_double_clicked'):
+        # Only connect double-click since that doesn't cause logging conflicts
+        try:
+            main_window.entries_table.entry_double_clicked.disconnect()
+        except:
+            pass
+        main_window.entries_table.entry_double_clicked.connect(main_window.on_entry_double_clicked)
+
+    return panel
+
+
+def populate_table_with_sample_data(table): #vers 3
+    """Populate table with sample data for testing"""
+    sample_entries = [
+        {"name": "player.dff", "extension": "DFF", "size": 250880, "offset": 0x2000, "version": "RW 3.6"},
+        {"name": "player.txd", "extension": "TXD", "size": 524288, "offset": 0x42000, "version": "RW 3.6"},
+        {"name": "vehicle.col", "extension": "COL", "size": 131072, "offset": 0x84000, "version": "COL 2"},
+        {"name": "dance.ifp", "extension": "IFP", "size": 1258291, "offset": 0xA4000, "version": "IFP 1"},
+    ]
+
+    # Convert to mock entry objects
+    class MockEntry:
+        def __init__(self, data): #vers 1
+            self.name = data["name"]
+            self.extension = data["extension"]
+            self.size = data["size"]
+            self.offset = data["offset"]
+            self._version = data["version"]
+            self.is_new_entry = False
+            self.is_replaced = False
+            self.compression_type = CompressionType.NONE
+
+        def get_version_text(self): #vers 1
+            return self._version
+
+    mock_entries = [MockEntry(data) for data in sample_entries]
+    table.populate_entries(mock_entries)
+
+
+__all__ = [
+    'IMGEntriesTable',
+    'FilterPanel',
+    'IMGFileInfoPanel',
+    'TabFilterWidget',
+    'integrate_filtering',
+    'create_entries_table_panel',
+    'populate_table_with_sample_data'
+]
@@ -1,4 +1,4 @@
-#this belongs in gui/ status_bar.py - Version: 14
+#this belongs in gui/ status_bar.py - Version: 17
 # X-Seti - Aug06 2025 - IMG Factory 1.5 - Universal Theme Status Bar
 # UPDATED: Removed StatusBarTheme class, now uses AppSettings universal theme system
 # PRESERVES: 100% of existing functionality - all widgets, methods, and features
@@ -186,6 +186,12 @@ def _add_status_methods(main_window):
         """Update IMG file status"""
         main_window.img_status_widget.update_img_status(img_file, filename, entry_count, file_size, version)
     
+    def refresh_img_status():
+        """Re-read the current IMG into the status widget - call after add/remove/save/compact"""
+        img_file = getattr(main_window, 'current_img', None)
+        if img_file:
+            main_window.img_status_widget.update_img_status(img_file)
+    
     def set_ready_status():
         """Set status to ready"""
         show_permanent_status("Ready")
@@ -209,6 +215,7 @@ def _add_status_methods(main_window):
     main_window.update_progress = update_progress
     main_window.hide_progress = hide_progress
     main_window.update_img_status = update_img_status
+    main_window.refresh_img_status = refresh_img_status
     main_window.set_ready_status = set_ready_status
     main_window.set_operation_status = set_operation_status
 
@@ -408,6 +415,13 @@ class IMGStatusWidget(QWidget):
         # Version
         self.version_label = QLabel("Version: Unknown")
         layout.addWidget(self.version_label)
+
+        # Separator
+        layout.addWidget(QLabel("|"))
+
+        # Free space / fragmentation
+        self.space_label = QLabel("Free: -")
+        layout.addWidget(self.space_label)
     
     def update_img_status(self, img_file=None, filename="", entry_count=0, file_size=0, version="Unknown"):
         """Update IMG file status display"""
@@ -417,6 +431,9 @@ class IMGStatusWidget(QWidget):
             entry_count = len(img_file.entries) if hasattr(img_file, 'entries') and img_file.entries else 0
             file_size = img_file.file_size if hasattr(img_file, 'file_size') else 0
             version = str(img_file.version) if hasattr(img_file, 'version') else "Unknown"
+            # Space and compression come from the archive - a bare entry count keeps them
+            self._update_space_status(img_file)
+            self._update_compression_status(img_file)
         
         # Update display
         if filename:
@@ -436,6 +453,43 @@ class IMGStatusWidget(QWidget):
         self.entries_label.setText("Entries: 0")
         self.size_label.setText("Size: 0 B")
         self.version_label.setText("Version: Unknown")
+        self.space_label.setText("Free: -")
+        self.space_label.setToolTip("")
+        self.size_label.setToolTip("")
+
+    def _update_compression_status(self, img_file):
+        """Compressed entries and decompression cache hits/misses as the size tooltip"""
+        if not hasattr(img_file, 'get_compression_stats'):
+            self.size_label.setToolTip("")
+            return
+        stats = img_file.get_compression_stats()
+        self.size_label.setToolTip(
+            f"Compressed entries: {stats['compressed_entries']} "
+            f"({self._format_file_size(stats['stored_bytes'])} stored, "
+            f"{self._format_file_size(stats['uncompressed_bytes'])} decompressed)\n"
+            f"Decompression cache: {stats['cache_hits']} hits, {stats['cache_misses']} misses "
+            f"({stats['cache_hit_rate']:.0f}%), {self._format_file_size(stats['cache_bytes'])} of "
+            f"{self._format_file_size(stats['cache_max_bytes'])} used")
+
+    def _update_space_status(self, img_file):
+        """Show dead space and fragmentation from the IMG free space map"""
+        if not hasattr(img_file, 'get_free_space_map'):
+            self.space_label.setText("Free: -")
+            self.space_label.setToolTip("")
+            return
+        try:
+            stats = img_file.get_free_space_map().get_stats()
+        except Exception as e:
+            print(f"[DEBUG] Free space map unavailable: {e}")
+            self.space_label.setText("Free: -")
+            return
+        dead = stats['free_bytes'] + stats['reclaimable_bytes']
+        self.space_label.setText(
+            f"Free: {self._format_file_size(dead)} ({stats['fragmentation']:.0f}% frag)")
+        self.space_label.setToolTip(
+            f"Holes: {stats['hole_count']}, largest {self._format_file_size(stats['largest_hole_bytes'])}\n"
+            f"Reclaimable after save: {self._format_file_size(stats['reclaimable_bytes'])}\n"
+            f"Dead space: {stats['dead_space_percent']:.1f}% of data area")
     
     def _format_file_size(self, size_bytes):
         """Format file size for display"""
@@ -0,0 +1,99 @@
+#this belongs in methods/asset_index_scan.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - Background Asset Index Scan
+
+"""
+Background Asset Index Scan - Keeps the cross-archive asset index (img_asset_index)
+up to date without blocking the GUI. AssetIndexThread walks one or more folders
+on its own SQLite connection; unchanged archives are skipped by mtime so a refresh
+of an already indexed game folder takes a moment. Only one scan runs at a time.
+"""
+
+from typing import List, Optional
+
+from PyQt6.QtCore import pyqtSignal, QThread
+
+from apps.methods.img_asset_index import IMGAssetIndex
+
+##Methods list -
+# cancel_asset_index_scan
+# start_asset_index_scan
+
+##Classes -
+# AssetIndexThread
+
+_active_scan: Optional['AssetIndexThread'] = None
+
+
+class AssetIndexThread(QThread):
+    """Index every archive under the given folders"""
+
+    progress = pyqtSignal(int, int, str)        # done, total, archive path
+    scan_finished = pyqtSignal(dict, bool)      # summed stats, cancelled
+
+    def __init__(self, roots: List[str], db_path: Optional[str] = None, hash_entries: bool = False): #vers 1
+        super().__init__()
+        self.roots = list(roots)
+        self.db_path = db_path
+        self.hash_entries = hash_entries
+        self._stop_requested = False
+
+    def cancel(self): #vers 1
+        """Stop after the current archive"""
+        self._stop_requested = True
+
+    def is_cancelled(self) -> bool: #vers 1
+        return self._stop_requested
+
+    def run(self): #vers 1
+        totals = {'archives': 0, 'indexed': 0, 'skipped': 0, 'removed': 0, 'failed': 0, 'entries': 0}
+        try:
+            # sqlite3 connections belong to the thread that made them
+            with IMGAssetIndex(self.db_path) as index:
+                for root in self.roots:
+                    if self._stop_requested:
+                        break
+                    stats = index.update_folder(root, self.progress.emit, self.is_cancelled, self.hash_entries)
+                    for key, value in stats.items():
+                        totals[key] += value
+        except Exception as e:
+            print(f"[ERROR] Asset index scan failed: {e}")
+        self.scan_finished.emit(totals, self._stop_requested)
+
+
+def start_asset_index_scan(roots: List[str], db_path: Optional[str] = None,
+                           hash_entries: bool = False) -> Optional[AssetIndexThread]: #vers 1
+    """Start indexing roots in the background - connect to the thread's signals.
+    Returns None while another scan is still running."""
+    global _active_scan
+    try:
+        if _active_scan is not None and _active_scan.isRunning():
+            return None
+        if not roots:
+            return None
+        thread = AssetIndexThread(roots, db_path, hash_entries)
+        _active_scan = thread
+        thread.start(QThread.Priority.LowPriority)
+        return thread
+
+    except Exception as e:
+        print(f"[ERROR] Could not start asset index scan: {e}")
+        return None
+
+
+def cancel_asset_index_scan(wait_ms: int = 2000) -> bool: #vers 1
+    """Cancel the running scan and wait for its thread - True if one was running"""
+    global _active_scan
+    thread = _active_scan
+    _active_scan = None
+    if thread is None or not thread.isRunning():
+        return False
+    thread.cancel()
+    thread.wait(wait_ms)
+    return True
+
+
+__all__ = [
+    'AssetIndexThread',
+    'cancel_asset_index_scan',
+    'start_asset_index_scan'
+]
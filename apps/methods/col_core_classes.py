@@ -1,4 +1,4 @@
-#this belongs in apps/methods/col_core_classes.py OR apps/components/Col_Editor/depends/col_core_classes.py - Version: 4
+#this belongs in apps/methods/col_core_classes.py OR apps/components/Col_Editor/depends/col_core_classes.py - Version: 5
 # X-Seti - December13 2025 - IMG Factory 1.5 - COL Core Classes
 
 """
@@ -12,7 +12,7 @@ import struct
 import os
 from enum import Enum
 from typing import List, Tuple, Optional
-from apps.debug.debug_functions import img_debugger
+from apps.debug.img_debugger import img_debugger
 
 # Global debug control
 _global_debug_enabled = False
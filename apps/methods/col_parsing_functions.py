@@ -1,4 +1,4 @@
-#this belongs in methods.col_parsing_functions.py - Version: 1
+#this belongs in methods.col_parsing_functions.py - Version: 2
 # X-Seti - July23 2025 - IMG Factory 1.5 - COL Parsing Functions
 # Complete COL parsing functions with safe parsing and IMG debug system - EXACT OLD VERSION PORT
 
@@ -10,7 +10,7 @@ Handles all COL format versions (COL1/COL2/COL3/COL4) with detailed logging
 import struct
 import os
 from typing import Dict, List, Tuple, Optional
-from apps.debug.debug_functions import img_debugger
+from apps.debug.img_debugger import img_debugger
 from apps.methods.col_core_classes import is_col_debug_enabled
 
 ##Methods list -
@@ -0,0 +1,96 @@
+#this belongs in methods/component_registry.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - Lazy Component Registry
+
+"""
+Component Registry - Workshops, editors and tools loaded on first use.
+Each component is registered by name with the module that provides it. The
+module is only imported when one of its functions or classes is first needed,
+so start up does not pay for tools a session never opens.
+"""
+
+import time
+import importlib
+from typing import Dict, Callable, Any
+
+##Methods list -
+# call_component
+# get_component
+# is_loaded
+# lazy_component
+# load_component
+# register_component
+
+# Component name -> module path
+COMPONENTS: Dict[str, str] = {
+    'txd_workshop': 'apps.components.Txd_Editor.txd_workshop',
+    'col_workshop': 'apps.components.Col_Editor.col_workshop',
+    'map_workshop': 'apps.components.Map_Editor.Map_Workshop',
+    'hex_editor': 'apps.components.Hex_Editor',
+    'ide_editor': 'apps.components.Ide_Editor.ide_editor',
+    'img_creator': 'apps.components.Img_Creator.img_creator',
+    'img_formats': 'apps.core.img_formats',
+    'img_merger': 'apps.core.img_merger',
+    'img_split': 'apps.core.img_split',
+    'img_convert': 'apps.core.convert',
+    'col_viewer': 'apps.core.col_viewer_integration',
+}
+
+_loaded: Dict[str, Any] = {}
+
+
+def register_component(name: str, module_path: str): #vers 1
+    """Register (or redirect) a component without importing it"""
+    COMPONENTS[name] = module_path
+    _loaded.pop(name, None)
+
+
+def is_loaded(name: str) -> bool: #vers 1
+    """True once the component module has been imported"""
+    return name in _loaded
+
+
+def load_component(name: str): #vers 1
+    """Import a component module on first use - raises ImportError/KeyError on failure"""
+    module = _loaded.get(name)
+    if module is not None:
+        return module
+    module_path = COMPONENTS[name]
+    start = time.perf_counter()
+    module = importlib.import_module(module_path)
+    elapsed = time.perf_counter() - start
+    _loaded[name] = module
+    print(f"[DEBUG] Loaded component {name} ({module_path}) in {elapsed * 1000:.1f} ms")
+
+    from apps.debug.startup_profiler import startup_profiler
+    startup_profiler.record_init(module_path, "<load>", elapsed)
+    return module
+
+
+def get_component(name: str, attr: str) -> Any: #vers 1
+    """Function or class attr of a component, loading it if needed"""
+    return getattr(load_component(name), attr)
+
+
+def call_component(name: str, attr: str, *args, **kwargs) -> Any: #vers 1
+    """Load a component and call one of its functions"""
+    return get_component(name, attr)(*args, **kwargs)
+
+
+def lazy_component(name: str, attr: str) -> Callable: #vers 1
+    """Stand-in callable for attr - the component loads on the first call"""
+    def call(*args, **kwargs):
+        return get_component(name, attr)(*args, **kwargs)
+    call.__name__ = attr
+    call.__qualname__ = f"lazy_component.<{name}.{attr}>"
+    return call
+
+
+__all__ = [
+    'COMPONENTS',
+    'call_component',
+    'get_component',
+    'is_loaded',
+    'lazy_component',
+    'load_component',
+    'register_component'
+]
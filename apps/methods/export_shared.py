@@ -1,4 +1,4 @@
-#this belongs in methods/export_shared.py - Version: 1
+#this belongs in methods/export_shared.py - Version: 4
 # X-Seti - Aug15 2025 - IMG Factory 1.5 - Shared Export Functions
 
 """
@@ -11,6 +11,8 @@ from typing import List, Optional, Dict, Any
 from PyQt6.QtWidgets import QMessageBox, QFileDialog, QProgressDialog
 from PyQt6.QtCore import pyqtSignal, Qt, QThread
 
+from apps.methods.img_export_engine import export_entries
+
 ##Methods list -
 # get_export_folder
 # get_selected_entries
@@ -20,74 +22,70 @@ from PyQt6.QtCore import pyqtSignal, Qt, QThread
 ##Classes -
 # ExportThread
 
-class ExportThread(QThread): #vers 2
-    """Background thread for exporting files - FIXED threading issues"""
+class ExportThread(QThread): #vers 3
+    """Background thread for exporting files - parallel zero-copy export engine"""
     
     progress_updated = pyqtSignal(int, str)  # progress %, message
     export_completed = pyqtSignal(bool, str, dict)  # success, message, stats
     
-    def __init__(self, main_window, entries_to_export: List, export_dir: str, export_options: dict):
+    def __init__(self, main_window, entries_to_export: List, export_dir: str, export_options: dict, img_file=None): #vers 4
         super().__init__()
         self.main_window = main_window
         self.entries_to_export = entries_to_export
         self.export_dir = export_dir
         self.export_options = export_options
+        # Archive for entries without a parent reference - others export from their own archive
+        self.img_file = img_file
         self.stats = {'exported': 0, 'skipped': 0, 'failed': 0}
         self._stop_requested = False
         
-    def run(self): #vers 2
-        """Run export operation in background - FIXED to prevent freezing"""
+    def _group_by_archive(self) -> Optional[List[tuple]]: #vers 1
+        """[(img_file, entries)] in first-seen order - None when an entry has no archive"""
+        groups: Dict[int, tuple] = {}
+        for entry in self.entries_to_export:
+            img_file = getattr(entry, '_img_file', None) or self.img_file
+            if img_file is None or not hasattr(img_file, 'get_data_path'):
+                return None
+            groups.setdefault(id(img_file), (img_file, []))[1].append(entry)
+        return list(groups.values())
+
+    def run(self): #vers 4
+        """Run export operation in background - progress signals are coalesced by the engine.
+        Each entry is read from the archive it belongs to."""
         try:
-            total_entries = len(self.entries_to_export)
-            
-            for i, entry in enumerate(self.entries_to_export):
-                # Check if stop was requested
+            groups = self._group_by_archive()
+            if groups is None:
+                self.export_completed.emit(False, "Export failed: no IMG file for these entries", self.stats)
+                return
+
+            subdir_for = self._get_type_subdir if self.export_options.get('organize_by_type', True) else None
+            result = {'exported': 0, 'skipped': 0, 'failed': 0, 'cancelled': False, 'failed_names': []}
+            for img_file, entries in groups:
                 if self._stop_requested:
+                    result['cancelled'] = True
                     break
-                    
-                entry_name = getattr(entry, 'name', f'entry_{i}')
-                progress = int((i / total_entries) * 100)
-                
-                self.progress_updated.emit(progress, f"Exporting {entry_name}...")
-                
-                try:
-                    # Determine output path
-                    if self.export_options.get('organize_by_type', True):
-                        subdir = self._get_type_subdir(entry_name)
-                        output_dir = os.path.join(self.export_dir, subdir)
-                    else:
-                        output_dir = self.export_dir
-                    
-                    os.makedirs(output_dir, exist_ok=True)
-                    output_path = os.path.join(output_dir, entry_name)
-                    
-                    # Skip if exists and not overwriting
-                    if os.path.exists(output_path) and not self.export_options.get('overwrite', True):
-                        self.stats['skipped'] += 1
-                        continue
-                    
-                    # Get entry data
-                    entry_data = self._get_entry_data(entry)
-                    if entry_data is None:
-                        self.stats['failed'] += 1
-                        continue
-                    
-                    # Write file
-                    with open(output_path, 'wb') as f:
-                        f.write(entry_data)
-                    
-                    self.stats['exported'] += 1
-                    
-                except Exception as e:
-                    self.stats['failed'] += 1
-                    if hasattr(self.main_window, 'log_message'):
-                        self.main_window.log_message(f"❌ Export error for {entry_name}: {e}")
-            
-            # CRITICAL: Emit final progress and completion signals
+                part = export_entries(
+                    img_file, entries, self.export_dir,
+                    subdir_for=subdir_for,
+                    overwrite=self.export_options.get('overwrite', True),
+                    skip_empty=self.export_options.get('skip_empty', False),
+                    progress_callback=self._report_progress,
+                    cancelled=lambda: self._stop_requested)
+                for key in ('exported', 'skipped', 'failed', 'failed_names'):
+                    result[key] += part[key]
+                result['cancelled'] = result['cancelled'] or part['cancelled']
+
+            for key in ('exported', 'skipped', 'failed'):
+                self.stats[key] = result[key]
+            if result['failed_names'] and hasattr(self.main_window, 'log_message'):
+                shown = ', '.join(result['failed_names'][:10])
+                more = len(result['failed_names']) - 10
+                self.main_window.log_message(f"❌ Export failed for {shown}" + (f" (+{more} more)" if more > 0 else ""))
+
             self.progress_updated.emit(100, "Export completed!")
             
             # Create success message
-            success_msg = f"Export completed: {self.stats['exported']} exported"
+            success_msg = f"Export {'cancelled' if result['cancelled'] else 'completed'}: {self.stats['exported']} exported"
             if self.stats['skipped'] > 0:
                 success_msg += f", {self.stats['skipped']} skipped"
             if self.stats['failed'] > 0:
@@ -99,20 +97,16 @@ class ExportThread(QThread): #vers 2
         except Exception as e:
             # CRITICAL: Always emit completion signal even on error
             self.export_completed.emit(False, f"Export failed: {str(e)}", self.stats)
-        finally:
-            # CRITICAL: Ensure thread terminates properly
-            self.quit()
-            self.wait()
+
+    def _report_progress(self, done: int, total: int, entry_name: str): #vers 1
+        """Engine progress (already time-coalesced) -> progress_updated"""
+        self.progress_updated.emit(int(done * 100 / total), f"Exporting {entry_name} ({done}/{total})...")
     
-    def stop_export(self): #vers 2
-        """Request export to stop and cleanup properly"""
+    def stop_export(self): #vers 3
+        """Request export to stop - workers finish the file they are on"""
         self._stop_requested = True
-        # Force quit if running
         if self.isRunning():
-            self.quit()
-            if not self.wait(2000):  # Wait max 2 seconds
-                self.terminate()  # Force terminate if needed
-                self.wait(1000)   # Wait for termination
+            self.wait(5000)
     
     def _get_type_subdir(self, filename: str) -> str: #vers 3
         """Get subdirectory based on file type - enhanced for Assists folder structure and COL support"""
@@ -147,11 +141,13 @@ class ExportThread(QThread): #vers 2
             }
             return type_mapping.get(ext, 'other')
     
-    def _get_entry_data(self, entry) -> Optional[bytes]: #vers 1
+    def _get_entry_data(self, entry) -> Optional[bytes]: #vers 2
         """Get entry data using various methods"""
         try:
             # Try different methods to get entry data
-            if hasattr(entry, 'get_data'):
+            if hasattr(entry, 'get_data_view'):
+                return entry.get_data_view()
+            elif hasattr(entry, 'get_data'):
                 return entry.get_data()
             elif hasattr(entry, '_cached_data') and entry._cached_data:
                 return entry._cached_data
@@ -1,4 +1,4 @@
-#this belongs in methods/find_duplicates.py - Version: 1
+#this belongs in methods/find_duplicates.py - Version: 2
 # X-Seti - August27 2025 - IMG Factory 1.5 - Duplicate Detection Functions
 # Moved from apps.components.img_manager.py
 
@@ -17,6 +17,10 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
+# Duplicate search itself is Qt free (used by the CLI too)
+from apps.methods.img_duplicates import (
+    find_duplicates_by_hash, find_duplicates_by_name, find_duplicates_by_size)
+
 ##Methods list -
 # find_duplicates_by_hash
 # find_duplicates_by_name
@@ -167,75 +171,6 @@ class DuplicateFinderDialog(QDialog): #vers 1
             self.files_to_remove = files_to_remove
 
 
-def find_duplicates_by_hash(img_file, progress_callback=None) -> Dict[str, List[str]]: #vers 1
-    """Find duplicate files by content hash - MOVED FROM img_manager.py"""
-    try:
-        hash_map = {}
-        duplicates = {}
-        total_entries = len(img_file.entries)
-        
-        for i, entry in enumerate(img_file.entries):
-            try:
-                # Progress callback
-                if progress_callback and i % 50 == 0:
-                    progress_callback(i, total_entries, f"Hashing: {entry.name}")
-                
-                data = entry.get_data()
-                file_hash = hashlib.md5(data).hexdigest()
-                
-                if file_hash in hash_map:
-                    if file_hash not in duplicates:
-                        duplicates[file_hash] = [hash_map[file_hash]]
-                    duplicates[file_hash].append(entry.name)
-                else:
-                    hash_map[file_hash] = entry.name
-                    
-            except Exception:
-                continue
-        
-        if progress_callback:
-            progress_callback(total_entries, total_entries, "Complete")
-        
-        return duplicates
-        
-    except Exception:
-        return {}
-
-
-def find_duplicates_by_name(img_file) -> Dict[str, List[str]]: #vers 1
-    """Find duplicate files by filename"""
-    try:
-        name_map = defaultdict(list)
-        
-        for entry in img_file.entries:
-            name_map[entry.name].append(entry.name)
-        
-        # Return only actual duplicates (more than one occurrence)
-        duplicates = {name: files for name, files in name_map.items() if len(files) > 1}
-        
-        return duplicates
-        
-    except Exception:
-        return {}
-
-
-def find_duplicates_by_size(img_file) -> Dict[int, List[str]]: #vers 1
-    """Find potential duplicate files by size"""
-    try:
-        size_map = defaultdict(list)
-        
-        for entry in img_file.entries:
-            size_map[entry.size].append(entry.name)
-        
-        # Return only sizes with multiple files
-        duplicates = {size: files for size, files in size_map.items() if len(files) > 1}
-        
-        return duplicates
-        
-    except Exception:
-        return {}
-
-
 def show_duplicates_dialog(main_window) -> Optional[List[str]]: #vers 1
     """Show duplicates dialog and return files to remove"""
     try:
@@ -0,0 +1,171 @@
+#this belongs in methods/img_archive_merge.py - Version: 2
+# X-Seti - October16 2026 - IMG Factory 1.5 - Streaming IMG Merge
+
+"""
+IMG Archive Merge - Merges several IMG archives into one without holding entry data.
+Each source is opened once for its directory; the merged directory (duplicate
+renames, skips and replacements included) and the output layout are planned
+from names, offsets and sizes alone, then img_stream_writer.write_archive copies
+the sector ranges from each source straight into the output temp file
+(copy_file_range where available) and renames it into place. Memory use depends
+on the entry count, not on archive size. Qt-free - used by the merge dialog.
+"""
+
+import os
+import struct
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from apps.methods.img_core_classes import IMGFile, IMGVersion
+from apps.methods.img_stream_writer import (
+    align_to_sector, pack_directory_record, plan_sequential_layout,
+    shared_layout_savings, temp_path_for, write_archive)
+
+##Methods list -
+# merge_archives
+# plan_merge
+# unique_entry_name
+
+##Classes -
+# MergeEntry
+
+DUPLICATE_STRATEGIES = ('rename', 'skip', 'replace')
+MAX_ENTRY_NAME = 23              # 24-byte directory name, NUL terminated
+
+
+class MergeEntry:
+    """One entry of the merged archive - where its data lives in which source"""
+
+    __slots__ = ('name', 'offset', 'size', 'source', 'source_index')
+
+    def __init__(self, name: str, offset: int, size: int, source: str, source_index: int): #vers 1
+        self.name = name
+        self.offset = offset
+        self.size = size
+        self.source = source
+        self.source_index = source_index
+
+
+def unique_entry_name(name: str, taken: set) -> str: #vers 1
+    """name_1.ext, name_2.ext ... not in taken (lower case names), fitting the 24-byte field"""
+    if '.' in name:
+        stem, ext = name.rsplit('.', 1)
+        ext = '.' + ext
+    else:
+        stem, ext = name, ''
+    counter = 1
+    while True:
+        suffix = f"_{counter}{ext}"
+        candidate = stem[:max(1, MAX_ENTRY_NAME - len(suffix))] + suffix
+        if candidate.lower() not in taken:
+            return candidate
+        counter += 1
+
+
+def plan_merge(source_paths: List[str], duplicate_strategy: str = 'rename',
+               progress_callback: Optional[Callable[[int, str], None]] = None) -> Tuple[List[MergeEntry], Dict[str, Any]]: #vers 2
+    """Merged directory in source order - one directory pass per source.
+    Names compare case-insensitively (as the games do). duplicate_strategy:
+    rename - later copies get a _N suffix, skip - first copy wins,
+    replace - later copies take the earlier one's place.
+    Returns (entries, stats): sources, failed_sources, renamed, skipped, replaced, invalid."""
+    if duplicate_strategy not in DUPLICATE_STRATEGIES:
+        raise ValueError(f"Unknown duplicate strategy: {duplicate_strategy}")
+    merged: List[MergeEntry] = []
+    positions: Dict[str, int] = {}
+    stats: Dict[str, Any] = {'sources': 0, 'failed_sources': [], 'renamed': 0,
+                             'skipped': 0, 'replaced': 0, 'invalid': 0}
+
+    for index, path in enumerate(source_paths):
+        if progress_callback:
+            progress_callback(int(index * 100 / len(source_paths)), f"Reading directory: {os.path.basename(path)}")
+        source = IMGFile(path)
+        # Directory only - no RW header sweep, no entry data
+        source.defer_rw_probe = True
+        try:
+            if not source.open():
+                stats['failed_sources'].append(path)
+                continue
+            data_path = source.get_data_path()
+            data_size = os.path.getsize(data_path)
+            records = [(entry.name, entry.offset, entry.size) for entry in source.entries]
+        except OSError:
+            stats['failed_sources'].append(path)
+            continue
+        finally:
+            source.close()
+        stats['sources'] += 1
+
+        for name, offset, size in records:
+            # Entry pointing past the end of its data file - nothing to copy.
+            # A last entry ending unpadded at EOF only lacks zero padding.
+            if offset + size > align_to_sector(data_size):
+                stats['invalid'] += 1
+                continue
+            key = name.lower()
+            if key in positions:
+                if duplicate_strategy == 'skip':
+                    stats['skipped'] += 1
+                    continue
+                if duplicate_strategy == 'replace':
+                    merged[positions[key]] = MergeEntry(merged[positions[key]].name, offset, size, data_path, index)
+                    stats['replaced'] += 1
+                    continue
+                name = unique_entry_name(name, positions)
+                key = name.lower()
+                stats['renamed'] += 1
+            positions[key] = len(merged)
+            merged.append(MergeEntry(name, offset, size, data_path, index))
+
+    return merged, stats
+
+
+def merge_archives(source_paths: List[str], output_path: str, version: IMGVersion = IMGVersion.VERSION_2,
+                   duplicate_strategy: str = 'rename',
+                   progress_callback: Optional[Callable[[int, str], None]] = None) -> Dict[str, Any]: #vers 1
+    """Merge source archives into output_path (VER2 .img, or a DIR/IMG pair for
+    VERSION_1 - output_path names the .img). progress_callback(percent, message).
+    Returns the plan_merge stats plus entries, output_size and shared_bytes."""
+    def report(start, span):
+        if progress_callback is None:
+            return None
+        return lambda percent, message: progress_callback(start + percent * span // 100, message)
+
+    entries, stats = plan_merge(source_paths, duplicate_strategy, report(0, 10))
+    if not entries:
+        raise ValueError("No entries to merge")
+
+    # Sources keep their own shared ranges (deduplicated archives) - never across sources
+    share_keys = [('range', entry.source_index, entry.offset, entry.size) for entry in entries]
+    if version == IMGVersion.VERSION_1:
+        img_path = output_path if output_path.lower().endswith('.img') else output_path + '.img'
+        dir_path = img_path[:-4] + '.dir'
+        header = b''
+        layout = plan_sequential_layout(entries, 0, share_keys)
+    else:
+        img_path, dir_path = output_path, None
+        header = b'VER2' + struct.pack('<I', len(entries))
+        layout = plan_sequential_layout(entries, align_to_sector(8 + len(entries) * 32), share_keys)
+    records = b''.join(pack_directory_record(offset, size, entry.name)
+                       for entry, (offset, size) in zip(entries, layout))
+
+    if progress_callback:
+        progress_callback(10, f"Writing {len(entries)} entries...")
+    img_temp = write_archive(img_path, dir_path, header, records, entries, layout, None,
+                             report(10, 90), entry_sources=[entry.source for entry in entries])
+    os.replace(img_temp, img_path)
+    if dir_path is not None:
+        os.replace(temp_path_for(dir_path), dir_path)
+
+    stats['entries'] = len(entries)
+    stats['output_size'] = os.path.getsize(img_path)
+    stats['shared_bytes'] = shared_layout_savings(layout)[1]
+    return stats
+
+
+__all__ = [
+    'DUPLICATE_STRATEGIES',
+    'MergeEntry',
+    'merge_archives',
+    'plan_merge',
+    'unique_entry_name'
+]
@@ -0,0 +1,269 @@
+#this belongs in methods/img_asset_index.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - Cross-Archive Asset Index
+
+"""
+IMG Asset Index - Every entry of every IMG archive under a game or project folder
+in one SQLite database (name, archive, offset, size, type and content hash), so
+"which IMG has vegasroad05.dff" is a query instead of opening archives one by one.
+Folders are re-scanned incrementally: an archive is only read again when its size
+or mtime (or its .dir's) changed, archives that disappeared are dropped.
+Hashes come from the archive's .hashes sidecar, or are computed with hash_entries.
+The database lives in the user cache folder unless a path is given.
+"""
+
+import os
+import time
+import sqlite3
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+##Methods list -
+# default_asset_index_path
+# find_img_archives
+
+##Classes -
+# IMGAssetIndex
+
+ASSET_INDEX_FORMAT = 1
+ASSET_INDEX_FILENAME = "asset_index.sqlite"
+DEFAULT_RESULT_LIMIT = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS roots (path TEXT PRIMARY KEY, scanned_at REAL);
+CREATE TABLE IF NOT EXISTS archives (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER, mtime_ns INTEGER, dir_size INTEGER, dir_mtime_ns INTEGER,
+    version TEXT, entry_count INTEGER, hashed INTEGER DEFAULT 0, indexed_at REAL);
+CREATE TABLE IF NOT EXISTS assets (
+    archive_id INTEGER NOT NULL REFERENCES archives(id) ON DELETE CASCADE,
+    name TEXT NOT NULL, name_lower TEXT NOT NULL,
+    offset INTEGER, size INTEGER, type TEXT, hash TEXT);
+CREATE INDEX IF NOT EXISTS assets_name ON assets(name_lower);
+CREATE INDEX IF NOT EXISTS assets_hash ON assets(hash);
+CREATE INDEX IF NOT EXISTS assets_archive ON assets(archive_id);
+"""
+
+
+def default_asset_index_path() -> str: #vers 1
+    """Database location in the user cache folder"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "imgfactory", ASSET_INDEX_FILENAME)
+
+
+def find_img_archives(root: str) -> List[str]: #vers 1
+    """Every .img under root (any case - DIR/IMG pairs are found by their .img)"""
+    archives = []
+    for folder, _, files in os.walk(root):
+        for name in files:
+            if name.lower().endswith('.img'):
+                archives.append(os.path.join(folder, name))
+    archives.sort()
+    return archives
+
+
+class IMGAssetIndex:
+    """SQLite index of the entries of many archives - one connection per thread"""
+
+    def __init__(self, db_path: Optional[str] = None): #vers 1
+        self.db_path = db_path or default_asset_index_path()
+        folder = os.path.dirname(self.db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.connection = sqlite3.connect(self.db_path, timeout=30)
+        self.connection.row_factory = sqlite3.Row
+        # WAL lets the search dialog read while a background scan writes
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute("INSERT OR IGNORE INTO meta VALUES ('format', ?)", (str(ASSET_INDEX_FORMAT),))
+        self.connection.commit()
+
+    def close(self): #vers 1
+        self.connection.close()
+
+    def __enter__(self): #vers 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback): #vers 1
+        self.close()
+        return False
+
+    # - Archives
+
+    @staticmethod
+    def _archive_stamp(path: str) -> Optional[Tuple[int, int, int, int]]: #vers 1
+        """(size, mtime_ns, dir size, dir mtime_ns) - dir values 0 for VER2"""
+        try:
+            data = os.stat(path)
+        except OSError:
+            return None
+        dir_path = path[:-4] + '.dir'
+        try:
+            directory = os.stat(dir_path) if os.path.exists(dir_path) else None
+        except OSError:
+            directory = None
+        if directory is None:
+            return data.st_size, data.st_mtime_ns, 0, 0
+        return data.st_size, data.st_mtime_ns, directory.st_size, directory.st_mtime_ns
+
+    def is_current(self, path: str, hashed: bool = False) -> bool: #vers 1
+        """Archive indexed and unchanged since (and hashed, if asked)"""
+        stamp = self._archive_stamp(path)
+        row = self.connection.execute(
+            "SELECT size, mtime_ns, dir_size, dir_mtime_ns, hashed FROM archives WHERE path = ?",
+            (os.path.abspath(path),)).fetchone()
+        if stamp is None or row is None:
+            return False
+        return tuple(row)[:4] == stamp and (row['hashed'] or not hashed)
+
+    def index_archive(self, path: str, hash_entries: bool = False) -> int: #vers 1
+        """(Re)read one archive's directory into the index - returns its entry count, -1 on error"""
+        from apps.methods.img_core_classes import IMGFile
+        path = os.path.abspath(path)
+        stamp = self._archive_stamp(path)
+        if stamp is None:
+            return -1
+        img_file = IMGFile(path)
+        # Names, offsets and types only - no RW header sweep
+        img_file.defer_rw_probe = True
+        try:
+            if not img_file.open():
+                print(f"[WARNING] Asset index: could not open {path}")
+                return -1
+            hashes = self._entry_hashes(img_file, hash_entries)
+            rows = [(entry.name, entry.name.lower(), entry.offset, entry.size,
+                     entry.extension or "", hashes.get(i))
+                    for i, entry in enumerate(img_file.entries)]
+            version = getattr(img_file.version, 'name', str(img_file.version))
+        finally:
+            img_file.close()
+
+        with self.connection:
+            self.connection.execute("DELETE FROM archives WHERE path = ?", (path,))
+            cursor = self.connection.execute(
+                "INSERT INTO archives (path, size, mtime_ns, dir_size, dir_mtime_ns, version, "
+                "entry_count, hashed, indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (path, *stamp, version, len(rows), int(hash_entries), time.time()))
+            archive_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO assets (archive_id, name, name_lower, offset, size, type, hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((archive_id, *row) for row in rows))
+        return len(rows)
+
+    def _entry_hashes(self, img_file, hash_entries: bool) -> Dict[int, str]: #vers 1
+        """Entry index -> full content hash: from the .hashes sidecar, computed
+        (and written back to the sidecar) for the rest when hash_entries is set"""
+        from apps.methods.img_duplicates import HASH_ALGORITHM, DEFAULT_HASH_WORKERS, _hash_stage
+        from apps.methods.img_hash_cache import IMGHashCache
+        cache = IMGHashCache(img_file.get_data_path(), HASH_ALGORITHM)
+        cache.load()
+        entries = img_file.entries
+        if hash_entries:
+            with img_file:
+                # Threads share the read-only mmap; a plain shared handle must stay single threaded
+                workers = min(DEFAULT_HASH_WORKERS, os.cpu_count() or 1) if getattr(img_file, '_img_view', None) is not None else 1
+                digests = _hash_stage(img_file, entries, 'full', 0, cache, workers)
+            cache.save()
+        else:
+            digests = [cache.get(entry.offset, entry.size, 'full') for entry in entries]
+        return {i: digest for i, digest in enumerate(digests) if digest is not None}
+
+    def remove_archive(self, path: str): #vers 1
+        with self.connection:
+            self.connection.execute("DELETE FROM archives WHERE path = ?", (os.path.abspath(path),))
+
+    def update_folder(self, root: str, progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                      cancelled: Optional[Callable[[], bool]] = None, hash_entries: bool = False) -> Dict[str, int]: #vers 1
+        """Bring the index up to date for every archive under root.
+        Unchanged archives are skipped, vanished ones removed. Returns counts:
+        archives, indexed, skipped, removed, failed, entries (newly indexed)."""
+        root = os.path.abspath(root)
+        stats = {'archives': 0, 'indexed': 0, 'skipped': 0, 'removed': 0, 'failed': 0, 'entries': 0}
+        archives = find_img_archives(root)
+        stats['archives'] = len(archives)
+
+        present = set(archives)
+        prefix = os.path.join(root, "")
+        for (path,) in self.connection.execute(
+                "SELECT path FROM archives WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)).fetchall():
+            if path not in present:
+                self.remove_archive(path)
+                stats['removed'] += 1
+
+        for done, path in enumerate(archives, 1):
+            if cancelled is not None and cancelled():
+                break
+            if self.is_current(path, hash_entries):
+                stats['skipped'] += 1
+            else:
+                count = self.index_archive(path, hash_entries)
+                if count < 0:
+                    stats['failed'] += 1
+                else:
+                    stats['indexed'] += 1
+                    stats['entries'] += count
+            if progress_callback:
+                progress_callback(done, len(archives), path)
+
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO roots VALUES (?, ?)", (root, time.time()))
+        return stats
+
+    def roots(self) -> List[str]: #vers 1
+        """Folders scanned so far (for background refreshes)"""
+        return [row[0] for row in self.connection.execute("SELECT path FROM roots ORDER BY path")]
+
+    # - Queries
+
+    def find(self, query: str, limit: int = DEFAULT_RESULT_LIMIT, root: Optional[str] = None) -> List[Dict[str, Any]]: #vers 1
+        """Entries whose name matches query (case-insensitive): glob when it has
+        * ? or [, else substring. Exact name matches come first.
+        root: only archives under this folder."""
+        text = query.strip().lower()
+        if not text:
+            return []
+        if any(c in text for c in '*?['):
+            condition, value = "a.name_lower GLOB ?", text
+        else:
+            condition, value = "instr(a.name_lower, ?) > 0", text
+        sql = ("SELECT a.name, r.path AS archive, a.offset, a.size, a.type, a.hash FROM assets a "
+               "JOIN archives r ON r.id = a.archive_id WHERE " + condition)
+        params: List[Any] = [value]
+        if root:
+            prefix = os.path.join(os.path.abspath(root), "")
+            sql += " AND substr(r.path, 1, ?) = ?"
+            params += [len(prefix), prefix]
+        sql += " ORDER BY a.name_lower != ?, a.name_lower, r.path LIMIT ?"
+        params += [text, limit]
+        return [dict(row) for row in self.connection.execute(sql, params)]
+
+    def find_exact(self, name: str) -> List[Dict[str, Any]]: #vers 1
+        """Every copy of one entry name (indexed lookup)"""
+        return [dict(row) for row in self.connection.execute(
+            "SELECT a.name, r.path AS archive, a.offset, a.size, a.type, a.hash FROM assets a "
+            "JOIN archives r ON r.id = a.archive_id WHERE a.name_lower = ? ORDER BY r.path",
+            (name.strip().lower(),))]
+
+    def find_by_hash(self, digest: str) -> List[Dict[str, Any]]: #vers 1
+        """Entries with identical content in any indexed archive"""
+        return [dict(row) for row in self.connection.execute(
+            "SELECT a.name, r.path AS archive, a.offset, a.size, a.type, a.hash FROM assets a "
+            "JOIN archives r ON r.id = a.archive_id WHERE a.hash = ? ORDER BY r.path, a.name_lower",
+            (digest,))]
+
+    def summary(self) -> Dict[str, int]: #vers 1
+        """Archive and entry counts"""
+        archives = self.connection.execute("SELECT COUNT(*) FROM archives").fetchone()[0]
+        entries = self.connection.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+        hashed = self.connection.execute("SELECT COUNT(*) FROM assets WHERE hash IS NOT NULL").fetchone()[0]
+        return {'archives': archives, 'entries': entries, 'hashed': hashed}
+
+
+__all__ = [
+    'ASSET_INDEX_FILENAME',
+    'IMGAssetIndex',
+    'default_asset_index_path',
+    'find_img_archives'
+]
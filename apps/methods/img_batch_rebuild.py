@@ -0,0 +1,209 @@
+#this belongs in methods/img_batch_rebuild.py - Version: 2
+# X-Seti - October16 2026 - IMG Factory 1.5 - Parallel Batch Rebuild Workers
+
+"""
+IMG Batch Rebuild - Process pool side of the batch rebuild.
+Each archive is reopened from disk in a worker process and rebuilt there
+(fast = in-place compaction, safe/auto = streamed rebuild, dedupe = streamed
+rebuild where identical entries share one range). The pool is sized
+by CPU cores and by how many archives may be busy on one physical disk at a
+time; a shared cancellation token stops workers between copy chunks.
+"""
+
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Dict, Optional, Callable, Any
+
+##Methods list -
+# device_of
+# plan_worker_count
+# rebuild_archive_worker
+# run_batch_rebuild
+
+##Classes -
+# RebuildCancelled
+
+DEFAULT_PER_DISK = 2          # Archives streamed at once per physical disk
+PROGRESS_INTERVAL = 0.25      # Seconds between progress messages from one worker
+
+
+class RebuildCancelled(Exception):
+    """Raised inside a worker's progress callback when the batch was cancelled"""
+
+
+def device_of(file_path: str) -> int: #vers 1
+    """Device id of the disk holding file_path (0 if unknown)"""
+    try:
+        return os.stat(file_path).st_dev
+    except OSError:
+        return 0
+
+
+def plan_worker_count(file_paths: List[str], max_workers: Optional[int] = None,
+                      per_disk: int = DEFAULT_PER_DISK) -> int: #vers 1
+    """Pool size: no more than the cores, and no more than per_disk archives per disk"""
+    if not file_paths:
+        return 0
+    per_device: Dict[int, int] = {}
+    for path in file_paths:
+        device = device_of(path)
+        per_device[device] = per_device.get(device, 0) + 1
+    io_limit = sum(min(per_disk, count) for count in per_device.values())
+    workers = min(os.cpu_count() or 1, io_limit)
+    if max_workers:
+        workers = min(workers, max_workers)
+    return max(1, workers)
+
+
+def rebuild_archive_worker(file_path: str, mode: str, cancel_event=None, progress_queue=None) -> Dict[str, Any]: #vers 2
+    """Rebuild one archive from disk (runs in a pool process).
+    Returns file_path, success, message, cancelled and the new (offset, size)
+    layout in directory order so the caller can update an already open IMGFile."""
+    from apps.methods.img_core_classes import IMGFile
+
+    result = {'file_path': file_path, 'success': False, 'message': '', 'cancelled': False, 'layout': None}
+    last_report = [0.0]
+
+    def report(percent: int, message: str):
+        now = time.monotonic()
+        if progress_queue is not None and (percent >= 100 or now - last_report[0] >= PROGRESS_INTERVAL):
+            last_report[0] = now
+            progress_queue.put((file_path, int(percent), message))
+
+    def cancellable_report(percent: int, message: str):
+        # Streamed rebuild writes a temp file - stopping mid-copy leaves the archive untouched
+        if cancel_event is not None and cancel_event.is_set():
+            raise RebuildCancelled()
+        report(percent, message)
+
+    try:
+        if cancel_event is not None and cancel_event.is_set():
+            result['cancelled'] = True
+            result['message'] = "Cancelled"
+            return result
+
+        img_file = IMGFile(file_path)
+        if not img_file.open():
+            result['message'] = "Could not open IMG file"
+            return result
+
+        try:
+            report(0, "Opened")
+            if mode == "fast":
+                # In-place moves must run to the end once started - no cancel checks inside
+                success = img_file.compact_img_file(report)
+            else:
+                success = img_file.rebuild_img_file(cancellable_report, deduplicate=(mode == "dedupe"))
+            if cancel_event is not None and cancel_event.is_set() and not success:
+                result['cancelled'] = True
+                result['message'] = "Cancelled"
+                return result
+            result['success'] = success
+            result['message'] = "Rebuild successful" if success else "Rebuild failed"
+            if success:
+                result['layout'] = [(entry.offset, entry.size) for entry in img_file.entries]
+                report(100, "Done")
+        finally:
+            img_file.close()
+
+    except RebuildCancelled:
+        result['cancelled'] = True
+        result['message'] = "Cancelled"
+    except Exception as e:
+        result['message'] = f"Error: {e}"
+    return result
+
+
+def run_batch_rebuild(file_paths: List[str], mode: str = "fast", max_workers: Optional[int] = None,
+                      per_disk: int = DEFAULT_PER_DISK, cancel_token=None,
+                      on_progress: Optional[Callable[[str, int, str], None]] = None,
+                      on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]: #vers 1
+    """Rebuild archives on a process pool, at most per_disk at a time on each disk.
+    Largest archives are started first so the pool finishes together.
+    cancel_token: anything with is_set() (threading.Event) - passed on to the workers.
+    on_progress(file_path, percent, message) / on_result(result) run in the calling thread."""
+    if not file_paths:
+        return []
+
+    workers = plan_worker_count(file_paths, max_workers, per_disk)
+    # spawn: never fork a process that has Qt running
+    context = multiprocessing.get_context('spawn')
+    manager = context.Manager()
+    results = []
+    try:
+        # Worker side of the cancellation token - a manager event reaches every process
+        cancel_event = manager.Event()
+        progress_queue = manager.Queue()
+
+        # Same archive listed twice must not be rebuilt by two workers at once
+        pending = sorted(dict.fromkeys(file_paths), key=lambda p: os.path.getsize(p) if os.path.exists(p) else 0, reverse=True)
+        devices = {path: device_of(path) for path in pending}
+        busy: Dict[int, int] = {}
+        running = {}
+
+        def drain_progress():
+            while True:
+                try:
+                    file_path, percent, message = progress_queue.get_nowait()
+                except Exception:
+                    return
+                if on_progress:
+                    on_progress(file_path, percent, message)
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            while pending or running:
+                if cancel_token is not None and cancel_token.is_set() and not cancel_event.is_set():
+                    cancel_event.set()
+                # Fill free slots with archives whose disk is not saturated
+                if not cancel_event.is_set():
+                    for path in list(pending):
+                        if len(running) >= workers:
+                            break
+                        device = devices[path]
+                        if busy.get(device, 0) >= per_disk:
+                            continue
+                        pending.remove(path)
+                        busy[device] = busy.get(device, 0) + 1
+                        future = pool.submit(rebuild_archive_worker, path, mode, cancel_event, progress_queue)
+                        running[future] = path
+                elif pending:
+                    # Cancelled - archives not started yet are reported and skipped
+                    for path in pending:
+                        result = {'file_path': path, 'success': False, 'message': "Cancelled",
+                                  'cancelled': True, 'layout': None}
+                        results.append(result)
+                        if on_result:
+                            on_result(result)
+                    pending = []
+
+                if not running:
+                    continue
+                done, _ = wait(list(running), timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+                drain_progress()
+                for future in done:
+                    path = running.pop(future)
+                    busy[devices[path]] -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {'file_path': path, 'success': False, 'message': f"Worker error: {e}",
+                                  'cancelled': False, 'layout': None}
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+            drain_progress()
+    finally:
+        manager.shutdown()
+    return results
+
+
+__all__ = [
+    'DEFAULT_PER_DISK',
+    'RebuildCancelled',
+    'device_of',
+    'plan_worker_count',
+    'rebuild_archive_worker',
+    'run_batch_rebuild'
+]
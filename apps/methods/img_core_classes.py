@@ -1,49 +1,50 @@
-#this belongs in methods.img_core_classes.py - Version: 11
+#this belongs in methods.img_core_classes.py - Version: 27
 # X-Seti - November29 2025 - IMG Factory 1.5 - IMG Core Classes with Fixed RW Version Detection
 
 """
-IMG Core Classes
+IMG Core Classes - IMG format classes, importable without Qt.
+The entries panel widgets live in gui/img_table_widgets.py.
 """
 
 import os
+import mmap
 import struct
+import functools
 import json
 import shutil
 from enum import Enum
-from typing import List, Dict, Optional, Any, Union, BinaryIO
+from typing import List, Dict, Optional, Any, Union, BinaryIO, Tuple, Callable
 from pathlib import Path
-from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QPushButton, QComboBox, QLineEdit, QGroupBox, QLabel)
-from PyQt6.QtCore import pyqtSignal, Qt
 
 # Import existing RW version functions - KEPT ALL ORIGINAL IMPORTS
 from apps.methods.rw_versions import get_rw_version_name, parse_rw_version, get_model_format_version
-from apps.debug.debug_functions import img_debugger
+from apps.methods.img_directory import IMGDirectory
+from apps.methods.img_free_space import IMGFreeSpaceMap, sectors_for
+from apps.methods.img_index_cache import ENTRY_DETECTED, IMGIndexCache, directory_checksum
+from apps.methods.img_decompress_cache import DETECT_BYTES, detect_fastman92_header, get_decompression_cache
+from apps.methods.img_stream_writer import (
+    align_to_sector, copy_file_range_all, move_range, pack_directory_record, plan_sequential_layout,
+    shared_layout_savings, temp_path_for, write_archive, write_at)
+from apps.debug.img_debugger import img_debugger
 
 
 ##Methods list -
-# create_entries_table_panel
+# __getattr__
 # create_img_file
 # detect_img_version
 # format_file_size
-# integrate_filtering
-# populate_table_with_sample_data
 # rebuild_img_file
+# _pauses_rw_scan
 
 ##Classes -
 # CompressionType
 # FileType
-# FilterPanel
-# IMGEntriesTable
 # IMGEntry
 # IMGFile
-# IMGFileInfoPanel
 # IMGPlatform
 # IMGVersion
 # Platform
 # RecentFilesManager
-# TabFilterWidget
 # ValidationResult
 
 class IMGVersion(Enum):
@@ -98,6 +99,7 @@ class CompressionType(Enum):
     NONE = "none"
     ZLIB = "zlib"
     LZO = "lzo"
+    LZ4 = "lz4"
     UNKNOWN = "unknown"
 
 class RecentFilesManager:
@@ -165,8 +167,17 @@ class ValidationResult:
 
 class IMGEntry:
     """Represents a single file entry within an IMG archive - FIXED WITH RW VERSION DETECTION"""
+
+    # Fixed attributes live in slots; __dict__ is only created for the
+    # extra per-entry flags tools attach (data, is_pinned, modified, ...)
+    __slots__ = (
+        '_name', 'extension', 'offset', 'size', 'uncompressed_size', 'file_type',
+        'compression_type', 'rw_version', 'rw_version_name', 'is_encrypted',
+        'is_new_entry', 'is_replaced', 'flags', 'compression_level',
+        '_cached_data', '_img_file', '_version_detected', '__dict__')
     
-    def __init__(self): #vers 4
+    def __init__(self): #vers 5
+        self._img_file: Optional['IMGFile'] = None
         self.name: str = ""
         self.extension: str = ""
         self.offset: int = 0          # Offset in bytes
@@ -184,9 +195,30 @@ class IMGEntry:
 
         # Internal data cache
         self._cached_data: Optional[bytes] = None
-        self._img_file: Optional['IMGFile'] = None
         self._version_detected: bool = False # ADDED: Track if version was detected
+
+    @property
+    def name(self) -> str: #vers 1
+        return self._name
+
+    @name.setter
+    def name(self, value: str): #vers 1
+        """Set entry name - keeps the parent IMGFile name index current on rename"""
+        old_name = getattr(self, '_name', None)
+        self._name = value
+        if self._img_file is not None and old_name is not None and old_name != value:
+            self._img_file._entry_renamed(self, old_name)
     
+    @classmethod
+    def from_directory_record(cls, name: str, offset: int, size: int, img_file: 'IMGFile') -> 'IMGEntry': #vers 1
+        """Create an entry from one row of a parsed IMGDirectory (byte offset/size)"""
+        entry = cls()
+        entry.name = name
+        entry.offset = offset
+        entry.size = size
+        entry._img_file = img_file
+        return entry
+
     def set_img_file(self, img_file: 'IMGFile'): #vers 1
         """Set reference to parent IMG file"""
         self._img_file = img_file
@@ -223,8 +255,9 @@ class IMGEntry:
                 img_debugger.error(f"Error detecting file type/version for {self.name}: {e}")
 
 
-    def detect_file_type_and_version(self): #vers 1
-        """ADDED: Detect file type and RW version from file data"""
+    def detect_file_type_and_version(self, probe_rw: bool = True): #vers 2
+        """ADDED: Detect file type and RW version from file data
+        probe_rw=False skips the header read (IMGFile.probe_rw_headers does it in bulk)"""
         try:
             # Extract extension from name
             if '.' in self.name:
@@ -253,13 +286,13 @@ class IMGEntry:
                 self.file_type = FileType.UNKNOWN
 
             # Detect RW version for RenderWare files
-            if self.extension in ['DFF', 'TXD'] and not self._version_detected:
+            if probe_rw and self.extension in ['DFF', 'TXD'] and not self._version_detected:
                 self._detect_rw_version()
                 
         except Exception as e:
             img_debugger.error(f"Error detecting file type for {self.name}: {e}")
 
-    def _detect_rw_version(self): #vers 1
+    def _detect_rw_version(self): #vers 2
         """ADDED: Detect RenderWare version from file header"""
         try:
             if not self._img_file or not self._img_file.file_path:
@@ -270,30 +303,38 @@ class IMGEntry:
             if not file_data or len(file_data) < 12:
                 return
 
-            # Use existing parse_rw_version function
-            version_value, version_name = parse_rw_version(file_data[8:12])
-            
-            if version_value > 0:
-                self.rw_version = version_value
-                self.rw_version_name = version_name
-                self._version_detected = True
-                img_debugger.success(f"Detected RW version {version_name} (0x{version_value:X}) for {self.name}")
-            else:
-                # Fallback: try reading from different offset
-                if len(file_data) >= 8:
-                    try:
-                        alt_version = struct.unpack('<I', file_data[4:8])[0]
-                        if 0x30000 <= alt_version <= 0x40000:  # Valid RW version range
-                            self.rw_version = alt_version
-                            self.rw_version_name = get_rw_version_name(alt_version)
-                            self._version_detected = True
-                            img_debugger.success(f"Detected RW version {self.rw_version_name} (alt method) for {self.name}")
-                    except:
-                        pass
+            if self.apply_rw_header(file_data):
+                img_debugger.success(f"Detected RW version {self.rw_version_name} (0x{self.rw_version:X}) for {self.name}")
 
         except Exception as e:
             img_debugger.error(f"Error detecting RW version for {self.name}: {e}")
 
+    def apply_rw_header(self, header: bytes) -> bool: #vers 1
+        """Set rw_version/rw_version_name from the first 12 bytes of the entry"""
+        if not header or len(header) < 12:
+            return False
+
+        # Use existing parse_rw_version function
+        version_value, version_name = parse_rw_version(header[8:12])
+
+        if version_value > 0:
+            self.rw_version = version_value
+            self.rw_version_name = version_name
+            self._version_detected = True
+            return True
+
+        # Fallback: try reading from different offset
+        try:
+            alt_version = struct.unpack('<I', header[4:8])[0]
+            if 0x30000 <= alt_version <= 0x40000:  # Valid RW version range
+                self.rw_version = alt_version
+                self.rw_version_name = get_rw_version_name(alt_version)
+                self._version_detected = True
+                return True
+        except struct.error:
+            pass
+        return False
+
     def detect_rw_version(self, data: bytes = None) -> bool: #vers 1
         """ADDED: Detect RenderWare version from provided data"""
         try:
@@ -339,26 +380,18 @@ class IMGEntry:
                 img_debugger.error(f"Error detecting RW version for {self.name}: {e}")
             return False
 
-    def _read_header_data(self, bytes_to_read: int) -> Optional[bytes]: #vers 1
+    def _read_header_data(self, bytes_to_read: int) -> Optional[bytes]: #vers 2
         """ADDED: Read file header data from IMG file"""
         try:
             if not self._img_file or not self._img_file.file_path:
                 return None
 
-            # Determine which file to read from based on IMG version
-            if self._img_file.version == IMGVersion.VERSION_1:
-                # Read from .img file (companion to .dir)
-                img_path = self._img_file.file_path.replace('.dir', '.img')
-                if not os.path.exists(img_path):
-                    return None
-                file_path = img_path
-            else:
-                # Read from single .img file
-                file_path = self._img_file.file_path
-
-            with open(file_path, 'rb') as f:
-                f.seek(self.offset)
-                return f.read(min(self.size, bytes_to_read))
+            # Shared read session - no per-entry open/seek/close
+            view = self._img_file.read_entry_view(self)
+            try:
+                return view[:min(self.size, bytes_to_read)].tobytes()
+            finally:
+                view.release()
 
         except Exception as e:
             img_debugger.error(f"Error reading header data for {self.name}: {e}")
@@ -455,12 +488,19 @@ class IMGEntry:
 
         return result
     
-    def get_data(self) -> bytes: #vers 1
-        """Read entry data from IMG file"""
+    def get_data(self) -> bytes: #vers 2
+        """Read entry data from IMG file (via the parent's read session)"""
         if not self._img_file:
             raise ValueError("No IMG file reference set")
         
         return self._img_file.read_entry_data(self)
+
+    def get_data_view(self) -> memoryview: #vers 1
+        """Read entry data as a zero-copy memoryview (via the parent's read session)"""
+        if not self._img_file:
+            raise ValueError("No IMG file reference set")
+
+        return self._img_file.read_entry_view(self)
     
     def set_data(self, data: bytes): #vers 1
         """Write entry data to IMG file"""
@@ -565,15 +605,114 @@ def get_img_platform_info(file_path: str) -> Dict[str, Any]: #vers 1
         }
     }
 
+class IMGEntryList(list):
+    """Entry list that counts structural changes so IMGFile can tell when its
+    name index is stale (tools append/remove/sort entries directly)"""
+
+    def __init__(self, *args): #vers 1
+        super().__init__(*args)
+        self.mutations = 0
+
+    def _changed(self): #vers 1
+        self.mutations += 1
+
+    def append(self, item): #vers 1
+        super().append(item)
+        self._changed()
+
+    def extend(self, items): #vers 1
+        super().extend(items)
+        self._changed()
+
+    def insert(self, index, item): #vers 1
+        super().insert(index, item)
+        self._changed()
+
+    def pop(self, index=-1): #vers 1
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def remove(self, item): #vers 1
+        super().remove(item)
+        self._changed()
+
+    def clear(self): #vers 1
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs): #vers 1
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self): #vers 1
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, index, value): #vers 1
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index): #vers 1
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, items): #vers 1
+        result = super().__iadd__(items)
+        self._changed()
+        return result
+
+
+def _pauses_rw_scan(method): #vers 1
+    """IMGFile write methods - the background RW header scan is stopped for the write"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        scan = self.pause_rw_scan()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.resume_rw_scan(scan)
+    return wrapper
+
+
 class IMGFile:
     """Main IMG archive file handler - FIXED WITH PLATFORM SUPPORT"""
+
+    # Spare VER2 directory records reserved when entries are moved for directory growth
+    DIRECTORY_SLACK = 64
     
-    def __init__(self, file_path: str = ""): #vers 5
+    def __init__(self, file_path: str = ""): #vers 12
         self.file_path: str = file_path
+        # Skip the RW header sweep in open() - the GUI scans in the background instead
+        self.defer_rw_probe: bool = False
+        # Running background RW header scan (stop() / restart()) - paused around writes
+        self.rw_scan: Optional[Any] = None
+        # Compressed (Fastman92 header) entries are read back decompressed, through the shared cache
+        self.decompress_on_read: bool = True
+        # Reuse / write the .imgidx sidecar (types + RW versions of an unchanged archive)
+        self.use_index_cache: bool = True
+        self.index_loaded: bool = False
+        # Checksum of the directory records on disk (set on open and after each save)
+        self._directory_checksum: Optional[bytes] = None
+        # Shared ranges / bytes saved by the last rebuild (see rebuild_img_file deduplicate)
+        self.last_rebuild_stats: Dict[str, int] = {}
         self.version: IMGVersion = IMGVersion.UNKNOWN
         self.platform: IMGPlatform = IMGPlatform.UNKNOWN  # ADDED: Platform detection
         self.platform_specs: Dict[str, Any] = {}  # ADDED: Platform-specific specs
+        # Case-insensitive name -> index map and end-of-data high-water mark,
+        # valid while self.entries.mutations == self._indexed_mutations
+        self._name_index: Optional[Dict[str, int]] = None
+        self._name_duplicates: bool = False
+        self._data_end: Optional[int] = None
+        self._indexed_mutations: int = -1
+        # Free sector map, valid while self.entries.mutations == self._free_space_mutations
+        self._free_space: Optional[IMGFreeSpaceMap] = None
+        self._free_space_mutations: int = -1
+        # Entry renames so far (renames do not change the entry list - search index key)
+        self.name_changes: int = 0
+
         self.entries: List[IMGEntry] = []
+        self.directory: Optional[IMGDirectory] = None  # Columnar directory as last read from / written to disk
         self.is_open: bool = False
         self.total_size: int = 0
         self.creation_time: Optional[float] = None
@@ -582,6 +721,119 @@ class IMGFile:
         # File handles
         self._img_handle: Optional[BinaryIO] = None
         self._dir_handle: Optional[BinaryIO] = None
+
+        # Read session - one handle (and read-only mmap) shared by all entry reads
+        self._img_mmap: Optional[mmap.mmap] = None
+        self._img_view: Optional[memoryview] = None
+
+    @property
+    def entries(self) -> List[IMGEntry]: #vers 1
+        return self._entries
+
+    @entries.setter
+    def entries(self, value: List[IMGEntry]): #vers 1
+        """Assigning a plain list wraps it so later changes are tracked"""
+        self._entries = value if isinstance(value, IMGEntryList) else IMGEntryList(value)
+        self._invalidate_entry_index()
+
+    def _invalidate_entry_index(self): #vers 2
+        """Drop the name index, data end and free space map - rebuilt on next lookup"""
+        self._name_index = None
+        self._data_end = None
+        self._indexed_mutations = -1
+        self._free_space = None
+
+    def _get_name_index(self) -> Dict[str, int]: #vers 1
+        """Lowercase name -> entry index, rebuilt only when entries changed outside IMGFile"""
+        if self._name_index is None or self._indexed_mutations != self._entries.mutations:
+            index = {}
+            # Reverse walk so the first of any duplicate names wins, like a linear scan
+            for i in range(len(self._entries) - 1, -1, -1):
+                index[self._entries[i].name.lower()] = i
+            self._name_index = index
+            self._name_duplicates = len(index) != len(self._entries)
+            self._data_end = None
+            self._indexed_mutations = self._entries.mutations
+        return self._name_index
+
+    def _sync_entry_index(self): #vers 1
+        """Mark the index current after IMGFile updated it alongside its own list change"""
+        self._indexed_mutations = self._entries.mutations
+
+    def _get_data_end(self) -> int: #vers 1
+        """End of the last entry's data in bytes (high-water mark)"""
+        self._get_name_index()
+        if self._data_end is None:
+            self._data_end = max((e.offset + e.size for e in self._entries), default=0)
+        return self._data_end
+
+    def _entry_renamed(self, entry: IMGEntry, old_name: str): #vers 2
+        """Called by IMGEntry.name setter - move the entry's key in the name index"""
+        self.name_changes += 1
+        if self._name_index is None or self._indexed_mutations != self._entries.mutations:
+            return
+        old_key = old_name.lower()
+        index = self._name_index.get(old_key)
+        if index is None or index >= len(self._entries) or self._entries[index] is not entry:
+            # Entry not indexed under the old name (duplicate or detached) - rebuild later
+            self._invalidate_entry_index()
+            return
+        del self._name_index[old_key]
+        new_key = entry.name.lower()
+        if new_key in self._name_index or self._name_duplicates:
+            self._invalidate_entry_index()
+        else:
+            self._name_index[new_key] = index
+
+    def find_entry_index(self, filename: str) -> int: #vers 1
+        """Index of the entry with this name (case-insensitive), -1 if missing"""
+        return self._get_name_index().get(filename.lower(), -1)
+
+    def get_free_space_map(self) -> IMGFreeSpaceMap: #vers 1
+        """Free sector map of the data area - rebuilt only when entries changed outside IMGFile"""
+        if self._free_space is None or self._free_space_mutations != self._entries.mutations:
+            self._free_space = self._build_free_space_map()
+            self._free_space_mutations = self._entries.mutations
+        return self._free_space
+
+    def _build_free_space_map(self) -> IMGFreeSpaceMap: #vers 1
+        """Holes between the sectors of stored entries and of the directory last written.
+        Sectors of removed/replaced entries stay referenced on disk until the next save,
+        so they are only counted as reclaimable, never handed out before that."""
+        resident = [(e.offset // 2048, sectors_for(e.size)) for e in self._entries if e._cached_data is None]
+        on_disk = self.directory.extents() if self.directory is not None else []
+        floor = 0
+        if self.version == IMGVersion.VERSION_2:
+            # VER2 directory sits in front of the data
+            floor = sectors_for(8 + max(len(self._entries), len(on_disk)) * 32)
+        space = IMGFreeSpaceMap.from_extents(resident + on_disk, floor)
+        if on_disk:
+            current = IMGFreeSpaceMap.from_extents(resident, floor, space.end)
+            space.add_reclaimable(current.free_sectors - space.free_sectors)
+        return space
+
+    def _release_entry_sectors(self, entry: IMGEntry): #vers 2
+        """Count a stored entry's sectors as reclaimable (usable after the next save).
+        A range still shared with another entry (deduplicated rebuild) stays in use."""
+        if (entry._cached_data is None and self._free_space is not None
+                and self._free_space_mutations == self._entries.mutations):
+            if not self._shares_range(entry):
+                self._free_space.add_reclaimable(sectors_for(entry.size))
+
+    def _shares_range(self, entry: IMGEntry) -> bool: #vers 1
+        """True if another stored entry points at the same sectors (deduplicated data)"""
+        return any(other is not entry and other.offset == entry.offset and other.size
+                   and other._cached_data is None for other in self._entries)
+
+    def __enter__(self): #vers 1
+        """Context manager - keeps a read session open for the block"""
+        self.open_read_session()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback): #vers 1
+        """Context manager - releases the read session"""
+        self.close_read_session()
+        return False
     
     def create_new(self, output_path: str, version: IMGVersion, **options) -> bool: #vers 2
         """Create new IMG file with specified parameters"""
@@ -623,37 +875,280 @@ class IMGFile:
             print(f"Error creating IMG file: {e}")
             return False
 
-    def save_img_file(self) -> bool: #vers 2
-        """Save IMG file with current entries"""
+    def save_img_file(self, full_rebuild: bool = False) -> bool: #vers 4
+        """Save IMG file with current entries - incremental unless a full rebuild is asked for.
+        Fails when the data file is gone and entries still live in it."""
         try:
             if not self.file_path or not self.entries:
                 return False
 
-            # Create backup first
-            import shutil
-            backup_path = self.file_path + '.backup'
-            shutil.copy2(self.file_path, backup_path)
+            if not os.path.exists(self.get_data_path()):
+                if any(entry._cached_data is None for entry in self.entries):
+                    print(f"[ERROR] Cannot save: data file {self.get_data_path()} is missing")
+                    return False
+                # Every entry is held in memory (new archive) - nothing is read from disk
+                return self.rebuild_img_file()
+
+            if full_rebuild:
+                # Rebuild is streamed into a temp file and renamed - no backup copy needed
+                return self.rebuild_img_file()
 
-            # Rebuild the IMG file
-            return self.rebuild_img_file()
+            return self.save_incremental()
 
         except Exception as e:
             print(f"[ERROR] Failed to save IMG file: {e}")
             return False
 
-    def save(self, file_path=None): #vers 1
+    def save(self, file_path=None): #vers 2
         """Save IMG file - wrapper for save_img_file()"""
-        if file_path:
+        if file_path and file_path != self.file_path:
+            # Save As - stream every entry from the current archive into the new one
+            source_path = self.get_data_path()
             self.file_path = file_path
+            return self.rebuild_img_file(source_path=source_path)
         return self.save_img_file()
 
-    def rebuild_img_file(self) -> bool: #vers 1
-        """Rebuild IMG file based on version"""
+    @_pauses_rw_scan
+    def save_incremental(self, progress_callback=None) -> bool: #vers 5
+        """Write new/replaced entry data into free holes (best fit) or after the data,
+        then rewrite only the directory. Sectors the directory on disk still references
+        are never overwritten; for VER2 the entries at the front of the data area are
+        moved to the end when the directory outgrows it."""
         try:
+            data_path = self.get_data_path()
+            entries = self.entries
+            pending = [e for e in entries if e._cached_data is not None]
+            resident = [e for e in entries if e._cached_data is None]
+            space = self.get_free_space_map()
+
+            # Append point: past every sector in use, including sectors of removed
+            # entries that the directory on disk still points at
+            append_at = align_to_sector(max((e.offset + e.size for e in resident), default=0))
+            append_at = max(append_at, space.end * 2048)
+
+            # The mmap must not be live while the archive is written
+            self.close_read_session()
+            fd = os.open(data_path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+            try:
+                if self.version == IMGVersion.VERSION_2:
+                    directory_floor = align_to_sector(8 + len(entries) * 32)
+                    append_at = max(append_at, directory_floor)
+                    space.reserve_below(directory_floor // 2048)
+                    append_at = self._relocate_for_directory(fd, resident, append_at, space)
+
+                # Best fit into holes, largest entries first; what does not fit is appended
+                placements = []
+                reused = 0
+                for entry in sorted(pending, key=lambda e: len(e._cached_data), reverse=True):
+                    size = len(entry._cached_data)
+                    start = space.allocate(sectors_for(size))
+                    if start is not None:
+                        placements.append((start * 2048, entry))
+                        reused += 1
+                    else:
+                        placements.append((append_at, entry))
+                        append_at += align_to_sector(size)
+                placements.sort(key=lambda placement: placement[0])
+
+                total = len(placements)
+                for i, (offset, entry) in enumerate(placements):
+                    data = entry._cached_data
+                    write_at(fd, data, offset)
+                    entry.offset = offset
+                    entry.size = len(data)
+                    if progress_callback:
+                        progress_callback(int((i + 1) * 90 / total), f"Writing entry {i + 1}/{total}")
+
+                # Keep the archive a whole number of sectors
+                if os.fstat(fd).st_size < append_at:
+                    os.ftruncate(fd, append_at)
+                # Data is durable before the directory points at it
+                os.fsync(fd)
+
+                records = b''.join(pack_directory_record(e.offset, e.size, e.name) for e in entries)
+                if self.version == IMGVersion.VERSION_2:
+                    write_at(fd, b'VER2' + struct.pack('<I', len(entries)) + records, 0)
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+
             if self.version == IMGVersion.VERSION_1:
-                return self._rebuild_version1()
+                self._write_version1_directory(records)
+
+            for entry in pending:
+                entry._cached_data = None
+            self._data_end = None
+            # Directory on disk now matches the entries - free space is rebuilt from it on next use
+            self.directory = self.get_directory()
+            self._free_space = None
+            self._directory_written(records)
+            if progress_callback:
+                progress_callback(100, "Directory written")
+
+            print(f"[SUCCESS] Incremental save: {len(pending)} entries written ({reused} into free space), directory rewritten")
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Incremental save failed: {e}")
+            return False
+
+    def _relocate_for_directory(self, fd: int, resident: List[IMGEntry], append_at: int,
+                                space: Optional[IMGFreeSpaceMap] = None) -> int: #vers 2
+        """VER2: move the lowest-offset entries to the end of the data area until the
+        directory (plus DIRECTORY_SLACK spare records) fits in front of the data.
+        Returns the new append point."""
+        directory_end = 8 + len(self.entries) * 32
+        first_data = min((e.offset for e in resident), default=append_at)
+        if directory_end <= first_data:
+            return append_at
+
+        # Grow with slack so the next few imports do not relocate again
+        needed = align_to_sector(8 + (len(self.entries) + self.DIRECTORY_SLACK) * 32)
+        append_at = max(append_at, needed)
+        if space is not None:
+            # Holes under the grown directory are no longer free
+            space.reserve_below(needed // 2048)
+        for entry in sorted(resident, key=lambda e: e.offset):
+            if entry.offset >= needed:
+                break
+            copy_file_range_all(fd, fd, entry.offset, append_at, entry.size)
+            print(f"[DEBUG] Relocated {entry.name} 0x{entry.offset:08X} -> 0x{append_at:08X} for directory growth")
+            entry.offset = append_at
+            append_at += align_to_sector(entry.size)
+        return append_at
+
+    def _write_version1_directory(self, records: bytes): #vers 1
+        """Replace the .dir of a DIR/IMG pair through a temp file"""
+        dir_path = self.file_path[:-4] + '.dir'
+        dir_temp = temp_path_for(dir_path)
+        with open(dir_temp, 'wb') as f:
+            f.write(records)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(dir_temp, dir_path)
+
+    @_pauses_rw_scan
+    def compact_img_file(self, progress_callback=None) -> bool: #vers 6
+        """Fast rebuild in place: entries after the first hole slide down in large
+        sequential block moves, then the directory is rewritten and the file truncated.
+        Entries in front of the first hole are not touched. Unlike rebuild_img_file
+        this works on the archive itself - an interrupted compaction is not recoverable."""
+        try:
+            if self.version not in (IMGVersion.VERSION_1, IMGVersion.VERSION_2):
+                print(f"[ERROR] Unsupported IMG version: {self.version}")
+                return False
+
+            # New/replaced data goes to disk first so every entry is a stored sector range
+            if any(e._cached_data is not None for e in self.entries) and not self.save_incremental():
+                return False
+            if self.get_directory().find_overlaps(ignore_shared=True):
+                print("[WARNING] Entries overlap - compaction needs a full rebuild")
+                return False
+
+            # Holes between the current entries - sectors of removed entries count as free
+            # here since the directory is rewritten right after the moves
+            floor = sectors_for(8 + len(self.entries) * 32) if self.version == IMGVersion.VERSION_2 else 0
+            space = IMGFreeSpaceMap.from_extents(
+                [(e.offset // 2048, sectors_for(e.size)) for e in self.entries], floor)
+            holes = space.holes()
+            first_hole = holes[0][0] * 2048 if holes else space.end * 2048
+
+            # Pack everything after the first hole back to back; entries that are
+            # contiguous in the source are merged into one block move
+            moves = []      # [src, dst, length]
+            placements = []
+            placed = {}     # (src, size) -> dst, entries sharing one range move once
+            empty = []      # Zero-size entries past the first hole point at the new data end
+            cursor = first_hole
+            for entry in sorted((e for e in self.entries if e.offset >= first_hole),
+                                key=lambda e: e.offset):
+                if not entry.size:
+                    empty.append(entry)
+                    continue
+                shared = placed.get((entry.offset, entry.size))
+                if shared is not None:
+                    placements.append((entry, shared))
+                    continue
+                placed[(entry.offset, entry.size)] = cursor
+                length = align_to_sector(entry.size)
+                last = moves[-1] if moves else None
+                if last and last[0] + last[2] == entry.offset and last[1] + last[2] == cursor:
+                    last[2] += length
+                else:
+                    moves.append([entry.offset, cursor, length])
+                placements.append((entry, cursor))
+                cursor += length
+            placements.extend((entry, cursor) for entry in empty)
+
+            data_path = self.get_data_path()
+            total = sum(length for _, _, length in moves)
+            print(f"[DEBUG] Compacting from 0x{first_hole:08X}: {len(placements)} entries in {len(moves)} block moves ({total} bytes)")
+
+            # The mmap must not be live while the archive is written
+            self.close_read_session()
+            fd = os.open(data_path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+            try:
+                # Every source range has to exist before the first move - a last entry
+                # ending unpadded at EOF only lacks zero padding, which is added here
+                data_size = os.fstat(fd).st_size
+                needed = max((src + length for src, _, length in moves), default=0)
+                if needed > align_to_sector(data_size):
+                    print(f"[ERROR] Cannot compact: entries reach 0x{needed:08X}, archive ends at 0x{data_size:08X}")
+                    return False
+                if needed > data_size:
+                    os.ftruncate(fd, align_to_sector(data_size))
+
+                done = 0
+                for src, dst, length in moves:
+                    move_range(fd, src, dst, length)
+                    done += length
+                    if progress_callback:
+                        progress_callback(int(done * 90 / total), f"Moved {done // 1024} of {total // 1024} KB")
+                # Data is durable before the directory points at it
+                os.fsync(fd)
+
+                for entry, offset in placements:
+                    entry.offset = offset
+                records = b''.join(pack_directory_record(e.offset, e.size, e.name) for e in self.entries)
+                if self.version == IMGVersion.VERSION_2:
+                    write_at(fd, b'VER2' + struct.pack('<I', len(self.entries)) + records, 0)
+                    cursor = max(cursor, align_to_sector(8 + len(self.entries) * 32))
+                    os.fsync(fd)
+                else:
+                    self._write_version1_directory(records)
+
+                # Only after the directory stopped pointing past it
+                os.ftruncate(fd, cursor)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            self._data_end = None
+            self.directory = self.get_directory()
+            self._free_space = None
+            self._directory_written(records)
+            if progress_callback:
+                progress_callback(100, "Compaction complete")
+
+            print(f"[SUCCESS] Compacted IMG: {len(placements)} entries moved, file is now {cursor} bytes")
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to compact IMG file: {e}")
+            return False
+
+    @_pauses_rw_scan
+    def rebuild_img_file(self, progress_callback=None, source_path: Optional[str] = None,
+                         deduplicate: bool = False) -> bool: #vers 5
+        """Rebuild IMG file based on version (source_path: archive to copy entry data from).
+        deduplicate: byte-identical entries point at one shared sector range, written once
+        (last_rebuild_stats has shared_entries / bytes_saved)"""
+        try:
+            share_keys = self._content_share_keys(progress_callback) if deduplicate else None
+            if self.version == IMGVersion.VERSION_1:
+                return self._rebuild_version1(progress_callback, source_path, share_keys)
             elif self.version == IMGVersion.VERSION_2:
-                return self._rebuild_version2()
+                return self._rebuild_version2(progress_callback, source_path, share_keys)
             else:
                 print(f"[ERROR] Unsupported IMG version: {self.version}")
                 return False
@@ -684,73 +1179,67 @@ class IMGFile:
             return f"file_{len(self.entries):04d}.dat"
 
 
-    def _rebuild_version2(self) -> bool: #vers 1
-        """Rebuild Version 2 IMG file (SA format)"""
-        try:
-            import struct
-            import os
-
-            # Calculate sizes
-            entry_count = len(self.entries)
-            directory_size = entry_count * 32  # 32 bytes per entry
-            data_start = directory_size
+    def _content_share_keys(self, progress_callback=None) -> Optional[List[Any]]: #vers 1
+        """Per-entry content key for a deduplicated layout (None = not shared).
+        Duplicates come from the staged hash search and are byte compared against
+        the first copy before they are allowed to share its sectors."""
+        from apps.methods.img_duplicates import find_duplicate_entries
 
-            # Collect entry data
-            entry_data_list = []
-            current_offset = data_start
+        def report(done, total, message):
+            if progress_callback:
+                progress_callback(0, f"Finding duplicates: {message}")
 
-            for entry in self.entries:
-                # Get entry data
-                if hasattr(entry, '_cached_data') and entry._cached_data:
-                    data = entry._cached_data
+        groups = find_duplicate_entries(self, report)
+        if not groups:
+            return None
+        position = {id(entry): i for i, entry in enumerate(self.entries)}
+        keys: List[Any] = [None] * len(self.entries)
+        for digest, group in groups.items():
+            first = self.read_entry_data(group[0])
+            keys[position[id(group[0])]] = ('content', digest)
+            for entry in group[1:]:
+                if self.read_entry_data(entry) == first:
+                    keys[position[id(entry)]] = ('content', digest)
                 else:
-                    data = self.read_entry_data(entry)
-
-                entry_data_list.append(data)
-
-                # Update entry with new offset/size
-                entry.offset = current_offset
-                entry.size = len(data)
-
-                # Align to sector boundary (2048 bytes)
-                aligned_size = ((len(data) + 2047) // 2048) * 2048
-                current_offset += aligned_size
-
-            # Write new IMG file
-            with open(self.file_path, 'wb') as f:
-                # Write directory
-                for i, entry in enumerate(self.entries):
-                    # Convert to sectors
-                    offset_sectors = entry.offset // 2048
-                    size_sectors = ((entry.size + 2047) // 2048)
-
-                    # Pack entry: offset(4), size(4), name(24)
-                    entry_data = struct.pack('<II', offset_sectors, size_sectors)
-
-                    #name_bytes = entry.name.encode('ascii')[:24].ljust(24, b'\x00')
-                    # CORRUPTION FIX: Sanitize before encoding
-                    clean_name = self._sanitize_filename(entry.name)
-                    if clean_name != entry.name:
-                        print(f"[CORRUPTION FIX] '{entry.name}' → '{clean_name}'")
-                        entry.name = clean_name
-
-                    name_bytes = clean_name.encode('ascii', errors='replace')[:24]
-                    name_bytes = name_bytes.ljust(24, b'\x00')
-
-                    entry_data += name_bytes
-
-                    f.write(entry_data)
+                    print(f"[WARNING] Hash match but different data: {group[0].name} / {entry.name} - not shared")
+        return keys
+
+    def _finish_rebuild_stats(self, layout: List[tuple]): #vers 1
+        shared, saved = shared_layout_savings(layout)
+        self.last_rebuild_stats = {'shared_entries': shared, 'bytes_saved': saved}
+        if shared:
+            print(f"[SUCCESS] {shared} entries share sectors with an identical entry - {saved} bytes saved")
+
+    def _rebuild_version2(self, progress_callback=None, source_path: Optional[str] = None,
+                          share_keys: Optional[List[Any]] = None) -> bool: #vers 6
+        """Rebuild Version 2 IMG file (SA format) - streamed into a temp file,
+        entry sectors copied straight from the current archive, then renamed over it"""
+        try:
+            entry_count = len(self.entries)
 
-                # Write file data
-                for i, data in enumerate(entry_data_list):
-                    f.seek(self.entries[i].offset)
-                    f.write(data)
+            # Header: 'VER2' + entry count, 32-byte records, data from the next sector
+            data_start = align_to_sector(8 + entry_count * 32)
 
-                    # Pad to sector boundary
-                    current_pos = f.tell()
-                    sector_end = ((current_pos + 2047) // 2048) * 2048
-                    if current_pos < sector_end:
-                        f.write(b'\x00' * (sector_end - current_pos))
+            for entry in self.entries:
+                # CORRUPTION FIX: Sanitize before encoding
+                clean_name = self._sanitize_filename(entry.name)
+                if clean_name != entry.name:
+                    print(f"[CORRUPTION FIX] '{entry.name}' → '{clean_name}'")
+                    entry.name = clean_name
+
+            layout = plan_sequential_layout(self.entries, data_start, share_keys)
+            header = b'VER2' + struct.pack('<I', entry_count)
+            records = b''.join(pack_directory_record(offset, size, entry.name)
+                               for entry, (offset, size) in zip(self.entries, layout))
+
+            # Release the read session - the archive is replaced underneath it
+            self.close_read_session()
+            temp_path = write_archive(self.file_path, None, header, records, self.entries,
+                                      layout, source_path or self.file_path, progress_callback)
+            os.replace(temp_path, self.file_path)
+            self._apply_layout(layout)
+            self._finish_rebuild_stats(layout)
+            self._directory_written(records)
 
             print(f"Rebuilt IMG file: {entry_count} entries")
             return True
@@ -759,64 +1248,31 @@ class IMGFile:
             print(f"[ERROR] Failed to rebuild Version 2 IMG: {e}")
             return False
 
-    def _rebuild_version1(self) -> bool: #vers 1
-        """Rebuild Version 1 IMG file (DIR/IMG pair)"""
+    def _rebuild_version1(self, progress_callback=None, source_path: Optional[str] = None,
+                          share_keys: Optional[List[Any]] = None) -> bool: #vers 6
+        """Rebuild Version 1 IMG file (DIR/IMG pair) - streamed into temp files,
+        entry sectors copied straight from the current .img, then renamed over the pair"""
         try:
-            import struct
-            import os
-
             # Get DIR and IMG paths
-            dir_path = self.file_path
-            img_path = self.file_path.replace('.dir', '.img')
+            dir_path = self.file_path[:-4] + '.dir'
+            img_path = self.get_data_path()
 
             entry_count = len(self.entries)
 
-            # Collect entry data and calculate offsets
-            entry_data_list = []
-            current_offset = 0
-
-            for entry in self.entries:
-                # Get entry data
-                if hasattr(entry, '_cached_data') and entry._cached_data:
-                    data = entry._cached_data
-                else:
-                    data = self.read_entry_data(entry)
-
-                entry_data_list.append(data)
-
-                # Update entry with new offset/size
-                entry.offset = current_offset
-                entry.size = len(data)
-
-                # Align to sector boundary
-                aligned_size = ((len(data) + 2047) // 2048) * 2048
-                current_offset += aligned_size
-
-            # Write DIR file
-            with open(dir_path, 'wb') as f:
-                for entry in self.entries:
-                    # Convert to sectors
-                    offset_sectors = entry.offset // 2048
-                    size_sectors = ((entry.size + 2047) // 2048)
-
-                    # Pack entry: offset(4), size(4), name(24)
-                    entry_data = struct.pack('<II', offset_sectors, size_sectors)
-                    name_bytes = entry.name.encode('ascii')[:24].ljust(24, b'\x00')
-                    entry_data += name_bytes
-
-                    f.write(entry_data)
-
-            # Write IMG file
-            with open(img_path, 'wb') as f:
-                for i, data in enumerate(entry_data_list):
-                    f.seek(self.entries[i].offset)
-                    f.write(data)
-
-                    # Pad to sector boundary
-                    current_pos = f.tell()
-                    sector_end = ((current_pos + 2047) // 2048) * 2048
-                    if current_pos < sector_end:
-                        f.write(b'\x00' * (sector_end - current_pos))
+            # Version 1 data starts at the beginning of the .img file
+            layout = plan_sequential_layout(self.entries, 0, share_keys)
+            records = b''.join(pack_directory_record(offset, size, entry.name)
+                               for entry, (offset, size) in zip(self.entries, layout))
+
+            # Release the read session - the archive is replaced underneath it
+            self.close_read_session()
+            img_temp = write_archive(img_path, dir_path, b'', records, self.entries,
+                                     layout, source_path or img_path, progress_callback)
+            os.replace(img_temp, img_path)
+            os.replace(temp_path_for(dir_path), dir_path)
+            self._apply_layout(layout)
+            self._finish_rebuild_stats(layout)
+            self._directory_written(records)
 
             print(f"Rebuilt DIR/IMG pair: {entry_count} entries")
             return True
@@ -825,6 +1281,19 @@ class IMGFile:
             print(f"[ERROR] Failed to rebuild Version 1 IMG: {e}")
             return False
 
+    def _apply_layout(self, layout: List[tuple]): #vers 3
+        """Point entries at their new (offset, size) once the data is on disk"""
+        get_decompression_cache().discard_archive(self.get_data_path())
+        for entry, (offset, size) in zip(self.entries, layout):
+            entry.offset = offset
+            entry.size = size
+            # Data now lives in the archive - drop the in-memory copy
+            entry._cached_data = None
+        # Offsets moved - high-water mark and free space are recomputed on next use
+        self._data_end = None
+        self.directory = self.get_directory()
+        self._free_space = None
+
     def import_file(self, file_path: str) -> bool: #vers 1
         """Import file into IMG"""
         try:
@@ -843,7 +1312,7 @@ class IMGFile:
             return False
 
 
-    def add_entry(self, filename: str, data: bytes, auto_save: bool = True) -> bool: #vers 3
+    def add_entry(self, filename: str, data: bytes, auto_save: bool = True) -> bool: #vers 5
         """Add new entry to IMG file - FIXED VERSION with enhanced debugging"""
         try:
             print(f"[DEBUG] === ADD_ENTRY START ===")
@@ -859,21 +1328,18 @@ class IMGFile:
             print(f"[DEBUG] IMG version: {self.version}")
             print(f"[DEBUG] Auto-save enabled: {auto_save}")
 
-            # Check for duplicate entries (replace if exists)
+            # Check for duplicate entries (replace if exists) - name index lookup
             existing_entry = None
-            for i, entry in enumerate(self.entries):
-                if entry.name == filename:
-                    existing_entry = entry
-                    print(f"[DEBUG] Replacing existing entry at index {i}: {filename}")
-                    break
+            existing_index = self.find_entry_index(filename)
+            if existing_index >= 0:
+                existing_entry = self.entries[existing_index]
+                print(f"[DEBUG] Replacing existing entry at index {existing_index}: {filename}")
 
-            # Calculate proper offset for new entry
+            # Provisional offset for new entry - the save places it best fit in a free hole
             if self.entries and not existing_entry:
-                # Find the end of the last entry
-                last_entry = max(self.entries, key=lambda e: e.offset + e.size)
-                # Align to sector boundary (2048 bytes for IMG files)
-                last_end = last_entry.offset + last_entry.size
-                new_offset = ((last_end + 2047) // 2048) * 2048
+                # End of the last entry from the tracked high-water mark,
+                # aligned to sector boundary (2048 bytes for IMG files)
+                new_offset = ((self._get_data_end() + 2047) // 2048) * 2048
                 print(f"[DEBUG] Calculated new offset: 0x{new_offset:08X} (after last entry)")
             else:
                 # First entry or replacing existing
@@ -891,8 +1357,12 @@ class IMGFile:
                 # Replace existing entry data
                 print(f"[DEBUG] Updating existing entry data...")
                 new_entry = existing_entry
+                # Old sectors become reclaimable once the directory stops pointing at them
+                self._release_entry_sectors(new_entry)
                 new_entry._cached_data = data
                 new_entry.size = len(data)
+                # Size changed in place - recompute the high-water mark on next use
+                self._data_end = None
                 print(f"[DEBUG] Existing entry updated: size={new_entry.size}, offset=0x{new_entry.offset:08X}")
                 # Keep existing offset for replacement
             else:
@@ -910,9 +1380,14 @@ class IMGFile:
                 print(f"[DEBUG] Detecting file type and version...")
                 new_entry.detect_file_type_and_version()
 
-                # Add to entries list
+                # Add to entries list and keep the name index / data end current
                 print(f"[DEBUG] Adding entry to entries list...")
+                index = self._get_name_index()
+                data_end = self._get_data_end()
                 self.entries.append(new_entry)
+                index.setdefault(filename.lower(), len(self.entries) - 1)
+                self._data_end = max(data_end, new_entry.offset + new_entry.size)
+                self._sync_entry_index()
                 print(f"[DEBUG] Entry appended successfully")
 
             print(f"[DEBUG] Entry processed: {filename} at offset 0x{new_entry.offset:08X}, size {new_entry.size} bytes")
@@ -953,8 +1428,9 @@ class IMGFile:
             return False
 
 
-    def calculate_next_offset(self) -> int: #vers 1
-        """Calculate the next available offset for a new entry - HELPER METHOD"""
+    def calculate_next_offset(self, size: Optional[int] = None) -> int: #vers 3
+        """Calculate the next available offset for a new entry - HELPER METHOD
+        With size given, the best-fitting free hole is used when there is one."""
         try:
             if not self.entries:
                 # First entry
@@ -963,51 +1439,83 @@ class IMGFile:
                 else:
                     return 0  # Version 2 will be recalculated during save
 
-            # Find the entry that ends the latest
-            max_end = 0
-            for entry in self.entries:
-                entry_end = entry.offset + entry.size
-                if entry_end > max_end:
-                    max_end = entry_end
+            space = self.get_free_space_map()
+            if size:
+                start = space.find_best_fit(sectors_for(size))
+                if start is not None:
+                    return start * 2048
 
-            # Align to sector boundary (2048 bytes)
-            aligned_offset = ((max_end + 2047) // 2048) * 2048
-            return aligned_offset
+            # Align the tracked end of data to sector boundary (2048 bytes)
+            aligned_offset = ((self._get_data_end() + 2047) // 2048) * 2048
+            return max(aligned_offset, space.end * 2048)
 
         except Exception as e:
             print(f"[ERROR] Failed to calculate next offset: {e}")
             return 0
 
-    def remove_entry(self, filename: str) -> bool: #vers 1
-        """Remove entry by filename - HELPER METHOD"""
-        try:
-            for i, entry in enumerate(self.entries):
-                if entry.name == filename:
-                    removed_entry = self.entries.pop(i)
-                    print(f"[DEBUG] Removed entry: {filename}")
-                    return True
+    def remove_entry(self, filename: str) -> bool: #vers 5
+        """Remove entry by filename - HELPER METHOD (use remove_entries for many)"""
+        if self.remove_entries([filename]):
+            print(f"[DEBUG] Removed entry: {filename}")
+            return True
+        return False
 
-            print(f"[WARNING] Entry not found for removal: {filename}")
-            return False
+    def remove_entries(self, filenames: List[str]) -> int: #vers 1
+        """Remove entries by filename (case-insensitive) in one pass - a name given
+        twice removes its first two entries. The name index is rebuilt on the next
+        lookup instead of being re-keyed per removal. Returns the number removed."""
+        try:
+            wanted: Dict[str, int] = {}
+            for filename in filenames:
+                key = filename.lower()
+                wanted[key] = wanted.get(key, 0) + 1
+            entries = self.entries
+            removed = set()
+            for i, entry in enumerate(entries):
+                key = entry.name.lower()
+                if wanted.get(key):
+                    wanted[key] -= 1
+                    removed.add(i)
+            for key, missing in wanted.items():
+                if missing:
+                    print(f"[WARNING] Entry not found for removal: {key}")
+            if not removed:
+                return 0
+
+            # Free space map stays valid across the removal
+            space = self._free_space if self._free_space_mutations == entries.mutations else None
+            kept = [entry for i, entry in enumerate(entries) if i not in removed]
+            dropped = [entries[i] for i in sorted(removed)]
+            entries[:] = kept
+            self._invalidate_entry_index()
+            if space is not None:
+                # Sectors become reclaimable once no remaining stored entry points at them
+                still_used = {e.offset for e in kept if e.size and e._cached_data is None}
+                freed = set()
+                for entry in dropped:
+                    if entry._cached_data is None and entry.offset not in still_used and entry.offset not in freed:
+                        freed.add(entry.offset)
+                        space.add_reclaimable(sectors_for(entry.size))
+                self._free_space = space
+                self._free_space_mutations = entries.mutations
+            return len(dropped)
 
         except Exception as e:
-            print(f"[ERROR] Failed to remove entry {filename}: {e}")
-            return False
+            print(f"[ERROR] Failed to remove entries: {e}")
+            return 0
 
-    def has_entry(self, filename: str) -> bool: #vers 1
-        """Check if entry exists by filename - HELPER METHOD"""
+    def has_entry(self, filename: str) -> bool: #vers 2
+        """Check if entry exists by filename (case-insensitive) - HELPER METHOD"""
         try:
-            return any(entry.name == filename for entry in self.entries)
+            return self.find_entry_index(filename) >= 0
         except Exception:
             return False
 
-    def get_entry(self, filename: str) -> Optional['IMGEntry']: #vers 1
-        """Get entry by filename - HELPER METHOD"""
+    def get_entry(self, filename: str) -> Optional['IMGEntry']: #vers 2
+        """Get entry by filename (case-insensitive) - HELPER METHOD"""
         try:
-            for entry in self.entries:
-                if entry.name == filename:
-                    return entry
-            return None
+            index = self.find_entry_index(filename)
+            return self.entries[index] if index >= 0 else None
         except Exception:
             return None
 
@@ -1101,7 +1609,7 @@ class IMGFile:
         self.version = IMGVersion.UNKNOWN
         return IMGVersion.UNKNOWN
 
-    def open(self) -> bool: #vers 5
+    def open(self) -> bool: #vers 6
         """Open and parse IMG file - FIXED WITH PROPER ENTRY PARSING"""
         try:
             if self.is_open:
@@ -1123,8 +1631,15 @@ class IMGFile:
 
             if success:
                 self.is_open = True
-                # FIXED: Parse file types and versions for all entries
-                self._parse_all_entries()
+                # Unchanged archive: types and RW versions come from the sidecar index
+                self.index_loaded = self.load_index()
+                if not self.index_loaded:
+                    # FIXED: Parse file types and versions for all entries
+                    self._parse_all_entries()
+                    if not self.defer_rw_probe:
+                        self.save_index()
+                elif not self.defer_rw_probe:
+                    self._trigger_unknown_rw_detection()
                 print(f"[SUCCESS] Successfully opened IMG file: {len(self.entries)} entries")
             
             return success
@@ -1133,15 +1648,15 @@ class IMGFile:
             print(f"[ERROR] Error opening IMG file: {e}")
             return False
 
-    def _parse_all_entries(self): #vers 2
+    def _parse_all_entries(self): #vers 4
         """ADDED: Parse file types and versions for all entries + UNKNOWN RW DETECTION"""
         try:
             print(f"[DEBUG] Parsing {len(self.entries)} entries for file types and versions")
             
             for i, entry in enumerate(self.entries):
                 try:
-                    # Detect file type and RW version
-                    entry.detect_file_type_and_version()
+                    # Detect file type - RW versions are probed in bulk below
+                    entry.detect_file_type_and_version(probe_rw=False)
                     
                     # Log progress for large files
                     if i > 0 and i % 100 == 0:
@@ -1150,7 +1665,14 @@ class IMGFile:
                 except Exception as e:
                     print(f"[WARNING] Error parsing entry {entry.name}: {e}")
                     
-            print(f"[SUCCESS] Completed parsing all entries")
+            if self.defer_rw_probe:
+                # RW versions (and unknown RW detection) follow from iter_rw_header_batches
+                print(f"[SUCCESS] Completed parsing all entries (RW versions deferred)")
+                return
+
+            # One forward sweep over the archive for every DFF/TXD header
+            detected = self.probe_rw_headers()
+            print(f"[SUCCESS] Completed parsing all entries ({detected} RW versions detected)")
             
             # ADDED: Trigger unknown RW file detection after parsing
             self._trigger_unknown_rw_detection()
@@ -1158,6 +1680,101 @@ class IMGFile:
         except Exception as e:
             print(f"[ERROR] Error in _parse_all_entries: {e}")
 
+    def _rw_probe_targets(self, entries: Optional[List[IMGEntry]] = None) -> Tuple[List[IMGEntry], List[IMGEntry]]: #vers 2
+        """Undetected DFF/TXD entries: new/replaced ones are detected from their cached
+        data, returns (entries detected that way, entries still to read from the archive
+        in offset order)"""
+        detected = []
+        pending = []
+        for entry in (self.entries if entries is None else entries):
+            if entry.extension not in ('DFF', 'TXD') or entry._version_detected:
+                continue
+            if entry._cached_data is not None:
+                # New/replaced entries are not in the archive yet
+                if entry.apply_rw_header(entry._cached_data[:12]):
+                    detected.append(entry)
+            else:
+                pending.append(entry)
+        pending.sort(key=lambda e: e.offset)
+        return detected, pending
+
+    def probe_rw_headers(self, entries: Optional[List[IMGEntry]] = None) -> int: #vers 4
+        """Read the first bytes of every undetected DFF/TXD entry in one sorted
+        forward pass over the archive and fill rw_version/rw_version_name
+        (headers that are not RW are checked for compression)"""
+        cached, pending = self._rw_probe_targets(entries)
+        detected = len(cached)
+        if not pending or not self.open_read_session():
+            return detected
+
+        view = self._img_view
+        if view is not None:
+            # Hint the kernel that the mapping is about to be walked front to back
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self._img_mmap.madvise(mmap.MADV_SEQUENTIAL)
+            try:
+                for entry in pending:
+                    header = view[entry.offset:entry.offset + min(entry.size, DETECT_BYTES)].tobytes()
+                    if entry.apply_rw_header(header[:12]):
+                        detected += 1
+                    else:
+                        self._note_compression(entry, header)
+            finally:
+                if hasattr(mmap, 'MADV_NORMAL'):
+                    self._img_mmap.madvise(mmap.MADV_NORMAL)
+        else:
+            handle = self._img_handle
+            for entry in pending:
+                handle.seek(entry.offset)
+                header = handle.read(min(entry.size, DETECT_BYTES))
+                if entry.apply_rw_header(header[:12]):
+                    detected += 1
+                else:
+                    self._note_compression(entry, header)
+
+        return detected
+
+    def iter_rw_header_batches(self, entries: Optional[List[IMGEntry]] = None, batch_size: int = 1024,
+                               cancelled: Optional[Callable[[], bool]] = None): #vers 3
+        """Generator form of probe_rw_headers for background scans. Reads through its own
+        handle (pread where available, so the read session and rebuilds are not disturbed)
+        in offset order and yields (done, total, detected entries) after each batch.
+        New/replaced entries detected from their cached data count as done and come
+        with the first batch (or alone when nothing has to be read).
+        Stops before the next batch once cancelled() returns True."""
+        cached, pending = self._rw_probe_targets(entries)
+        total = len(cached) + len(pending)
+        if not pending:
+            if cached:
+                yield total, total, cached
+            return
+        try:
+            handle = open(self.get_data_path(), 'rb')
+        except OSError as e:
+            print(f"[ERROR] RW header scan could not open {self.get_data_path()}: {e}")
+            return
+
+        with handle:
+            pread = getattr(os, 'pread', None)
+            fd = handle.fileno()
+            found = list(cached)
+            for start in range(0, len(pending), batch_size):
+                if cancelled is not None and cancelled():
+                    return
+                for entry in pending[start:start + batch_size]:
+                    length = min(entry.size, DETECT_BYTES)
+                    if pread is not None:
+                        header = pread(fd, length, entry.offset)
+                    else:
+                        handle.seek(entry.offset)
+                        header = handle.read(length)
+                    if entry.apply_rw_header(header[:12]):
+                        found.append(entry)
+                    else:
+                        self._note_compression(entry, header)
+                yield len(cached) + min(start + batch_size, len(pending)), total, found
+                found = []
+
     def _trigger_unknown_rw_detection(self): #vers 1
         """ADDED: Trigger unknown RW file detection and snapshotting"""
         try:
@@ -1177,16 +1794,95 @@ class IMGFile:
         except Exception as e:
             print(f"[WARNING] Error in unknown RW detection: {e}")
 
+    def _index_cache(self) -> IMGIndexCache: #vers 1
+        dir_path = self.file_path[:-4] + '.dir' if self.version == IMGVersion.VERSION_1 else None
+        return IMGIndexCache(self.get_data_path(), dir_path)
+
+    def archive_stamp(self) -> Optional[Tuple[int, int, int, int]]: #vers 1
+        """Size/mtime stamp of the files on disk, as the sidecar index records it"""
+        return self._index_cache()._stamp()
+
+    def pause_rw_scan(self): #vers 1
+        """Stop the background RW header scan (and wait for it) before the archive is
+        written - it reads at the live entry offsets. Returns the scan for resume_rw_scan."""
+        scan = self.rw_scan
+        if scan is not None:
+            self.rw_scan = None
+            scan.stop()
+        return scan
+
+    def resume_rw_scan(self, scan): #vers 1
+        """Restart a scan stopped by pause_rw_scan - entries it already detected are skipped"""
+        if scan is not None:
+            scan.restart()
+
+    def load_index(self) -> bool: #vers 1
+        """Restore entry types and RW versions from the sidecar index.
+        False when disabled, missing, or the archive / directory changed since it was written."""
+        if not self.use_index_cache or self._directory_checksum is None:
+            return False
+        try:
+            index = self._index_cache().load(self.version.value, self._directory_checksum, len(self.entries))
+            if index is None:
+                return False
+
+            file_types = list(FileType)
+            version_names: Dict[int, str] = {}
+            detected = 0
+            for entry, extension, file_type, rw_version, flags in zip(
+                    self.entries, index['extensions'], index['file_types'], index['rw_versions'], index['flags']):
+                entry.extension = extension
+                entry.file_type = file_types[file_type] if file_type < len(file_types) else FileType.UNKNOWN
+                if flags & ENTRY_DETECTED:
+                    name = version_names.get(rw_version)
+                    if name is None:
+                        name = version_names[rw_version] = get_rw_version_name(rw_version)
+                    entry.rw_version = rw_version
+                    entry.rw_version_name = name
+                    entry._version_detected = True
+                    detected += 1
+            try:
+                self.platform = IMGPlatform(index['platform'])
+            except ValueError:
+                pass
+            print(f"[SUCCESS] Loaded entry index ({detected} RW versions) - parsing skipped")
+            return True
+        except Exception as e:
+            print(f"[WARNING] Could not use entry index: {e}")
+            return False
+
+    def save_index(self) -> bool: #vers 1
+        """Write the sidecar index for the archive as it is on disk.
+        Skipped while entries hold unsaved data (the directory on disk would not match)."""
+        if not self.use_index_cache or self._directory_checksum is None or not self.is_open:
+            return False
+        if any(entry._cached_data is not None for entry in self.entries):
+            return False
+        try:
+            file_type_ids = {file_type: i for i, file_type in enumerate(FileType)}
+            entries = self.entries
+            return self._index_cache().save(
+                self.version.value, self._directory_checksum, self.platform.value,
+                [entry.extension for entry in entries],
+                [file_type_ids.get(entry.file_type, file_type_ids[FileType.UNKNOWN]) for entry in entries],
+                [entry.rw_version if entry._version_detected else 0 for entry in entries],
+                [ENTRY_DETECTED if entry._version_detected else 0 for entry in entries])
+        except Exception as e:
+            print(f"[WARNING] Could not write entry index: {e}")
+            return False
+
+    def _directory_written(self, records: bytes): #vers 1
+        """The directory on disk is now records - refresh checksum and index"""
+        self._directory_checksum = directory_checksum(records)
+        self.save_index()
+
     def set_main_window_reference(self, main_window): #vers 1
         """ADDED: Set main window reference for unknown RW detection"""
         self._main_window_ref = main_window
 
-    def _open_version_2(self) -> bool: #vers 5
+    def _open_version_2(self) -> bool: #vers 7
         """Open IMG version 2 (single file) - ENHANCED WITH PLATFORM SUPPORT"""
         try:
-            # Use platform-specific specifications
-            sector_size = self.platform_specs.get('sector_size', 2048)
-            
             with open(self.file_path, 'rb') as f:
                 # Skip VER2 header (4 bytes)
                 f.seek(4)
@@ -1198,29 +1894,17 @@ class IMGFile:
                 if entry_count > max_entries:
                     print(f"[WARNING] Entry count {entry_count} exceeds platform limit {max_entries}")
 
-                for i in range(entry_count):
-                    # Read entry: offset(4), size(4), name(24)
-                    entry_data = f.read(32)
-                    if len(entry_data) < 32:
-                        break
-
-                    entry_offset, entry_size = struct.unpack('<II', entry_data[:8])
-                    entry_name = entry_data[8:32].rstrip(b'\x00').decode('ascii', errors='ignore')
-
-                    if entry_name:
-                        entry = IMGEntry()
-                        entry.name = entry_name
-                        entry.offset = entry_offset * 2048  # Convert sectors to bytes
-                        entry.size = entry_size * 2048
-                        entry.set_img_file(self)
-                        self.entries.append(entry)
+                # Whole directory in one read: offset(4), size(4), name(24) per entry
+                dir_data = f.read(entry_count * 32)
 
+            self._directory_checksum = directory_checksum(dir_data)
+            self._load_directory(IMGDirectory.from_buffer(dir_data, entry_count))
             return True
         except Exception as e:
             print(f"[ERROR] Error opening Version 2 IMG: {e}")
             return False
 
-    def _open_version_1(self) -> bool: #vers 4
+    def _open_version_1(self) -> bool: #vers 6
         """Open IMG version 1 (DIR/IMG pair)"""
         dir_path = self.file_path[:-4] + '.dir'
         if not os.path.exists(dir_path):
@@ -1230,68 +1914,185 @@ class IMGFile:
             with open(dir_path, 'rb') as dir_file:
                 dir_data = dir_file.read()
 
-            # Parse directory entries (32 bytes each)
-            entry_count = len(dir_data) // 32
-            for i in range(entry_count):
-                offset = i * 32
-                entry_data = dir_data[offset:offset+32]
-
-                if len(entry_data) < 32:
-                    break
-
-                # Parse entry: offset(4), size(4), name(24)
-                entry_offset, entry_size = struct.unpack('<II', entry_data[:8])
-                entry_name = entry_data[8:32].rstrip(b'\x00').decode('ascii', errors='ignore')
-
-                if entry_name:
-                    entry = IMGEntry()
-                    entry.name = entry_name
-                    entry.offset = entry_offset * 2048  # Convert sectors to bytes
-                    entry.size = entry_size * 2048
-                    entry.set_img_file(self)
-                    self.entries.append(entry)
-
+            self._directory_checksum = directory_checksum(dir_data)
+            # Parse directory entries (32 bytes each): offset(4), size(4), name(24)
+            self._load_directory(IMGDirectory.from_buffer(dir_data))
             return True
         except Exception as e:
             print(f"[ERROR] Error opening Version 1 IMG: {e}")
             return False
 
-    def read_entry_data(self, entry: IMGEntry) -> bytes: #vers 1
-        """Read data for a specific entry"""
+    def _load_directory(self, directory: IMGDirectory): #vers 1
+        """Keep the columnar directory and create entry objects from its rows"""
+        self.directory = directory
+        names, offsets, sizes = directory.columns()
+        from_record = IMGEntry.from_directory_record
+        self.entries.extend(from_record(name, offset, size, self)
+                            for name, offset, size in zip(names, offsets, sizes))
+
+    def get_directory(self) -> IMGDirectory: #vers 1
+        """Columnar directory of the current entries (sort, totals, overlap checks)"""
+        return IMGDirectory.from_entries(self.entries)
+
+    def get_data_path(self) -> str: #vers 1
+        """Get path of the file holding entry data (.img for both DIR/IMG and VER2)"""
+        if self.version == IMGVersion.VERSION_1 and self.file_path.lower().endswith('.dir'):
+            return self.file_path[:-4] + '.img'
+        return self.file_path
+
+    def open_read_session(self) -> bool: #vers 1
+        """Open one read-only handle (mmapped when possible) for all entry reads"""
+        if self._img_handle:
+            return True
         try:
-            if self.version == IMGVersion.VERSION_1:
-                # Read from .img file
-                img_path = self.file_path.replace('.dir', '.img')
-                with open(img_path, 'rb') as f:
-                    f.seek(entry.offset)
-                    return f.read(entry.size)
-            else:
-                # Read from single .img file
-                with open(self.file_path, 'rb') as f:
-                    f.seek(entry.offset)
-                    return f.read(entry.size)
+            self._img_handle = open(self.get_data_path(), 'rb')
+            try:
+                self._img_mmap = mmap.mmap(self._img_handle.fileno(), 0, access=mmap.ACCESS_READ)
+                self._img_view = memoryview(self._img_mmap)
+            except (ValueError, OSError):
+                # Empty file or mmap not supported - plain seek/read on the shared handle
+                self._img_mmap = None
+                self._img_view = None
+            return True
         except Exception as e:
-            raise RuntimeError(f"Failed to write entry data: {e}")
+            print(f"[ERROR] Failed to open read session: {e}")
+            self.close_read_session()
+            return False
 
-    def write_entry_data(self, entry: IMGEntry, data: bytes): #vers 1
-        """Write data for a specific entry"""
+    def close_read_session(self): #vers 1
+        """Release the read session handle and mmap"""
+        if self._img_view is not None:
+            self._img_view.release()
+            self._img_view = None
+        if self._img_mmap is not None:
+            try:
+                self._img_mmap.close()
+            except BufferError:
+                # Entry views still exported - mmap is freed once they are released
+                pass
+            self._img_mmap = None
+        if self._img_handle:
+            self._img_handle.close()
+            self._img_handle = None
+
+    def read_entry_raw_view(self, entry: IMGEntry) -> memoryview: #vers 1
+        """Entry data exactly as stored (compressed entries stay compressed), zero-copy"""
+        if entry._cached_data is not None:
+            return memoryview(entry._cached_data)
+        if not self._img_handle and not self.open_read_session():
+            raise RuntimeError(f"Failed to read entry data: cannot open {self.get_data_path()}")
+        if self._img_view is not None:
+            return self._img_view[entry.offset:entry.offset + entry.size]
+        self._img_handle.seek(entry.offset)
+        return memoryview(self._img_handle.read(entry.size))
+
+    def read_entry_view(self, entry: IMGEntry) -> memoryview: #vers 2
+        """Read data for a specific entry as a memoryview - zero-copy unless the
+        entry is compressed (then a view of the cached decompressed data)"""
+        view = self.read_entry_raw_view(entry)
+        if entry._cached_data is not None:
+            return view
+        data = self._decompressed(entry, view)
+        if data is None:
+            return view
+        view.release()
+        return memoryview(data)
+
+    def read_entry_data(self, entry: IMGEntry) -> bytes: #vers 3
+        """Read data for a specific entry through the read session (decompressed)"""
         try:
-            if self.version == IMGVersion.VERSION_1:
-                # Write to .img file
-                img_path = self.file_path.replace('.dir', '.img')
-                with open(img_path, 'r+b') as f:
-                    f.seek(entry.offset)
-                    f.write(data)
+            if entry._cached_data is not None:
+                return entry._cached_data
+            view = self.read_entry_raw_view(entry)
+            try:
+                data = self._decompressed(entry, view)
+                return data if data is not None else view.tobytes()
+            finally:
+                view.release()
+        except Exception as e:
+            raise RuntimeError(f"Failed to read entry data: {e}")
+
+    def _note_compression(self, entry: IMGEntry, header: bytes) -> Optional[tuple]: #vers 1
+        """Mark entry compressed (type and uncompressed size) when header is a
+        Fastman92 payload - returns detect_fastman92_header's result"""
+        found = detect_fastman92_header(header, entry.size)
+        if found is not None:
+            entry.compression_type = CompressionType(found[0])
+            entry.uncompressed_size = found[1]
+        elif entry.compression_type in (CompressionType.ZLIB, CompressionType.LZ4):
+            entry.compression_type = CompressionType.NONE
+            entry.uncompressed_size = 0
+        return found
+
+    def _decompressed(self, entry: IMGEntry, view: memoryview) -> Optional[bytes]: #vers 1
+        """Decompressed data for a compressed entry (from the shared cache when
+        possible), None when the entry is not compressed or decompress_on_read is off"""
+        if not self.decompress_on_read or len(view) < DETECT_BYTES:
+            return None
+        header = view[:DETECT_BYTES].tobytes()
+        found = self._note_compression(entry, header)
+        if found is None:
+            return None
+        kind, original_size, compressed_size = found
+        cache = get_decompression_cache()
+        data_path = self.get_data_path()
+        data = cache.get(data_path, entry.offset, header[:12])
+        if data is None:
+            from apps.core.compression import CompressionAlgorithm, CompressionSettings, IMGCompressor
+            algorithm = CompressionAlgorithm.FASTMAN92_LZ4 if kind == 'lz4' else CompressionAlgorithm.FASTMAN92_ZLIB
+            compressor = IMGCompressor(CompressionSettings(algorithm, fastman92_header=True))
+            data = compressor.decompress_data(view[:12 + compressed_size].tobytes(), algorithm)
+            if len(data) != original_size:
+                raise RuntimeError(f"{entry.name}: decompressed {len(data)} bytes, header says {original_size}")
+            cache.put(data_path, entry.offset, header[:12], data)
+        return data
+
+    def probe_compressed_entries(self, entries: Optional[List[IMGEntry]] = None) -> int: #vers 1
+        """Check the first bytes of every stored entry for compression in one
+        sorted pass - returns the number of compressed entries"""
+        targets = sorted((e for e in (self.entries if entries is None else entries)
+                          if e._cached_data is None and e.size >= DETECT_BYTES), key=lambda e: e.offset)
+        if not targets or not self.open_read_session():
+            return 0
+        compressed = 0
+        for entry in targets:
+            if self._img_view is not None:
+                header = self._img_view[entry.offset:entry.offset + DETECT_BYTES].tobytes()
             else:
-                # Write to single .img file
-                with open(self.file_path, 'r+b') as f:
-                    f.seek(entry.offset)
-                    f.write(data)
+                self._img_handle.seek(entry.offset)
+                header = self._img_handle.read(DETECT_BYTES)
+            if self._note_compression(entry, header) is not None:
+                compressed += 1
+        return compressed
+
+    def get_compression_stats(self) -> Dict[str, Any]: #vers 1
+        """Compressed entries known so far (stored and decompressed bytes) plus the
+        shared decompression cache's counters (cache_hits, cache_misses, ...)"""
+        compressed = [e for e in self.entries if e.compression_type in (CompressionType.ZLIB, CompressionType.LZ4)]
+        stats = {
+            'compressed_entries': len(compressed),
+            'stored_bytes': sum(e.size for e in compressed),
+            'uncompressed_bytes': sum(e.uncompressed_size for e in compressed)
+        }
+        for key, value in get_decompression_cache().get_stats().items():
+            stats[f'cache_{key}'] = value
+        return stats
+
+    def write_entry_data(self, entry: IMGEntry, data: bytes): #vers 3
+        """Write data for a specific entry"""
+        try:
+            # mmap must not outlive a write to the underlying file
+            self.close_read_session()
+            get_decompression_cache().discard_archive(self.get_data_path())
+            with open(self.get_data_path(), 'r+b') as f:
+                f.seek(entry.offset)
+                f.write(data)
         except Exception as e:
             raise RuntimeError(f"Failed to write entry data: {e}")
 
-    def close(self): #vers 1
+    def close(self): #vers 2
         """Close IMG file"""
+        self.close_read_session()
         self.is_open = False
         self.entries.clear()
 
@@ -1324,150 +2125,6 @@ def format_file_size(size_bytes: int) -> str: #vers 1
     else:
         return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
 
-# ALL ORIGINAL GUI CLASSES PRESERVED EXACTLY AS IN ORIGINAL
-class IMGEntriesTable(QTableWidget):
-    """Enhanced table widget for IMG entries"""
-    entry_double_clicked = pyqtSignal(object)
-    
-    def __init__(self, parent=None): #vers 1
-        super().__init__(parent)
-        self.setColumnCount(7)
-        self.setHorizontalHeaderLabels(['Name', 'Type', 'Size', 'Offset', 'Version', 'Compression', 'Status'])
-        
-        # Setup table properties
-        self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
-        
-        # Auto-resize columns
-        header = self.horizontalHeader()
-        header.setStretchLastSection(True)
-        for i in range(6):
-            header.setSectionResizeMode(i, header.ResizeMode.ResizeToContents)
-
-class FilterPanel(QWidget):
-    """Filter panel for IMG entries"""
-    filter_changed = pyqtSignal(str)
-    
-    def __init__(self, parent=None): #vers 1
-        super().__init__(parent)
-        self._setup_ui()
-    
-    def _setup_ui(self): #vers 1
-        layout = QVBoxLayout(self)
-        
-        # File type filter
-        type_group = QGroupBox("File Type Filter")
-        type_layout = QHBoxLayout(type_group)
-        
-        self.type_combo = QComboBox()
-        self.type_combo.addItems(['All', 'DFF', 'TXD', 'COL', 'IFP', 'IPL', 'DAT', 'WAV'])
-        self.type_combo.currentTextChanged.connect(self.filter_changed.emit)
-        type_layout.addWidget(self.type_combo)
-        
-        # Search filter
-        search_group = QGroupBox("Search")
-        search_layout = QHBoxLayout(search_group)
-        
-        self.search_edit = QLineEdit()
-        self.search_edit.setPlaceholderText("Search entries...")
-        self.search_edit.textChanged.connect(self.filter_changed.emit)
-        search_layout.addWidget(self.search_edit)
-        
-        layout.addWidget(type_group)
-        layout.addWidget(search_group)
-
-class IMGFileInfoPanel(QWidget):
-    """Information panel for IMG file details"""
-    
-    def __init__(self, parent=None): #vers 1
-        super().__init__(parent)
-        self._setup_ui()
-    
-    def _setup_ui(self): #vers 1
-        layout = QVBoxLayout(self)
-        
-        self.info_label = QLabel("No IMG file loaded")
-        layout.addWidget(self.info_label)
-
-class TabFilterWidget(QWidget):
-    """Tab-specific filter widget"""
-    
-    def __init__(self, parent=None): #vers 1
-        super().__init__(parent)
-        self._setup_ui()
-    
-    def _setup_ui(self): #vers 1
-        layout = QHBoxLayout(self)
-        
-        self.filter_combo = QComboBox()
-        self.filter_combo.addItems(['All Files', 'Models (DFF)', 'Textures (TXD)', 'Collision (COL)', 'Animations (IFP)'])
-        layout.addWidget(self.filter_combo)
-
-def integrate_filtering(main_window): #vers 2
-    """Integrate filtering functionality into main window"""
-    try:
-        # Create filter widget
-        filter_widget = FilterPanel(main_window)
-
-        # Connect filter widget to table
-        if hasattr(filter_widget, 'filter_changed'):
-            filter_widget.filter_changed.connect(table_widget.apply_filter)
-
-        return filter_widget
-    except Exception as e:
-        img_debugger.error(f"Error integrating filtering: {e}")
-        return None
-
-def create_entries_table_panel(main_window): #vers 4
-    """Create the complete entries table panel"""
-    panel = QWidget()
-    layout = QVBoxLayout(panel)
-    layout.setContentsMargins(0, 0, 0, 0)
-
-    # IMG file information
-    info_group = QGroupBox("IMG File Information")
-    info_layout = QVBoxLayout(info_group)
-
-    main_window.file_info_panel = IMGFileInfoPanel()
-    info_layout.addWidget(main_window.file_info_panel)
-
-    layout.addWidget(info_group)
-
-    # Filter panel
-    filter_group = QGroupBox("Filter & Search")
-    filter_layout = QVBoxLayout(filter_group)
-
-    main_window.filter_panel = FilterPanel()
-    filter_layout.addWidget(main_window.filter_panel)
-
-    layout.addWidget(filter_group)
-
-    # Entries table
-    entries_group = QGroupBox("Archive Entries")
-    entries_layout = QVBoxLayout(entries_group)
-
-    main_window.entries_table = IMGEntriesTable()
-    entries_layout.addWidget(main_window.entries_table)
-
-    layout.addWidget(entries_group)
-
-    # Connect filter to table
-    main_window.filter_panel.filter_changed.connect(main_window.entries_table.apply_filter)
-
-    # SIMPLIFIED CONNECTION - Let main app handle its own signals
-    # Don't auto-connect anything from here to prevent conflicts
-
-    if hasattr(main_window, 'on_entry_double_clicked'):
-        # Only connect double-click since that doesn't cause logging conflicts
-        try:
-            main_window.entries_table.entry_double_clicked.disconnect()
-        except:
-            pass
-        main_window.entries_table.entry_double_clicked.connect(main_window.on_entry_double_clicked)
-
-    return panel
-
 def create_img_file(output_path: str, version: IMGVersion, **options) -> bool: #vers 2
     """Create IMG file using appropriate version creator"""
     img = IMGFile()
@@ -1478,34 +2135,20 @@ def detect_img_version(file_path: str) -> IMGVersion: #vers 2
     img = IMGFile(file_path)
     return img.detect_version()
 
-def populate_table_with_sample_data(table): #vers 3
-    """Populate table with sample data for testing"""
-    sample_entries = [
-        {"name": "player.dff", "extension": "DFF", "size": 250880, "offset": 0x2000, "version": "RW 3.6"},
-        {"name": "player.txd", "extension": "TXD", "size": 524288, "offset": 0x42000, "version": "RW 3.6"},
-        {"name": "vehicle.col", "extension": "COL", "size": 131072, "offset": 0x84000, "version": "COL 2"},
-        {"name": "dance.ifp", "extension": "IFP", "size": 1258291, "offset": 0xA4000, "version": "IFP 1"},
-    ]
-
-    # Convert to mock entry objects
-    class MockEntry:
-        def __init__(self, data): #vers 1
-            self.name = data["name"]
-            self.extension = data["extension"]
-            self.size = data["size"]
-            self.offset = data["offset"]
-            self._version = data["version"]
-            self.is_new_entry = False
-            self.is_replaced = False
-            self.compression_type = CompressionType.NONE
-
-        def get_version_text(self): #vers 1
-            return self._version
-
-    mock_entries = [MockEntry(data) for data in sample_entries]
-    table.populate_entries(mock_entries)
-
-# Export classes and functions - EXACTLY AS ORIGINAL
+# Qt widgets that used to live here - imported on first access only
+_GUI_NAMES = ('IMGEntriesTable', 'FilterPanel', 'IMGFileInfoPanel', 'TabFilterWidget',
+              'integrate_filtering', 'create_entries_table_panel', 'populate_table_with_sample_data')
+
+
+def __getattr__(name): #vers 1
+    """Old imports of the table widgets keep working without loading Qt for everyone else"""
+    if name in _GUI_NAMES:
+        from apps.gui import img_table_widgets
+        return getattr(img_table_widgets, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Export classes and functions - format classes only (widgets: gui/img_table_widgets.py)
 __all__ = [
     'IMGVersion',
     'FileType', 
@@ -1517,14 +2160,7 @@ __all__ = [
     'RecentFilesManager',
     'create_img_file',
     'format_file_size',
-    'IMGEntriesTable',
-    'FilterPanel', 
-    'IMGFileInfoPanel',
-    'TabFilterWidget',
-    'integrate_filtering',
-    'create_entries_table_panel',
     'detect_img_version',
-    'populate_table_with_sample_data',
     'get_img_platform_info',  # ADDED: Platform info function
     'IMGPlatform'  # ADDED: Now exported since moved here
 ]
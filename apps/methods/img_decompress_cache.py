@@ -0,0 +1,141 @@
+#this belongs in methods/img_decompress_cache.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - Decompressed Entry Cache
+
+"""
+IMG Decompress Cache - Compressed entries (Fastman92 header + zlib or LZ4 block,
+as written by core/compression.py) are recognised from their first bytes and
+decompressed once: the result is kept in a size-bounded LRU keyed by
+(archive data path, offset), shared by every IMGFile in the process, so the
+viewers, workshops, exporters and validators reading one entry again get the
+decompressed bytes without repeating the work. Hit/miss counts are kept for the
+status bar. Qt-free - used by IMGFile.read_entry_data / read_entry_view.
+"""
+
+import struct
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+##Methods list -
+# detect_fastman92_header
+# get_decompression_cache
+
+##Classes -
+# DecompressionCache
+
+FASTMAN92_HEADER_SIZE = 12       # original size, compressed size, version
+FASTMAN92_VERSION = 1
+DETECT_BYTES = 14                # Header + the first two bytes of a zlib stream
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+MAX_EXPANSION = 1100             # zlib can't expand more than ~1032x, LZ4 ~255x
+
+_shared_cache: Optional['DecompressionCache'] = None
+
+
+def detect_fastman92_header(header: bytes, stored_size: int) -> Optional[Tuple[str, int, int]]: #vers 1
+    """(kind, original size, compressed size) when header (the first DETECT_BYTES of
+    an entry stored_size bytes long) is a Fastman92 compressed payload, else None.
+    kind is 'zlib' or 'lz4' (the CompressionType values). The compressed size has to
+    fill the entry up to its sector padding, so plain RW/COL data does not match."""
+    if len(header) < DETECT_BYTES:
+        return None
+    original_size, compressed_size, version = struct.unpack_from('<III', header)
+    if version != FASTMAN92_VERSION or not compressed_size:
+        return None
+    slack = stored_size - FASTMAN92_HEADER_SIZE - compressed_size
+    if slack < 0 or slack >= 2048:
+        return None
+    if not compressed_size <= original_size <= compressed_size * MAX_EXPANSION:
+        return None
+    cmf, flg = header[12], header[13]
+    if cmf & 0x0F == 8 and (cmf << 8 | flg) % 31 == 0:
+        return 'zlib', original_size, compressed_size
+    return 'lz4', original_size, compressed_size
+
+
+class DecompressionCache:
+    """LRU of decompressed entry data, bounded by total bytes - thread safe"""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES): #vers 1
+        self.max_bytes = max_bytes
+        self._items: 'OrderedDict[Tuple[str, int], Tuple[bytes, bytes]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.decompressed_bytes = 0      # Produced by misses, cached or not
+
+    def get(self, archive: str, offset: int, header: bytes) -> Optional[bytes]: #vers 1
+        """Cached data for the entry at offset - only while its stored header still matches"""
+        key = (archive, offset)
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[0] != header:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def put(self, archive: str, offset: int, header: bytes, data: bytes): #vers 1
+        """Keep data, dropping the least recently used entries over max_bytes.
+        Entries larger than a quarter of the cache are not kept."""
+        key = (archive, offset)
+        size = len(data)
+        with self._lock:
+            self.decompressed_bytes += size
+            if size > self.max_bytes // 4:
+                return
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old[1])
+            self._items[key] = (header, data)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, dropped) = self._items.popitem(last=False)
+                self._bytes -= len(dropped)
+                self.evictions += 1
+
+    def discard_archive(self, archive: str): #vers 1
+        """Forget every entry of one archive (offsets changed or file replaced)"""
+        with self._lock:
+            for key in [key for key in self._items if key[0] == archive]:
+                self._bytes -= len(self._items.pop(key)[1])
+
+    def clear(self): #vers 1
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]: #vers 1
+        """hits, misses, hit_rate (percent), evictions, entries, bytes, max_bytes, decompressed_bytes"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits * 100.0 / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._items),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'decompressed_bytes': self.decompressed_bytes
+            }
+
+
+def get_decompression_cache() -> DecompressionCache: #vers 1
+    """The process-wide cache (created on first use)"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = DecompressionCache()
+    return _shared_cache
+
+
+__all__ = [
+    'DEFAULT_CACHE_BYTES',
+    'DETECT_BYTES',
+    'DecompressionCache',
+    'detect_fastman92_header',
+    'get_decompression_cache'
+]
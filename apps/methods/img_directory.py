@@ -0,0 +1,119 @@
+#this belongs in methods/img_directory.py - Version: 4
+# X-Seti - October16 2026 - IMG Factory 1.5 - IMG Directory Table
+
+"""
+IMG Directory Table - Columnar (array-backed) view of an IMG directory.
+The raw 32-byte records (offset, size, name) are loaded with one np.frombuffer
+into a structured array; offsets and sizes are kept in 2048-byte sectors as on disk.
+Gives vectorized sort by offset, total size, data end and overlap checks.
+"""
+
+from typing import List, Tuple, Optional, Iterable
+
+import numpy as np
+
+##Classes -
+# IMGDirectory
+
+SECTOR_SIZE = 2048
+RECORD_SIZE = 32
+RECORD_DTYPE = np.dtype([('offset', '<u4'), ('size', '<u4'), ('name', 'S24')])
+
+
+class IMGDirectory:
+    """Array-backed IMG directory - offsets/sizes in sectors, names as 24-byte fields"""
+
+    def __init__(self, records: Optional[np.ndarray] = None): #vers 2
+        # Structured array of RECORD_DTYPE
+        if records is None:
+            records = np.zeros(0, dtype=RECORD_DTYPE)
+        self.records = records
+
+    @classmethod
+    def from_buffer(cls, data: bytes, count: Optional[int] = None) -> 'IMGDirectory': #vers 2
+        """Load directory records with one frombuffer - rows with empty names are dropped"""
+        available = len(data) // RECORD_SIZE
+        count = available if count is None else min(count, available)
+        records = np.frombuffer(data, dtype=RECORD_DTYPE, count=count)
+        # Empty names are unused slots - same rule as the per-record parser
+        # (S24 comparison ignores trailing NULs)
+        return cls(records[records['name'] != b''])
+
+    @classmethod
+    def from_entries(cls, entries: Iterable) -> 'IMGDirectory': #vers 2
+        """Build directory columns from IMGEntry objects (byte offsets/sizes)"""
+        rows = []
+        for entry in entries:
+            name = entry.name.encode('ascii', errors='replace')[:24]
+            rows.append((entry.offset // SECTOR_SIZE,
+                         (entry.size + SECTOR_SIZE - 1) // SECTOR_SIZE,
+                         name))
+        return cls(np.array(rows, dtype=RECORD_DTYPE))
+
+    def __len__(self) -> int: #vers 1
+        return len(self.records)
+
+    def offsets(self) -> np.ndarray: #vers 2
+        """Offsets in sectors"""
+        return self.records['offset'].astype(np.int64)
+
+    def sizes(self) -> np.ndarray: #vers 2
+        """Sizes in sectors"""
+        return self.records['size'].astype(np.int64)
+
+    def extents(self) -> List[Tuple[int, int]]: #vers 2
+        """(offset, size) pairs in sectors - the space this directory references"""
+        return list(zip(self.records['offset'].tolist(), self.records['size'].tolist()))
+
+    def names(self) -> List[str]: #vers 2
+        """Decoded entry names"""
+        return [name.rstrip(b'\x00').decode('ascii', errors='ignore') for name in self.records['name'].tolist()]
+
+    def columns(self) -> Tuple[List[str], List[int], List[int]]: #vers 2
+        """Names, byte offsets and byte sizes as plain lists (for building entries)"""
+        offsets = (self.offsets() * SECTOR_SIZE).tolist()
+        sizes = (self.sizes() * SECTOR_SIZE).tolist()
+        return self.names(), offsets, sizes
+
+    def sort_order(self) -> np.ndarray: #vers 2
+        """Row indices sorted by offset (stable)"""
+        return np.argsort(self.records['offset'], kind='stable')
+
+    def total_size(self) -> int: #vers 2
+        """Sum of entry sizes in bytes"""
+        return int(self.sizes().sum()) * SECTOR_SIZE
+
+    def data_end(self) -> int: #vers 2
+        """End of the last entry in bytes (high-water mark of the data area)"""
+        if not len(self.records):
+            return 0
+        return int((self.offsets() + self.sizes()).max()) * SECTOR_SIZE
+
+    def find_overlaps(self, ignore_shared: bool = False) -> List[Tuple[int, int]]: #vers 3
+        """Row index pairs whose sector ranges overlap (checked after sorting by offset).
+        ignore_shared: entries pointing at exactly the same range (deduplicated) are fine."""
+        order = self.sort_order()
+        if len(order) < 2:
+            return []
+        offsets = self.offsets()[order]
+        sizes = self.sizes()[order]
+        ends = offsets + sizes
+        # Running max of ends catches an entry overlapped by any earlier one
+        reach = np.maximum.accumulate(ends)[:-1]
+        hit = offsets[1:] < reach
+        if ignore_shared:
+            hit &= ~((offsets[1:] == offsets[:-1]) & (sizes[1:] == sizes[:-1]))
+        hits = np.nonzero(hit)[0]
+        return [(int(order[i]), int(order[i + 1])) for i in hits]
+
+    def to_bytes(self) -> bytes: #vers 2
+        """Pack records back into raw 32-byte directory records"""
+        return self.records.astype(RECORD_DTYPE).tobytes()
+
+
+__all__ = [
+    'IMGDirectory',
+    'RECORD_DTYPE',
+    'RECORD_SIZE',
+    'SECTOR_SIZE'
+]
@@ -0,0 +1,212 @@
+#this belongs in methods/img_duplicates.py - Version: 3
+# X-Seti - October16 2026 - IMG Factory 1.5 - IMG Duplicate Search
+
+"""
+IMG Duplicate Search - Find duplicate entries by content hash, name or size.
+Moved out of find_dups_functions.py (dialogs stay there) so it runs without Qt.
+Content search is staged (size buckets, 4 KB prefix hash, full hash) with the
+hashes kept in a sidecar cache (methods/img_hash_cache.py).
+"""
+
+import os
+import hashlib
+from typing import Dict, List, Any, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from apps.methods.img_hash_cache import IMGHashCache
+
+##Methods list -
+# find_duplicate_entries
+# find_duplicates_by_hash
+# find_duplicates_by_name
+# find_duplicates_by_size
+# _digest
+# _entry_digest
+# _hash_stage
+
+HASH_ALGORITHM = "blake2b-128"
+PREFIX_HASH_SIZE = 4096      # Bytes hashed in the prefix stage
+DEFAULT_HASH_WORKERS = 8
+HASH_CHUNK_MIN = 16          # Entries per thread pool task (at least)
+
+
+def _digest(data) -> str: #vers 2
+    """Content hash of a buffer (BLAKE2b-128)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _entry_digest(img_file, entry, limit: int = 0) -> str: #vers 1
+    """Hash the first limit bytes of an entry (all of it when limit is 0) - zero copy"""
+    view = img_file.read_entry_view(entry)
+    part = view[:limit] if limit and limit < len(view) else view
+    try:
+        return _digest(part)
+    finally:
+        if part is not view:
+            part.release()
+        view.release()
+
+
+def _hash_stage(img_file, entries: List[Any], kind: str, limit: int, cache: Optional[IMGHashCache],
+                max_workers: int, progress_callback=None, done_before: int = 0, total: int = 0) -> List[Optional[str]]: #vers 1
+    """Hash entries (cached values first, the rest on a thread pool), aligned with entries"""
+    digests: List[Optional[str]] = [None] * len(entries)
+    todo = []
+    for i, entry in enumerate(entries):
+        if cache is not None and entry._cached_data is None:
+            digests[i] = cache.get(entry.offset, entry.size, kind)
+        if digests[i] is None:
+            todo.append(i)
+
+    def work(chunk):
+        results = []
+        for i in chunk:
+            try:
+                results.append((i, _entry_digest(img_file, entries[i], limit)))
+            except Exception as e:
+                print(f"[WARNING] Could not hash {entries[i].name}: {e}")
+                results.append((i, None))
+        return results
+
+    # Chunks keep per-task overhead small next to 4 KB prefix hashes
+    chunk_size = max(HASH_CHUNK_MIN, len(todo) // (max_workers * 4) + 1)
+    chunks = [todo[start:start + chunk_size] for start in range(0, len(todo), chunk_size)]
+    count = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for results in pool.map(work, chunks):
+            for i, digest in results:
+                digests[i] = digest
+                entry = entries[i]
+                if digest is not None and cache is not None and entry._cached_data is None:
+                    cache.put(entry.offset, entry.size, kind, digest)
+            count += len(results)
+            if progress_callback:
+                progress_callback(done_before + count, total, f"Hashing ({kind}): {count}/{len(todo)}")
+    return digests
+
+
+def find_duplicate_entries(img_file, progress_callback=None, use_cache: bool = True,
+                           max_workers: Optional[int] = None) -> Dict[str, List[Any]]: #vers 1
+    """Staged duplicate search: exact size buckets, then a 4 KB prefix hash, then a
+    full hash of what is left. Returns full hash -> entries (archive order)."""
+    entries = list(img_file.entries)
+
+    # Stage 1 - only entries sharing an exact size can match
+    by_size = defaultdict(list)
+    for entry in entries:
+        size = len(entry._cached_data) if entry._cached_data is not None else entry.size
+        by_size[size].append(entry)
+    candidates = [group for group in by_size.values() if len(group) > 1]
+    if not candidates:
+        if progress_callback:
+            progress_callback(len(entries), len(entries), "Complete")
+        return {}
+
+    if not img_file.open_read_session():
+        return {}
+    # Threads share the read-only mmap; a plain shared handle must stay single threaded
+    if getattr(img_file, '_img_view', None) is None:
+        max_workers = 1
+    elif max_workers is None:
+        max_workers = min(DEFAULT_HASH_WORKERS, os.cpu_count() or 1)
+
+    cache = None
+    if use_cache and img_file.file_path:
+        cache = IMGHashCache(img_file.get_data_path(), HASH_ALGORITHM)
+        cache.load()
+
+    total = sum(len(group) for group in candidates)
+    if progress_callback:
+        progress_callback(0, total, f"{total} entries share a size with another entry")
+
+    # Stage 2 - prefix hash (the whole entry for small ones)
+    flat = [entry for group in candidates for entry in group]
+    prefixes = _hash_stage(img_file, flat, 'prefix', PREFIX_HASH_SIZE, cache, max_workers,
+                           progress_callback, 0, total)
+    by_prefix = defaultdict(list)
+    for entry, digest in zip(flat, prefixes):
+        if digest is not None:
+            size = len(entry._cached_data) if entry._cached_data is not None else entry.size
+            by_prefix[(size, digest)].append(entry)
+
+    duplicates: Dict[str, List[Any]] = {}
+    remaining = []
+    for (size, digest), group in by_prefix.items():
+        if len(group) < 2:
+            continue
+        if size <= PREFIX_HASH_SIZE:
+            duplicates[digest] = group
+        else:
+            remaining.append(group)
+
+    # Stage 3 - full hash of entries whose size and prefix both matched
+    flat = [entry for group in remaining for entry in group]
+    if flat:
+        fulls = _hash_stage(img_file, flat, 'full', 0, cache, max_workers, progress_callback, total - len(flat), total)
+        by_full = defaultdict(list)
+        for entry, digest in zip(flat, fulls):
+            if digest is not None:
+                by_full[digest].append(entry)
+        duplicates.update((digest, group) for digest, group in by_full.items() if len(group) > 1)
+
+    if cache is not None:
+        cache.save()
+    if progress_callback:
+        progress_callback(total, total, "Complete")
+
+    order = {id(entry): i for i, entry in enumerate(entries)}
+    return {digest: sorted(group, key=lambda e: order[id(e)]) for digest, group in duplicates.items()}
+
+
+def find_duplicates_by_hash(img_file, progress_callback=None, use_cache: bool = True) -> Dict[str, List[str]]: #vers 2
+    """Find duplicate files by content hash - hash -> names, see find_duplicate_entries"""
+    try:
+        groups = find_duplicate_entries(img_file, progress_callback, use_cache)
+        return {digest: [entry.name for entry in group] for digest, group in groups.items()}
+    except Exception as e:
+        print(f"[ERROR] Duplicate search failed: {e}")
+        return {}
+
+
+def find_duplicates_by_name(img_file) -> Dict[str, List[str]]: #vers 1
+    """Find duplicate files by filename"""
+    try:
+        name_map = defaultdict(list)
+        
+        for entry in img_file.entries:
+            name_map[entry.name].append(entry.name)
+        
+        # Return only actual duplicates (more than one occurrence)
+        duplicates = {name: files for name, files in name_map.items() if len(files) > 1}
+        
+        return duplicates
+        
+    except Exception:
+        return {}
+
+
+def find_duplicates_by_size(img_file) -> Dict[int, List[str]]: #vers 1
+    """Find potential duplicate files by size"""
+    try:
+        size_map = defaultdict(list)
+        
+        for entry in img_file.entries:
+            size_map[entry.size].append(entry.name)
+        
+        # Return only sizes with multiple files
+        duplicates = {size: files for size, files in size_map.items() if len(files) > 1}
+        
+        return duplicates
+        
+    except Exception:
+        return {}
+
+
+__all__ = [
+    'HASH_ALGORITHM',
+    'find_duplicate_entries',
+    'find_duplicates_by_hash',
+    'find_duplicates_by_name',
+    'find_duplicates_by_size'
+]
@@ -1,4 +1,4 @@
-#this belongs in methods/img_export_entry.py - Version: 2
+#this belongs in methods/img_export_entry.py - Version: 3
 # X-Seti - November19 2025 - IMG Factory 1.5 - IMG Export Entry Helper
 """
 IMG Export Entry Helper - Single entry export function
@@ -11,7 +11,7 @@ from typing import Optional
 ##Methods list -
 # export_entry
 
-def export_entry(img_archive, entry, output_path: Optional[str] = None, output_dir: Optional[str] = None) -> str: #vers 2
+def export_entry(img_archive, entry, output_path: Optional[str] = None, output_dir: Optional[str] = None) -> str: #vers 3
     """Export an entry from an IMG archive to a file
     Args:
         img_archive: IMG archive object
@@ -42,11 +42,15 @@ def export_entry(img_archive, entry, output_path: Optional[str] = None, output_d
             if not hasattr(entry, 'data') or not entry.data:
                 if img_debugger:
                     img_debugger.debug(f"Reading entry data from file: {entry.name}")
-                with open(img_archive.file_path, 'rb') as f:
-                    # ✅ FIXED: Use entry.offset, not actual_offset
-                    f.seek(entry.offset)
-                    # ✅ FIXED: Use entry.size, not actual_size
-                    data_to_write = f.read(entry.size)
+                if hasattr(img_archive, 'read_entry_view'):
+                    # Shared read session - zero-copy slice of the archive
+                    data_to_write = img_archive.read_entry_view(entry)
+                else:
+                    with open(img_archive.file_path, 'rb') as f:
+                        # ✅ FIXED: Use entry.offset, not actual_offset
+                        f.seek(entry.offset)
+                        # ✅ FIXED: Use entry.size, not actual_size
+                        data_to_write = f.read(entry.size)
             else:
                 data_to_write = entry.data
         # Write data to output file
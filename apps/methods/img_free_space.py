@@ -0,0 +1,158 @@
+#this belongs in methods/img_free_space.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - IMG Free Space Map
+
+"""
+IMG Free Space Map - Free sector extents of an IMG data area.
+Holes are found in one pass over the used extents sorted by offset, kept
+coalesced, and handed out best fit (smallest hole that is big enough) so new
+data fills the dead space left by removed/replaced entries instead of always
+growing the archive. All positions and lengths are in 2048-byte sectors.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple, Iterable, Any
+
+##Methods list -
+# sectors_for
+
+##Classes -
+# IMGFreeSpaceMap
+
+SECTOR_SIZE = 2048
+
+
+def sectors_for(size: int) -> int: #vers 1
+    """Number of whole sectors needed for size bytes"""
+    return (size + SECTOR_SIZE - 1) // SECTOR_SIZE
+
+
+class IMGFreeSpaceMap:
+    """Coalesced free extents with best-fit allocation (sector units)"""
+
+    def __init__(self, floor: int = 0): #vers 1
+        self.floor = floor                      # Nothing below this sector is allocatable (VER2 directory)
+        self.end = floor                        # End of the used data area
+        self.reclaimable = 0                    # Sectors freed since the last save (usable after it)
+        self._holes: Dict[int, int] = {}        # start -> length
+        self._hole_ends: Dict[int, int] = {}    # end -> start, for coalescing with the hole before
+        self._by_size: List[Tuple[int, int]] = []  # (length, start) sorted - best fit lookup
+
+    @classmethod
+    def from_extents(cls, extents: Iterable[Tuple[int, int]], floor: int = 0,
+                     end: Optional[int] = None) -> 'IMGFreeSpaceMap': #vers 1
+        """Build from used (start, length) extents in any order.
+        Gaps between floor and the end of the last extent (or end) become holes."""
+        space = cls(floor)
+        reach = floor
+        for start, length in sorted(extents):
+            if length <= 0:
+                continue
+            if start > reach:
+                space._add_hole(reach, start - reach)
+            reach = max(reach, start + length)
+        if end is not None and end > reach:
+            space._add_hole(reach, end - reach)
+            reach = end
+        space.end = reach
+        return space
+
+    def _add_hole(self, start: int, length: int): #vers 1
+        self._holes[start] = length
+        self._hole_ends[start + length] = start
+        insort(self._by_size, (length, start))
+
+    def _remove_hole(self, start: int) -> int: #vers 1
+        length = self._holes.pop(start)
+        del self._hole_ends[start + length]
+        del self._by_size[bisect_left(self._by_size, (length, start))]
+        return length
+
+    def release(self, start: int, length: int): #vers 1
+        """Return an extent to the free space, merging it with adjacent holes"""
+        if length <= 0:
+            return
+        if start + length in self._holes:
+            length += self._remove_hole(start + length)
+        if start in self._hole_ends:
+            before = self._hole_ends[start]
+            length += self._remove_hole(before)
+            start = before
+        self._add_hole(start, length)
+        self.end = max(self.end, start + length)
+
+    def add_reclaimable(self, length: int): #vers 1
+        """Count sectors that become free once the directory on disk stops using them"""
+        self.reclaimable += max(0, length)
+
+    def find_best_fit(self, length: int) -> Optional[int]: #vers 1
+        """Start of the smallest hole holding length sectors, None if none fits"""
+        if length <= 0:
+            return None
+        i = bisect_left(self._by_size, (length, -1))
+        if i == len(self._by_size):
+            return None
+        return self._by_size[i][1]
+
+    def allocate(self, length: int) -> Optional[int]: #vers 1
+        """Take length sectors from the best-fitting hole - None means append at end"""
+        start = self.find_best_fit(length)
+        if start is None:
+            return None
+        hole = self._remove_hole(start)
+        if hole > length:
+            self._add_hole(start + length, hole - length)
+        return start
+
+    def reserve_below(self, floor: int): #vers 1
+        """Drop free space under floor (directory growth) - holes crossing it are trimmed"""
+        if floor <= self.floor:
+            return
+        self.floor = floor
+        for start in [s for s in self._holes if s < floor]:
+            length = self._remove_hole(start)
+            if start + length > floor:
+                self._add_hole(floor, start + length - floor)
+        self.end = max(self.end, floor)
+
+    def holes(self) -> List[Tuple[int, int]]: #vers 1
+        """Free (start, length) extents sorted by start"""
+        return sorted(self._holes.items())
+
+    @property
+    def free_sectors(self) -> int: #vers 1
+        return sum(self._holes.values())
+
+    @property
+    def hole_count(self) -> int: #vers 1
+        return len(self._holes)
+
+    @property
+    def largest_hole(self) -> int: #vers 1
+        return self._by_size[-1][0] if self._by_size else 0
+
+    def fragmentation(self) -> float: #vers 1
+        """Percent of free space outside the largest hole (0 = one contiguous hole)"""
+        free = self.free_sectors
+        if not free:
+            return 0.0
+        return (1.0 - self.largest_hole / free) * 100.0
+
+    def get_stats(self) -> Dict[str, Any]: #vers 1
+        """Free space summary in bytes for status display"""
+        free = self.free_sectors
+        data = max(0, self.end - self.floor)
+        return {
+            'free_bytes': free * SECTOR_SIZE,
+            'reclaimable_bytes': self.reclaimable * SECTOR_SIZE,
+            'hole_count': self.hole_count,
+            'largest_hole_bytes': self.largest_hole * SECTOR_SIZE,
+            'fragmentation': self.fragmentation(),
+            'dead_space_percent': (free + self.reclaimable) * 100.0 / data if data else 0.0
+        }
+
+
+__all__ = [
+    'IMGFreeSpaceMap',
+    'SECTOR_SIZE',
+    'sectors_for'
+]
@@ -0,0 +1,96 @@
+#this belongs in methods/img_hash_cache.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - IMG Entry Hash Cache
+
+"""
+IMG Hash Cache - Entry content hashes kept in a sidecar next to the archive
+(gta3.img -> gta3.hashes, like the .pin file). Hashes are keyed by entry offset
+and size and the whole cache is tied to the archive's mtime and size, so any
+write to the archive drops it and an unchanged archive rescans without reading.
+"""
+
+import os
+import json
+from typing import Dict, Optional, Tuple
+
+##Classes -
+# IMGHashCache
+
+HASH_CACHE_FORMAT = 1
+HASH_CACHE_EXTENSION = ".hashes"
+
+
+class IMGHashCache:
+    """Sidecar hash cache for one archive data file"""
+
+    def __init__(self, archive_path: str, algorithm: str): #vers 1
+        self.archive_path = archive_path
+        self.algorithm = algorithm
+        self.cache_path = os.path.splitext(archive_path)[0] + HASH_CACHE_EXTENSION
+        self._stamp = self._archive_stamp()
+        self._hashes: Dict[str, str] = {}
+        self._dirty = False
+
+    def _archive_stamp(self) -> Optional[Tuple[int, int]]: #vers 1
+        """(mtime_ns, size) of the archive, None if it can't be read"""
+        try:
+            stat = os.stat(self.archive_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def load(self) -> int: #vers 1
+        """Read the sidecar - returns cached hash count (0 when missing or stale)"""
+        self._hashes = {}
+        self._dirty = False
+        if self._stamp is None or not os.path.exists(self.cache_path):
+            return 0
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data.get('format') == HASH_CACHE_FORMAT and data.get('algorithm') == self.algorithm
+                    and data.get('mtime_ns') == self._stamp[0] and data.get('size') == self._stamp[1]):
+                self._hashes = dict(data.get('hashes', {}))
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"[WARNING] Ignoring hash cache {self.cache_path}: {e}")
+        return len(self._hashes)
+
+    def get(self, offset: int, size: int, kind: str) -> Optional[str]: #vers 1
+        """Cached hash of an entry - kind is 'prefix' or 'full'"""
+        return self._hashes.get(f"{kind}:{offset}:{size}")
+
+    def put(self, offset: int, size: int, kind: str, digest: str): #vers 1
+        key = f"{kind}:{offset}:{size}"
+        if self._hashes.get(key) != digest:
+            self._hashes[key] = digest
+            self._dirty = True
+
+    def save(self) -> bool: #vers 1
+        """Write the sidecar if anything was added and the archive did not change meanwhile"""
+        if not self._dirty or self._stamp is None or self._archive_stamp() != self._stamp:
+            return False
+        temp_path = self.cache_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'format': HASH_CACHE_FORMAT,
+                    'algorithm': self.algorithm,
+                    'mtime_ns': self._stamp[0],
+                    'size': self._stamp[1],
+                    'hashes': self._hashes
+                }, f, separators=(',', ':'))
+            os.replace(temp_path, self.cache_path)
+            self._dirty = False
+            return True
+        except OSError as e:
+            print(f"[WARNING] Could not write hash cache {self.cache_path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+
+
+__all__ = [
+    'HASH_CACHE_EXTENSION',
+    'IMGHashCache'
+]
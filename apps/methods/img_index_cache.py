@@ -0,0 +1,188 @@
+#this belongs in methods/img_index_cache.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - IMG Directory Index Cache
+
+"""
+IMG Index Cache - Parsed entry state kept in a binary sidecar next to the archive
+(gta3.img -> gta3.imgidx), or in the user cache folder when the archive folder is
+read only. Holds the platform and, per directory row, extension, file type and
+RW version. It is tied to the size and mtime of the data file (and .dir) and to a
+checksum of the raw directory records, so reopening an unchanged archive skips
+type detection and the RW header sweep. Content hashes stay in the .hashes sidecar.
+"""
+
+import os
+import struct
+import hashlib
+from typing import List, Optional, Tuple, Dict, Any
+
+##Methods list -
+# directory_checksum
+# _user_cache_path
+
+##Classes -
+# IMGIndexCache
+
+INDEX_CACHE_FORMAT = 1
+INDEX_CACHE_EXTENSION = ".imgidx"
+INDEX_MAGIC = b'IMGI'
+
+# magic, format, IMG version, data size, data mtime_ns, dir size, dir mtime_ns,
+# directory checksum, entry count, string table count
+_HEADER = struct.Struct('<4sHHqqqq16sII')
+
+ENTRY_DETECTED = 1     # rw_version came from the entry header
+
+
+def directory_checksum(records: bytes) -> bytes: #vers 1
+    """16-byte checksum of the raw 32-byte directory records"""
+    return hashlib.blake2b(records, digest_size=16).digest()
+
+
+def _user_cache_path(data_path: str) -> str: #vers 1
+    """Index location in the user cache folder (archive folder not writable)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser("~"), ".cache")
+    key = hashlib.blake2b(os.path.abspath(data_path).encode('utf-8'), digest_size=12).hexdigest()
+    name = os.path.splitext(os.path.basename(data_path))[0]
+    return os.path.join(base, "imgfactory", "index", f"{name}-{key}{INDEX_CACHE_EXTENSION}")
+
+
+class IMGIndexCache:
+    """Binary sidecar index for one archive"""
+
+    def __init__(self, data_path: str, dir_path: Optional[str] = None): #vers 1
+        self.data_path = data_path
+        self.dir_path = dir_path
+        self.index_path = os.path.splitext(data_path)[0] + INDEX_CACHE_EXTENSION
+        self.cache_path = _user_cache_path(data_path)
+
+    def _stamp(self) -> Optional[Tuple[int, int, int, int]]: #vers 1
+        """(data size, data mtime_ns, dir size, dir mtime_ns), None if unreadable"""
+        try:
+            data = os.stat(self.data_path)
+            if self.dir_path:
+                directory = os.stat(self.dir_path)
+                return data.st_size, data.st_mtime_ns, directory.st_size, directory.st_mtime_ns
+            return data.st_size, data.st_mtime_ns, 0, 0
+        except OSError:
+            return None
+
+    def load(self, version: int, checksum: bytes, count: int) -> Optional[Dict[str, Any]]: #vers 1
+        """Index matching the archive on disk - platform, extensions, file_types,
+        rw_versions and flags (one per directory row), None when missing or stale"""
+        stamp = self._stamp()
+        if stamp is None:
+            return None
+        for path in (self.index_path, self.cache_path):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                result = self._parse(data, version, checksum, count, stamp)
+                if result is not None:
+                    return result
+            except (OSError, ValueError, struct.error, UnicodeDecodeError) as e:
+                print(f"[WARNING] Ignoring index {path}: {e}")
+        return None
+
+    def _parse(self, data: bytes, version: int, checksum: bytes, count: int,
+               stamp: Tuple[int, int, int, int]) -> Optional[Dict[str, Any]]: #vers 1
+        if len(data) < _HEADER.size:
+            return None
+        (magic, fmt, stored_version, data_size, data_mtime, dir_size, dir_mtime,
+         stored_checksum, stored_count, string_count) = _HEADER.unpack_from(data)
+        if (magic != INDEX_MAGIC or fmt != INDEX_CACHE_FORMAT or stored_version != version
+                or (data_size, data_mtime, dir_size, dir_mtime) != stamp
+                or stored_checksum != checksum or stored_count != count):
+            return None
+
+        # String table: platform first, then the distinct extensions
+        pos = _HEADER.size
+        strings = []
+        for _ in range(string_count):
+            length = data[pos]
+            strings.append(data[pos + 1:pos + 1 + length].decode('ascii'))
+            pos += 1 + length
+
+        rw_versions = struct.unpack_from(f'<{count}I', data, pos)
+        pos += 4 * count
+        ext_ids = struct.unpack_from(f'<{count}H', data, pos)
+        pos += 2 * count
+        file_types = data[pos:pos + count]
+        flags = data[pos + count:pos + 2 * count]
+        if len(flags) != count:
+            return None
+        extensions = strings[1:]
+        return {
+            'platform': strings[0] if strings else "",
+            'extensions': [extensions[i] for i in ext_ids],
+            'file_types': file_types,
+            'rw_versions': rw_versions,
+            'flags': flags
+        }
+
+    def save(self, version: int, checksum: bytes, platform: str, extensions: List[str],
+             file_types: List[int], rw_versions: List[int], flags: List[int]) -> bool: #vers 1
+        """Write the index next to the archive (user cache folder if that fails)"""
+        stamp = self._stamp()
+        if stamp is None:
+            return False
+        count = len(extensions)
+        table: Dict[str, int] = {}
+        ext_ids = [table.setdefault(ext, len(table)) for ext in extensions]
+        strings = [platform] + list(table)
+
+        parts = [_HEADER.pack(INDEX_MAGIC, INDEX_CACHE_FORMAT, version, *stamp,
+                              checksum, count, len(strings))]
+        for text in strings:
+            raw = text.encode('ascii', errors='replace')[:255]
+            parts.append(bytes((len(raw),)) + raw)
+        parts.append(struct.pack(f'<{count}I', *rw_versions))
+        parts.append(struct.pack(f'<{count}H', *ext_ids))
+        parts.append(bytes(file_types))
+        parts.append(bytes(flags))
+        data = b''.join(parts)
+
+        for path in (self.index_path, self.cache_path):
+            if self._write(path, data):
+                # Only one location may hold an index - drop a stale one in the other
+                other = self.cache_path if path == self.index_path else self.index_path
+                if os.path.exists(other):
+                    try:
+                        os.remove(other)
+                    except OSError:
+                        pass
+                return True
+        return False
+
+    def _write(self, path: str, data: bytes) -> bool: #vers 1
+        """Atomic write through a temp file"""
+        temp_path = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+            return True
+        except OSError as e:
+            print(f"[DEBUG] Could not write index {path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+
+    def remove(self): #vers 1
+        """Delete the index from both locations"""
+        for path in (self.index_path, self.cache_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+__all__ = [
+    'INDEX_CACHE_EXTENSION',
+    'IMGIndexCache',
+    'directory_checksum'
+]
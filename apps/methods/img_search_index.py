@@ -0,0 +1,99 @@
+#this belongs in methods/img_search_index.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - IMG Entry Search Index
+
+"""
+IMG Search Index - Entry names of one archive prepared once for the live search:
+names, lowercased names and extensions in archive order. Plain substring queries
+that extend the previous query only re-check the previous matches, so typing
+into the search box filters an ever smaller list instead of rescanning the
+archive. The index is rebuilt when entries are added, removed, reordered or renamed.
+"""
+
+import re
+import weakref
+from typing import List, Optional, Tuple
+
+##Methods list -
+# get_search_index
+
+##Classes -
+# IMGSearchIndex
+
+_indexes: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+class IMGSearchIndex:
+    """Search-ready entry names of one IMG file"""
+
+    def __init__(self, img_file): #vers 1
+        # Weak reference only - the module cache is keyed weakly on img_file
+        self._img_ref = weakref.ref(img_file)
+        self._stamp = self._current_stamp(img_file)
+        self.names = [str(entry.name) for entry in img_file.entries]
+        self.names_lower = [name.lower() for name in self.names]
+        # Same rule as the file type filter: text after the last dot, upper case
+        self.extensions = [name.rsplit('.', 1)[-1].upper() if '.' in name else '' for name in self.names]
+        # Last plain substring search, for narrowing: (case_sensitive, extension), query, rows
+        self._last: Optional[Tuple[Tuple[bool, Optional[str]], str, List[int]]] = None
+
+    @staticmethod
+    def _current_stamp(img_file) -> tuple: #vers 1
+        entries = img_file.entries
+        return (id(entries), getattr(entries, 'mutations', None), len(entries),
+                getattr(img_file, 'name_changes', 0))
+
+    def is_current(self, img_file) -> bool: #vers 1
+        """Still matches img_file's entries (no add/remove/reorder/rename since built)"""
+        return img_file is self._img_ref() and self._stamp == self._current_stamp(img_file)
+
+    def search(self, query: str, case_sensitive: bool = False, whole_word: bool = False,
+               regex: bool = False, extension: Optional[str] = None) -> List[int]: #vers 1
+        """Entry indices (archive order) whose name matches query.
+        extension: upper case extension filter ('' = no extension), None = all."""
+        names = self.names if case_sensitive else self.names_lower
+        if not case_sensitive:
+            query = query.lower()
+
+        if regex or whole_word:
+            self._last = None
+            try:
+                pattern = re.compile(query if regex else r'\b' + re.escape(query) + r'\b')
+            except re.error:
+                return []
+            test = pattern.search
+            rows = range(len(names))
+        else:
+            # Anything containing the new query contained the previous one
+            key = (case_sensitive, extension)
+            last = self._last
+            if last is not None and last[0] == key and last[1] in query:
+                rows = last[2]
+            else:
+                rows = range(len(names))
+            test = None
+
+        if extension is not None:
+            extensions = self.extensions
+            rows = [i for i in rows if extensions[i] == extension]
+
+        if test is None:
+            matches = [i for i in rows if query in names[i]]
+            self._last = ((case_sensitive, extension), query, matches)
+        else:
+            matches = [i for i in rows if test(names[i])]
+        return matches
+
+
+def get_search_index(img_file) -> IMGSearchIndex: #vers 1
+    """Search index of img_file - built on first use, rebuilt after entry changes"""
+    index = _indexes.get(img_file)
+    if index is None or not index.is_current(img_file):
+        index = IMGSearchIndex(img_file)
+        _indexes[img_file] = index
+    return index
+
+
+__all__ = [
+    'IMGSearchIndex',
+    'get_search_index'
+]
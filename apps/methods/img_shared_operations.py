@@ -225,7 +225,14 @@ def get_entry_data_safely(entry, img_file, main_window=None) -> Optional[bytes]:
             except Exception:
                 pass
         
-        # Method 3: Read from IMG file directly
+        # Method 3: Read through the IMG file read session
+        if hasattr(img_file, 'read_entry_data'):
+            try:
+                return img_file.read_entry_data(entry)
+            except Exception:
+                pass
+
+        # Method 4: Read from IMG file directly
         if (hasattr(entry, 'offset') and hasattr(entry, 'size') and 
             hasattr(img_file, 'file_path')):
             try:
@@ -235,7 +242,7 @@ def get_entry_data_safely(entry, img_file, main_window=None) -> Optional[bytes]:
             except Exception:
                 pass
         
-        # Method 4: Try extract_data method
+        # Method 5: Try extract_data method
         if hasattr(entry, 'extract_data'):
             try:
                 return entry.extract_data()
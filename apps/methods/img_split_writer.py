@@ -0,0 +1,233 @@
+#this belongs in methods/img_split_writer.py - Version: 3
+# X-Seti - October16 2026 - IMG Factory 1.5 - Streaming IMG Split Writer
+
+"""
+IMG Split Writer - Writes the groups of a split (IMG v1 pairs, VER2 archives or
+plain folders) in one ordered pass over the source archive. plan_split lays out
+every output first (directory records, sector offsets, part files over the entry
+limit) from entry offsets and sizes alone; write_split then copies each entry's
+sector range from the source fd straight to its destination(s) in source offset
+order (copy_file_range via img_stream_writer). Outputs on one disk share a single
+sequential read; outputs on different disks are written concurrently, one worker
+per disk, all walking the source in the same order. Archives are written to temp
+files and renamed into place when complete. Qt-free - used by SplitThread.
+"""
+
+import os
+import time
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from apps.methods.img_stream_writer import (
+    align_to_sector, copy_file_range_all, copy_within_padding, pack_directory_record,
+    plan_sequential_layout, preallocate, temp_path_for, write_at)
+
+##Methods list -
+# plan_split
+# write_split
+
+##Classes -
+# SplitTarget
+
+SPLIT_FOLDER = 'folder'
+SPLIT_IMG_V1 = 'img_v1'
+SPLIT_IMG_V2 = 'img_v2'
+
+MAX_ENTRIES_V1 = 32652
+MAX_ENTRIES_V2 = 130608          # 4x version 1
+PROGRESS_INTERVAL = 0.1          # Seconds between progress callbacks
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+class SplitTarget:
+    """One output of a split - a folder of files or one IMG archive (v1 pair or VER2)"""
+
+    def __init__(self, name: str, kind: str, path: str, entries: List[Any]): #vers 1
+        self.name = name
+        self.kind = kind
+        self.path = path                  # Folder, or the .img
+        self.entries = entries
+        self.dir_path: Optional[str] = None
+        self.header = b''
+        self.records = b''
+        self.layout: List[tuple] = []
+        self.total_size = 0
+
+        if kind == SPLIT_FOLDER:
+            return
+        if kind == SPLIT_IMG_V1:
+            self.dir_path = path[:-4] + '.dir'
+            self.layout = plan_sequential_layout(entries, 0)
+        else:
+            self.header = b'VER2' + struct.pack('<I', len(entries))
+            self.layout = plan_sequential_layout(entries, align_to_sector(8 + len(entries) * 32))
+        self.records = b''.join(pack_directory_record(offset, size, entry.name)
+                                for entry, (offset, size) in zip(entries, self.layout))
+        self.total_size = max((offset + align_to_sector(size) for offset, size in self.layout), default=0)
+        if kind == SPLIT_IMG_V2:
+            self.total_size = max(self.total_size, align_to_sector(len(self.header) + len(self.records)))
+
+    def output_folder(self) -> str: #vers 1
+        return self.path if self.kind == SPLIT_FOLDER else os.path.dirname(self.path)
+
+
+def plan_split(groups: Dict[str, List[Any]], output_dir: str, kind: str,
+               max_entries: Optional[int] = None) -> List[SplitTarget]: #vers 1
+    """Targets for each group: output_dir/<group>/ for folders, output_dir/<group>.img
+    otherwise - groups over the version's entry limit become <group>_partNN.img"""
+    targets = []
+    if kind == SPLIT_FOLDER:
+        for group_name, entries in groups.items():
+            targets.append(SplitTarget(group_name, kind, os.path.join(output_dir, group_name), entries))
+        return targets
+
+    limit = max_entries or (MAX_ENTRIES_V1 if kind == SPLIT_IMG_V1 else MAX_ENTRIES_V2)
+    for group_name, entries in groups.items():
+        chunks = [entries[i:i + limit] for i in range(0, len(entries), limit)] or [[]]
+        for part, chunk in enumerate(chunks, 1):
+            name = f"{group_name}_part{part:02d}" if len(chunks) > 1 else group_name
+            targets.append(SplitTarget(name, kind, os.path.join(output_dir, f"{name}.img"), chunk))
+    return targets
+
+
+def _device_of(path: str) -> int: #vers 1
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return -1
+
+
+def write_split(img_file, targets: List[SplitTarget],
+                progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]: #vers 3
+    """Write all targets from img_file in one ordered pass per output disk.
+    progress_callback(done, total, target name) - called from the calling thread.
+    Returns stats: targets, entries, bytes, disks, cancelled. Nothing is renamed
+    into place when cancelled or on error. A source ending inside an entry's last
+    sector (unpadded last entry) leaves that padding zeroed; raises OSError when
+    more is missing (a folder file cut short is removed)."""
+    stats: Dict[str, Any] = {'targets': len(targets), 'entries': 0, 'bytes': 0,
+                             'disks': 0, 'cancelled': False}
+    fds: Dict[int, int] = {}
+    src_fd = os.open(img_file.get_data_path(), os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        # Destinations created up front - folders once, archives preallocated with their directory
+        for t, target in enumerate(targets):
+            os.makedirs(target.output_folder(), exist_ok=True)
+            if target.kind == SPLIT_FOLDER:
+                continue
+            fd = os.open(temp_path_for(target.path), os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            fds[t] = fd
+            preallocate(fd, target.total_size)
+            if target.kind == SPLIT_IMG_V2:
+                write_at(fd, target.header + target.records, 0)
+
+        # Every copy, per output disk, in source offset order
+        by_disk: Dict[int, List[tuple]] = {}
+        for t, target in enumerate(targets):
+            disk = by_disk.setdefault(_device_of(target.output_folder()), [])
+            written = set()
+            for i, entry in enumerate(target.entries):
+                if target.kind != SPLIT_FOLDER:
+                    offset, size = target.layout[i]
+                    # Shared ranges are written once
+                    if not size or offset in written:
+                        continue
+                    written.add(offset)
+                disk.append((entry.offset, t, i))
+        for copies in by_disk.values():
+            copies.sort()
+        stats['disks'] = len(by_disk)
+        total = sum(len(copies) for copies in by_disk.values())
+
+        progress = {'done': 0, 'bytes': 0, 'last': ''}
+        lock = threading.Lock()
+
+        def work(copies):
+            for _, t, i in copies:
+                if cancelled is not None and cancelled():
+                    return
+                target = targets[t]
+                entry = target.entries[i]
+                pending = getattr(entry, '_cached_data', None)
+                if target.kind == SPLIT_FOLDER:
+                    out_path = os.path.join(target.path, entry.name)
+                    fd = os.open(out_path, _WRITE_FLAGS, 0o666)
+                    copied = size = entry.size
+                    try:
+                        if pending is not None:
+                            write_at(fd, pending, 0)
+                        elif size:
+                            copied = copy_file_range_all(src_fd, fd, entry.offset, 0, size)
+                            if copied < size and copy_within_padding(copied, size):
+                                os.ftruncate(fd, size)
+                    finally:
+                        os.close(fd)
+                    if not copy_within_padding(copied, size):
+                        os.remove(out_path)
+                else:
+                    offset, size = target.layout[i]
+                    copied = size
+                    if pending is not None:
+                        write_at(fds[t], pending, offset)
+                    else:
+                        copied = copy_file_range_all(src_fd, fds[t], entry.offset, offset, size)
+                if not copy_within_padding(copied, size):
+                    raise OSError(f"{entry.name}: copied {copied} of {size} bytes - source ends early")
+                with lock:
+                    progress['done'] += 1
+                    progress['bytes'] += size
+                    progress['last'] = target.name
+
+        with ThreadPoolExecutor(max_workers=max(1, len(by_disk))) as pool:
+            pending_work = {pool.submit(work, copies) for copies in by_disk.values()}
+            while pending_work:
+                finished, pending_work = wait(pending_work, timeout=PROGRESS_INTERVAL)
+                for future in finished:
+                    future.result()
+                if progress_callback:
+                    progress_callback(progress['done'], total, progress['last'])
+
+        stats['entries'] = progress['done']
+        stats['bytes'] = progress['bytes']
+        if cancelled is not None and cancelled() and progress['done'] < total:
+            stats['cancelled'] = True
+            return stats
+
+        # Complete - finish the archives and move them into place
+        for t, fd in list(fds.items()):
+            target = targets[t]
+            os.ftruncate(fd, target.total_size)
+            os.fsync(fd)
+            os.close(fd)
+            del fds[t]
+            if target.dir_path is not None:
+                with open(temp_path_for(target.dir_path), 'wb') as f:
+                    f.write(target.records)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path_for(target.dir_path), target.dir_path)
+            os.replace(temp_path_for(target.path), target.path)
+        return stats
+
+    finally:
+        os.close(src_fd)
+        # Anything still open did not complete - drop its temp files
+        for t, fd in fds.items():
+            os.close(fd)
+            for path in (targets[t].path, targets[t].dir_path):
+                if path and os.path.exists(temp_path_for(path)):
+                    os.remove(temp_path_for(path))
+
+
+__all__ = [
+    'SPLIT_FOLDER',
+    'SPLIT_IMG_V1',
+    'SPLIT_IMG_V2',
+    'SplitTarget',
+    'plan_split',
+    'write_split'
+]
@@ -0,0 +1,286 @@
+#this belongs in methods/img_stream_writer.py - Version: 7
+# X-Seti - October16 2026 - IMG Factory 1.5 - IMG Stream Writer
+
+"""
+IMG Stream Writer - Bounded-memory IMG archive writing.
+Entry data is copied sector range by sector range from the source archive
+straight into a temp file (os.copy_file_range / sendfile where available, otherwise
+positional reads/writes in bounded chunks), padding is left as zeroed/sparse
+space, and the temp file is atomically renamed over the target. Peak memory does not depend
+on archive size. Entries may share one sector range (same source range, or same
+content for a deduplicated rebuild) - shared data is written once.
+"""
+
+import os
+import sys
+import struct
+from typing import Optional, Callable, List, Tuple, Any
+
+##Methods list -
+# align_to_sector
+# copy_file_range_all
+# copy_within_padding
+# move_range
+# pack_directory_record
+# plan_sequential_layout
+# preallocate
+# shared_layout_savings
+# temp_path_for
+# write_archive
+# write_at
+
+SECTOR_SIZE = 2048
+COPY_CHUNK = 8 * 1024 * 1024   # 8 MB per copy call / buffer
+
+
+def align_to_sector(size: int) -> int: #vers 1
+    """Round a byte count up to the next 2048-byte sector boundary"""
+    return ((size + SECTOR_SIZE - 1) // SECTOR_SIZE) * SECTOR_SIZE
+
+
+def copy_within_padding(copied: int, length: int) -> bool: #vers 1
+    """True when a copy of length bytes stopped no earlier than the last sector of
+    the range - directory sizes are whole sectors and the last entry of an archive
+    may end unpadded at EOF, the missing tail is zero padding"""
+    return copied >= length or align_to_sector(copied) >= length
+
+
+def temp_path_for(target_path: str) -> str: #vers 1
+    """Temp file next to the target (same filesystem, so the final rename is atomic)"""
+    return f"{target_path}.rebuild.tmp"
+
+
+def pack_directory_record(offset: int, size: int, name: str) -> bytes: #vers 1
+    """Pack one 32-byte directory record: offset/size in sectors, 24-byte name"""
+    name_bytes = name.encode('ascii', errors='replace')[:24].ljust(24, b'\x00')
+    return struct.pack('<II', offset // SECTOR_SIZE, (size + SECTOR_SIZE - 1) // SECTOR_SIZE) + name_bytes
+
+
+def preallocate(fd: int, length: int): #vers 1
+    """Reserve space for the output up front - reads back as zeroes, less fragmentation"""
+    if length <= 0:
+        return
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, length)
+            return
+        except OSError:
+            pass  # Filesystem without fallocate support - sparse file below
+    os.ftruncate(fd, length)
+
+
+def write_at(fd: int, data, offset: int): #vers 1
+    """Write all of data at offset (handles short writes)"""
+    view = memoryview(data)
+    while view:
+        if hasattr(os, 'pwrite'):
+            written = os.pwrite(fd, view, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            written = os.write(fd, view)
+        view = view[written:]
+        offset += written
+
+
+def copy_file_range_all(src_fd: int, dst_fd: int, src_offset: int, dst_offset: int, length: int) -> int: #vers 2
+    """Copy length bytes between file descriptors at explicit offsets.
+    Uses os.copy_file_range (in-kernel, no userspace copy) when available,
+    then os.sendfile between two different files on Linux (copy_file_range
+    refuses some cross-filesystem copies), otherwise positional reads/writes
+    of at most COPY_CHUNK bytes at a time.
+    Returns bytes copied - less than length only if the source ends early."""
+    copied = 0
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while copied < length:
+                count = os.copy_file_range(src_fd, dst_fd, min(COPY_CHUNK, length - copied),
+                                           src_offset + copied, dst_offset + copied)
+                if count == 0:
+                    return copied
+                copied += count
+            return copied
+        except OSError:
+            pass  # Cross-device or unsupported filesystem - sendfile / chunked copy below
+
+    # sendfile writes at the destination's file position; only for a separate file
+    if src_fd != dst_fd and hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+        try:
+            os.lseek(dst_fd, dst_offset + copied, os.SEEK_SET)
+            while copied < length:
+                count = os.sendfile(dst_fd, src_fd, src_offset + copied, min(COPY_CHUNK, length - copied))
+                if count == 0:
+                    return copied
+                copied += count
+            return copied
+        except OSError:
+            pass
+
+    while copied < length:
+        chunk = min(COPY_CHUNK, length - copied)
+        if hasattr(os, 'pread'):
+            data = os.pread(src_fd, chunk, src_offset + copied)
+        else:
+            os.lseek(src_fd, src_offset + copied, os.SEEK_SET)
+            data = os.read(src_fd, chunk)
+        if not data:
+            break
+        write_at(dst_fd, data, dst_offset + copied)
+        copied += len(data)
+    return copied
+
+
+def move_range(fd: int, src_offset: int, dst_offset: int, length: int) -> int: #vers 1
+    """Move length bytes down inside one file (dst_offset < src_offset).
+    When the ranges overlap, each copy is capped at the distance moved so no
+    call reads bytes an earlier call of this move has already overwritten."""
+    if dst_offset >= src_offset:
+        raise ValueError("move_range only moves data towards the start of the file")
+    step = min(COPY_CHUNK, src_offset - dst_offset)
+    moved = 0
+    while moved < length:
+        count = copy_file_range_all(fd, fd, src_offset + moved, dst_offset + moved,
+                                    min(step, length - moved))
+        if count == 0:
+            break
+        moved += count
+    return moved
+
+
+def plan_sequential_layout(entries: List[Any], data_start: int,
+                           share_keys: Optional[List[Any]] = None) -> List[Tuple[int, int]]: #vers 2
+    """New (offset, size) for each entry packed back to back from data_start.
+    Stored entries that already share a source range keep sharing one new range;
+    share_keys (one per entry, None = own range) adds more sharing, e.g. by content hash."""
+    layout = []
+    placed = {}
+    offset = data_start
+    for i, entry in enumerate(entries):
+        cached = getattr(entry, '_cached_data', None)
+        size = len(cached) if cached is not None else entry.size
+        key = share_keys[i] if share_keys is not None else None
+        if key is None and cached is None and size:
+            key = ('range', entry.offset, size)
+        if key is not None:
+            shared = placed.get(key)
+            if shared is not None and shared[1] == size:
+                layout.append(shared)
+                continue
+        layout.append((offset, size))
+        if key is not None:
+            placed[key] = (offset, size)
+        offset += align_to_sector(size)
+    return layout
+
+
+def shared_layout_savings(layout: List[Tuple[int, int]]) -> Tuple[int, int]: #vers 1
+    """(entries pointing at an already used range, bytes not written because of it)"""
+    seen = set()
+    shared = 0
+    saved = 0
+    for offset, size in layout:
+        if not size:
+            continue
+        if offset in seen:
+            shared += 1
+            saved += align_to_sector(size)
+        seen.add(offset)
+    return shared, saved
+
+
+def write_archive(img_path: str, dir_path: Optional[str], header: bytes, records: bytes,
+                  entries: List[Any], layout: List[Tuple[int, int]], source_path: Optional[str],
+                  progress_callback: Optional[Callable[[int, str], None]] = None,
+                  entry_sources: Optional[List[str]] = None) -> str: #vers 5
+    """Stream an archive into a temp file and return its path (caller renames it).
+    header + records go at offset 0 of the .img (VER2) or into dir_path's temp (VER1).
+    Entries with _cached_data are written from memory, all others are copied
+    from source_path at their current offset/size - or from entry_sources[i]
+    (one data file path per entry, e.g. merging several archives). A range
+    shared by several entries is written for the first of them only.
+    A source that ends inside an entry's last sector leaves that padding zeroed.
+    Raises OSError when a source can't be opened or ends before an entry's data."""
+    img_temp = temp_path_for(img_path)
+    total_size = max((offset + align_to_sector(size) for offset, size in layout), default=0)
+    if dir_path is None:
+        total_size = max(total_size, align_to_sector(len(header) + len(records)))
+
+    # Source fds opened on first use, one per data file
+    src_fds = {}
+
+    def source_fd(path):
+        if path not in src_fds:
+            if not path:
+                raise OSError("No source archive for entry data")
+            src_fds[path] = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        return src_fds[path]
+
+    dst_fd = os.open(img_temp, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        preallocate(dst_fd, total_size)
+        if dir_path is None:
+            write_at(dst_fd, header + records, 0)
+
+        total = len(entries)
+        step = max(1, total // 100)
+        written = set()
+        for i, (entry, (offset, size)) in enumerate(zip(entries, layout)):
+            cached = getattr(entry, '_cached_data', None)
+            if size and offset in written:
+                pass
+            elif cached is not None:
+                write_at(dst_fd, cached, offset)
+            elif size:
+                src_fd = source_fd(entry_sources[i] if entry_sources is not None else source_path)
+                copied = copy_file_range_all(src_fd, dst_fd, entry.offset, offset, size)
+                if not copy_within_padding(copied, size):
+                    raise OSError(f"{entry.name}: copied {copied} of {size} bytes - source ends early")
+            if size:
+                written.add(offset)
+            if progress_callback and (i % step == 0 or i == total - 1):
+                progress_callback(int((i + 1) * 100 / total), f"Writing entry {i + 1}/{total}")
+
+        # Padding after the last entry stays zero (preallocated or sparse)
+        os.ftruncate(dst_fd, total_size)
+        os.fsync(dst_fd)
+    except Exception:
+        os.close(dst_fd)
+        dst_fd = None
+        if os.path.exists(img_temp):
+            os.remove(img_temp)
+        raise
+    finally:
+        if dst_fd is not None:
+            os.close(dst_fd)
+        for src_fd in src_fds.values():
+            if src_fd is not None:
+                os.close(src_fd)
+
+    if dir_path is not None:
+        dir_temp = temp_path_for(dir_path)
+        try:
+            with open(dir_temp, 'wb') as f:
+                f.write(header + records)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception:
+            os.remove(img_temp)
+            if os.path.exists(dir_temp):
+                os.remove(dir_temp)
+            raise
+    return img_temp
+
+
+__all__ = [
+    'SECTOR_SIZE',
+    'align_to_sector',
+    'copy_file_range_all',
+    'copy_within_padding',
+    'move_range',
+    'pack_directory_record',
+    'plan_sequential_layout',
+    'preallocate',
+    'shared_layout_savings',
+    'temp_path_for',
+    'write_archive',
+    'write_at'
+]
@@ -0,0 +1,35 @@
+#this belongs in methods/library_output.py - Version: 1
+# X-Seti - October16 2026 - IMG Factory 1.5 - Library Output Redirect
+
+"""
+Library Output - Hides the [DEBUG] prints of the format classes for headless
+tools (command line, benchmark). Verbose runs keep them, optionally sent to
+another stream; quiet runs write them to os.devnull, which is closed on exit.
+"""
+
+import os
+import contextlib
+from typing import Optional, TextIO
+
+##Methods list -
+# library_output
+
+
+@contextlib.contextmanager
+def library_output(verbose: bool, verbose_stream: Optional[TextIO] = None): #vers 1
+    """Drop library prints unless verbose - verbose_stream (e.g. sys.stderr) receives them
+    when given, otherwise they stay on stdout"""
+    if verbose:
+        if verbose_stream is None:
+            yield
+        else:
+            with contextlib.redirect_stdout(verbose_stream):
+                yield
+        return
+    with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+        yield
+
+
+__all__ = [
+    'library_output'
+]
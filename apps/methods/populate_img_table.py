@@ -1,4 +1,4 @@
-#this belongs in methods/populate_img_table.py - Version: 10
+#this belongs in methods/populate_img_table.py - Version: 12
 # X-Seti - November18 2025 - IMG Factory 1.5
 """
 IMG Table Population
@@ -8,6 +8,7 @@ from typing import Any, List, Optional
 from PyQt6.QtWidgets import QTableWidgetItem, QTableWidget, QHeaderView
 from PyQt6.QtCore import Qt
 from apps.debug.debug_functions import img_debugger
+from apps.methods.img_core_classes import format_file_size
 try:
     from apps.utils.img_debug_logger import img_debugger
 except ImportError:
@@ -88,8 +89,9 @@ class IMGTablePopulator:
     def __init__(self, main_window):
         self.main_window = main_window
 
-    def populate_table_with_img_data(self, img_file: Any) -> bool: #vers 9
-        """Populate table with IMG entry data - MINIMAL VERSION to prevent freezing"""
+    def populate_table_with_img_data(self, img_file: Any) -> bool: #vers 10
+        """Populate table with IMG entry data - MINIMAL VERSION to prevent freezing.
+        Virtual tables (gui/img_entry_table.py) get the entry list as is and format on paint."""
         try:
             if not img_file or not hasattr(img_file, 'entries'):
                 img_debugger.error("Invalid IMG file for table population")
@@ -116,6 +118,10 @@ class IMGTablePopulator:
             for col in range(8):
                 header.setSectionResizeMode(col, QHeaderView.ResizeMode.Stretch)
             entries = img_file.entries
+            if hasattr(table, 'set_img_entries'):
+                rows = table.set_img_entries(entries or [])
+                img_debugger.info(f"Table showing {rows} entries")
+                return True
             if not entries:
                 img_debugger.info("No entries found in IMG file")
                 return True
@@ -264,13 +270,17 @@ class IMGTablePopulator:
         except Exception:
             return "Unknown"
 
-    def get_compression_info(self, entry: Any) -> str: #vers 2
-        """Get compression info only"""
+    def get_compression_info(self, entry: Any) -> str: #vers 3
+        """Get compression info only - algorithm and decompressed size"""
         try:
-            if hasattr(entry, 'compression_type') and entry.compression_type:
-                if str(entry.compression_type).upper() != 'NONE':
-                    return str(entry.compression_type)
-            return "None"
+            compression = getattr(entry, 'compression_type', None)
+            name = getattr(compression, 'value', str(compression or 'none'))
+            if name.lower() in ('none', 'unknown'):
+                return "None"
+            unpacked = getattr(entry, 'uncompressed_size', 0)
+            if unpacked:
+                return f"{name.upper()} ({format_file_size(unpacked)})"
+            return name.upper()
         except Exception:
             return "None"
 
@@ -0,0 +1,174 @@
+#this belongs in methods/rw_version_scan.py - Version: 3
+# X-Seti - October16 2026 - IMG Factory 1.5 - Background RW Version Scan
+
+"""
+Background RW Version Scan - Fills the RW Version / RW Address columns after an
+IMG is shown. The archive opens with defer_rw_probe set, the table is usable at
+once, and RWVersionScanThread walks the DFF/TXD headers in offset order
+(IMGFile.iter_rw_header_batches), repainting the RW columns as batches land.
+The scan belongs to the tab it was started for and is cancelled when it closes.
+IMGFile stops it (img_file.rw_scan) before every write and restarts it afterwards,
+so headers are never read at offsets that are being moved.
+"""
+
+import time
+from typing import Optional, Set
+
+from PyQt6.QtCore import pyqtSignal, QThread
+
+##Methods list -
+# cancel_all_rw_version_scans
+# cancel_rw_version_scan
+# start_rw_version_scan
+# _on_scan_batch
+# _on_scan_finished
+
+##Classes -
+# RWVersionScanThread
+
+RW_SCAN_BATCH = 1024            # Entries read between cancel checks
+RW_SCAN_UPDATE_INTERVAL = 0.1   # Seconds between table refreshes
+
+_active_scans: Set['RWVersionScanThread'] = set()
+
+
+class RWVersionScanThread(QThread):
+    """Background RW header scan for one IMG file"""
+
+    batch_scanned = pyqtSignal(int, int, int)   # done, total, detected so far
+    scan_finished = pyqtSignal(int, bool)       # detected, cancelled
+
+    def __init__(self, img_file, batch_size: int = RW_SCAN_BATCH, main_window=None, tab_widget=None): #vers 2
+        super().__init__()
+        self.img_file = img_file
+        self.batch_size = batch_size
+        self.main_window = main_window
+        self.tab_widget = tab_widget
+        self._stop_requested = False
+        # Stopped for an archive write - the tab keeps it until restart() replaces it
+        self.paused = False
+        # Archive size/mtime when the scan started - the index is only written if unchanged
+        self.archive_stamp = img_file.archive_stamp()
+
+    def cancel(self): #vers 1
+        """Stop after the current batch"""
+        self._stop_requested = True
+
+    def stop(self): #vers 1
+        """Cancel and wait until no more headers are read (called before an archive write)"""
+        self.paused = True
+        self.cancel()
+        self.wait()
+
+    def restart(self): #vers 1
+        """Scan again after a write, unless the tab was closed in the meantime"""
+        if self.tab_widget is not None and getattr(self.tab_widget, 'rw_scan_thread', None) is not self:
+            return None
+        return start_rw_version_scan(self.main_window, self.img_file, self.tab_widget)
+
+    def is_cancelled(self) -> bool: #vers 1
+        return self._stop_requested
+
+    def run(self): #vers 1
+        detected = 0
+        last_update = 0.0
+        try:
+            for done, total, found in self.img_file.iter_rw_header_batches(
+                    batch_size=self.batch_size, cancelled=self.is_cancelled):
+                detected += len(found)
+                now = time.monotonic()
+                if done == total or now - last_update >= RW_SCAN_UPDATE_INTERVAL:
+                    last_update = now
+                    self.batch_scanned.emit(done, total, detected)
+        except Exception as e:
+            print(f"[ERROR] RW version scan failed: {e}")
+        self.scan_finished.emit(detected, self._stop_requested)
+
+
+def _on_scan_batch(main_window, img_file, done: int, total: int): #vers 1
+    """Repaint the RW columns when the table is showing this file"""
+    if getattr(main_window, 'current_img', None) is not img_file:
+        return
+    table = getattr(getattr(main_window, 'gui_layout', None), 'table', None)
+    if table is not None and hasattr(table, 'entry_model'):
+        table.entry_model.refresh_rw_columns()
+
+
+def _on_scan_finished(main_window, img_file, tab_widget, thread, detected: int, cancelled: bool): #vers 3
+    _active_scans.discard(thread)
+    if (tab_widget is not None and getattr(tab_widget, 'rw_scan_thread', None) is thread
+            and not thread.paused):
+        tab_widget.rw_scan_thread = None
+    if getattr(img_file, 'rw_scan', None) is thread:
+        img_file.rw_scan = None
+    if cancelled:
+        return
+    _on_scan_batch(main_window, img_file, 0, 0)
+    if hasattr(main_window, 'log_message'):
+        main_window.log_message(f"RW versions: {detected} detected")
+    img_file._trigger_unknown_rw_detection()
+    # Next open of the unchanged archive skips parsing and this scan - not when the
+    # archive was written while the scan ran (the versions may not match its new stamp)
+    if img_file.archive_stamp() != thread.archive_stamp:
+        print("[DEBUG] Archive changed during the RW scan - entry index not written")
+        return
+    if hasattr(img_file, 'save_index') and (detected or not getattr(img_file, 'index_loaded', False)):
+        img_file.save_index()
+
+
+def start_rw_version_scan(main_window, img_file, tab_widget=None) -> Optional[RWVersionScanThread]: #vers 2
+    """Scan img_file's DFF/TXD headers in the background, tied to tab_widget"""
+    try:
+        if not img_file or not getattr(img_file, 'entries', None):
+            return None
+        if tab_widget is not None:
+            cancel_rw_version_scan(tab_widget)
+
+        thread = RWVersionScanThread(img_file, main_window=main_window, tab_widget=tab_widget)
+        thread.batch_scanned.connect(
+            lambda done, total, detected: _on_scan_batch(main_window, img_file, done, total))
+        thread.scan_finished.connect(
+            lambda detected, cancelled: _on_scan_finished(main_window, img_file, tab_widget, thread, detected, cancelled))
+        if tab_widget is not None:
+            tab_widget.rw_scan_thread = thread
+        img_file.rw_scan = thread
+        _active_scans.add(thread)
+        thread.start(QThread.Priority.LowPriority)
+        return thread
+
+    except Exception as e:
+        print(f"[ERROR] Could not start RW version scan: {e}")
+        return None
+
+
+def cancel_rw_version_scan(tab_widget, wait_ms: int = 2000) -> bool: #vers 2
+    """Cancel the tab's scan and wait for its thread - True if one was running"""
+    thread = getattr(tab_widget, 'rw_scan_thread', None)
+    if thread is None:
+        return False
+    tab_widget.rw_scan_thread = None
+    if thread.img_file.rw_scan is thread:
+        thread.img_file.rw_scan = None
+    _active_scans.discard(thread)
+    if not thread.isRunning():
+        return False
+    thread.cancel()
+    thread.wait(wait_ms)
+    return True
+
+
+def cancel_all_rw_version_scans(wait_ms: int = 2000): #vers 1
+    """Cancel every running scan (application close)"""
+    for thread in list(_active_scans):
+        thread.cancel()
+    for thread in list(_active_scans):
+        thread.wait(wait_ms)
+    _active_scans.clear()
+
+
+__all__ = [
+    'RWVersionScanThread',
+    'cancel_all_rw_version_scans',
+    'cancel_rw_version_scan',
+    'start_rw_version_scan'
+]
@@ -1,4 +1,4 @@
-#this belongs in methods/tab_system.py - Version: 6
+#this belongs in methods/tab_system.py - Version: 8
 # X-Seti - November15 2025 - IMG Factory 1.5 - Complete Tab System
 
 """
@@ -10,7 +10,7 @@ FIXED: validate_tab_before_operation now checks tab widget data directly
 FIXED: get_current_file_from_active_tab gets data from tab widget, not current_img
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QMessageBox
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableView, QMessageBox
 from PyQt6.QtCore import Qt
 from typing import Optional, Tuple, Any, Dict, List
 
@@ -57,7 +57,7 @@ def _show_tab_context_menu(main_window, position, tab_widget): #vers 1
             main_window.log_message(f"Context menu error: {str(e)}")
 
 
-def create_tab(main_window, file_path=None, file_type=None, file_object=None): #vers 5
+def create_tab(main_window, file_path=None, file_type=None, file_object=None): #vers 6
     """
     Create NEW tab - ALWAYS creates a new tab, never overwrites existing tabs
     Stores ALL data on tab widget itself
@@ -81,7 +81,7 @@ def create_tab(main_window, file_path=None, file_type=None, file_object=None): #
         main_window.gui_layout.create_main_ui_with_splitters(tab_layout)
 
         # Get the NEW table widget created for THIS tab
-        tables = tab_widget.findChildren(QTableWidget)
+        tables = tab_widget.findChildren(QTableView)
         if tables:
             tab_widget.table_ref = tables[-1]
             # Enable mouse tracking for hover effects
@@ -226,13 +226,13 @@ def get_tab_data(tab_widget) -> Tuple[Optional[Any], str, Optional[Any]]: #vers
         return None, 'NONE', None
 
 
-def get_tab_table(tab_widget) -> Optional[QTableWidget]: #vers 1
+def get_tab_table(tab_widget) -> Optional[QTableView]: #vers 2
     """Get table widget from tab"""
     try:
         if hasattr(tab_widget, 'table_ref'):
             return tab_widget.table_ref
 
-        tables = tab_widget.findChildren(QTableWidget)
+        tables = tab_widget.findChildren(QTableView)
         if tables:
             return tables[0]
 
@@ -549,7 +549,7 @@ def ensure_tab_references_valid(main_window) -> bool: #vers 1
         return False
 
 
-def refresh_current_tab_data(main_window) -> bool: #vers 3
+def refresh_current_tab_data(main_window) -> bool: #vers 4
     """Force refresh of current tab's data and references - Updated to refresh table display"""
     try:
         current_index = main_window.main_tab_widget.currentIndex()
@@ -592,6 +592,9 @@ def refresh_current_tab_data(main_window) -> bool: #vers 3
                 shared_table = main_window.gui_layout.table
                 from apps.methods.populate_img_table import populate_img_table
                 populate_img_table(shared_table, file_object)
+                # Entry count, free space and compression follow the archive
+                if hasattr(main_window, 'refresh_img_status'):
+                    main_window.refresh_img_status()
             elif file_type == 'COL' and file_object:
                 # Refresh COL display if needed
                 from apps.components.Col_Editor.col_workshop import COLWorkshop
@@ -1,4 +1,4 @@
-#this belongs in methods/update_ui_for_loaded_img.py - Version: 6
+#this belongs in methods/update_ui_for_loaded_img.py - Version: 7
 # X-Seti - August13 2025 - IMG Factory 1.5 - UI Update for Loaded IMG - VISIBILITY FIXED
 
 """
@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import QTableWidgetItem
 # update_ui_for_loaded_img
 # integrate_update_ui_for_loaded_img
 
-def update_ui_for_loaded_img(main_window): #vers 6
+def update_ui_for_loaded_img(main_window): #vers 7
     """Update UI when IMG file is loaded - FIXED VERSION WITH VISIBILITY"""
     try:
         if not hasattr(main_window, 'current_img') or not main_window.current_img:
@@ -72,6 +72,10 @@ def update_ui_for_loaded_img(main_window): #vers 6
             if hasattr(main_window.gui_layout, 'update_img_info'):
                 main_window.gui_layout.update_img_info(f"IMG: {file_name}")
 
+        # Status bar IMG info (entries, version, free space / fragmentation)
+        if hasattr(main_window, 'update_img_status'):
+            main_window.update_img_status(img_file=main_window.current_img)
+
         # VISIBILITY FIXES - Force all GUI components to be visible after loading
         if hasattr(main_window, 'gui_layout'):
             # Force main splitter visibility
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October16 2026 - IMG Factory 1.5 - IMG Benchmark Launcher
+#this belongs in root /launch_img_benchmark.py - Version: 1
+"""
+import sys
+from pathlib import Path
+
+# Get the root directory (where this launcher is located)
+root_dir = Path(__file__).parent.resolve()
+
+# Add root to path so we can import from apps/
+if str(root_dir) not in sys.path:
+    sys.path.insert(0, str(root_dir))
+
+# Headless - table population is skipped without PyQt6
+if __name__ == "__main__":
+    from apps.benchmarks.img_benchmark import main
+    sys.exit(main())
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October16 2026 - IMG Factory 1.5 - IMG Command Line Launcher
+#this belongs in root /launch_img_cli.py - Version: 1
+"""
+import sys
+from pathlib import Path
+
+# Get the root directory (where this launcher is located)
+root_dir = Path(__file__).parent.resolve()
+
+# Add root to path so we can import from apps/
+if str(root_dir) not in sys.path:
+    sys.path.insert(0, str(root_dir))
+
+# Headless - no PyQt6 needed
+if __name__ == "__main__":
+    from apps.core.img_cli import main
+    sys.exit(main())
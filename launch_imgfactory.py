@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 X-Seti - November06 2025 - IMG Factory 1.5 - Root Launcher
-#this belongs in root /launch_imgfactory.py - version 1
+#this belongs in root /launch_imgfactory.py - version 2
 """
 import sys
 from pathlib import Path
@@ -16,6 +16,11 @@ if str(root_dir) not in sys.path:
 # Now import and run imgfactory from apps/components/Img_Factory/
 if __name__ == "__main__":
     try:
+        # --profile-startup: time imports from here on
+        from apps.debug.startup_profiler import startup_profiler
+        if startup_profiler.is_requested():
+            startup_profiler.start()
+
         # Import the main module
         from apps.components.Img_Factory import imgfactory
         